@@ -1,15 +1,20 @@
-import time
 from contextlib import asynccontextmanager
-from typing import Callable
 
 import redis.asyncio as aioredis
-from fastapi import FastAPI, Request, Response
-from prometheus_client import make_asgi_app
+from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from thirteen_backend import config, metrics
-from thirteen_backend.api import healthcheck, sessions, websocket
+from thirteen_backend.adapters import postgres
+from thirteen_backend.api import admin, healthcheck, sessions, websocket
+from thirteen_backend.api.middleware import RequestMetricsMiddleware
+from thirteen_backend.diagnostics.loop_monitor import LoopMonitor
+from thirteen_backend.diagnostics.process_metrics import ProcessMetricsReporter
 from thirteen_backend.logger import LOGGER
+from thirteen_backend.services.event_flusher import EventFlusher
+from thirteen_backend.services.game_event_retention import GameEventRetention
+from thirteen_backend.services.hand_result_writer import HandResultWriter
+from thirteen_backend.services.session_outbox_writer import SessionOutboxWriter
 
 logger = LOGGER
 
@@ -18,38 +23,52 @@ logger = LOGGER
 async def lifespan(asgi_app: FastAPI):
     asgi_app.state.redis_client = aioredis.from_url(config.CACHE_URL)
     await asgi_app.state.redis_client.ping()
+
+    background_tasks = [GameEventRetention(session_factory=postgres.get_session)]
+    if config.LOOP_MONITOR_ENABLED:
+        background_tasks.append(LoopMonitor())
+    if config.PROMETHEUS_MULTIPROC_DIR:
+        background_tasks.append(ProcessMetricsReporter())
+    if config.SESSION_WRITE_MODE == "outbox":
+        background_tasks.append(
+            SessionOutboxWriter(
+                redis_client=asgi_app.state.redis_client,
+                session_factory=postgres.get_session,
+            )
+        )
+    if config.EVENT_FLUSH_ENABLED:
+        background_tasks.extend(
+            consumer_cls(
+                redis_client=asgi_app.state.redis_client,
+                session_factory=postgres.get_session,
+            )
+            for consumer_cls in (EventFlusher, HandResultWriter)
+        )
+    for task in background_tasks:
+        task.start()
+
     yield
+
+    for task in background_tasks:
+        await task.stop()
     await asgi_app.state.redis_client.aclose()
 
 
 app = FastAPI(lifespan=lifespan)
-metrics_app = make_asgi_app()
+metrics_app = metrics.make_metrics_app()
 
 
 app.mount("/metrics", metrics_app)
 app.include_router(healthcheck.router)
+app.include_router(admin.router)
 app.include_router(sessions.router)
 app.include_router(websocket.router)
 
 
-@app.middleware("http")
-async def handle_request_metrics(request: Request, call_next: Callable) -> Response:
-    start_time = time.perf_counter()
-    response = await call_next(request)
-    request_duration = time.perf_counter() - start_time
-    metrics.track_request(
-        method=request.method,
-        path=request.url.path,
-        status=response.status_code,
-    )
-    metrics.track_request_duration(
-        method=request.method,
-        path=request.url.path,
-        status=response.status_code,
-        duration=request_duration,
-    )
-    return response
-
+app.add_middleware(
+    RequestMetricsMiddleware,
+    excluded_paths=("/metrics", "/__healthcheck", "/__ready", "/admin"),
+)
 
 app.add_middleware(
     CORSMiddleware,
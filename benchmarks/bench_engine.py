@@ -0,0 +1,212 @@
+"""Micro-benchmarks of the engine hot paths, with regression checks.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_engine [--positions 200] [--min-time 0.5]
+    python -m benchmarks.bench_engine --save-baseline bench.json   # on main
+    python -m benchmarks.bench_engine --baseline bench.json        # on a branch
+
+Cases (ops/sec, higher is better):
+
+* ``classify[<type>]``         – :func:`classify` on plays of every type
+* ``determine_<kind>``         – each ``Rules._determine_*`` generator on a
+                                 dealt 13-card hand
+* ``valid_plays[<pile>]``      – :meth:`Rules.get_valid_plays` against a
+                                 pile of every type (``open-first`` is the
+                                 3♦ lead)
+* ``from_state_dict``          – decoding a 4-player state, validated and
+                                 ``[trusted]``
+* ``to_full_dict`` / ``to_public_dict``
+* ``make_state_sync``          – STATE_SYNC serialisation
+
+Every case runs over the same positions, dealt from fixed seeds. With
+``--baseline`` the run exits non-zero when any case is more than
+``--max-regression`` (default 20%) slower than the saved numbers. Baselines
+are machine specific: save and compare on the same host.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Callable
+
+os.environ.setdefault("ENV", "test")
+
+from thirteen_backend.domain.card import Card  # noqa: E402
+from thirteen_backend.domain.classify import classify  # noqa: E402
+from thirteen_backend.domain.game import Game  # noqa: E402
+from thirteen_backend.services.websocket.websocket_utils import (  # noqa: E402
+    make_state_sync,
+)
+from thirteen_backend.types import Play, PlayType  # noqa: E402
+
+
+def _cards(*codes: str) -> list[Card]:
+    return [Card.from_image_code(code) for code in codes]
+
+
+# The weakest play of every pile type, used as the pile to beat.
+WEAKEST_PILES: dict[PlayType, list[Card]] = {
+    PlayType.SINGLE: _cards("3S"),
+    PlayType.PAIR: _cards("3S", "3C"),
+    PlayType.TRIPLET: _cards("3S", "3C", "3D"),
+    PlayType.SEQUENCE: _cards("3S", "4S", "5S"),
+    PlayType.DOUBLE_SEQUENCE: _cards("3S", "3C", "4S", "4C", "5S", "5C"),
+    PlayType.QUARTET: _cards("3S", "3C", "3D", "3H"),
+}
+
+DETERMINE_KINDS = (
+    "pairs",
+    "triplets",
+    "quartets",
+    "sequences",
+    "double_sequences",
+    "open",
+    "first_turn_open",
+)
+
+
+def _games(count: int, seed: int = 1234) -> list[Game]:
+    quiet = []
+    for i in range(count):
+        game = Game(seed=seed + i)
+        game.state.quiet = True
+        quiet.append(game)
+    return quiet
+
+
+def _with_pile(game: Game, pile: PlayType | str) -> tuple[Game, int]:
+    """Copy *game* with the current seat facing *pile*."""
+    game = Game.from_state_dict(game.to_full_dict())
+    game.state.quiet = True
+    seat = game.state.get_current_seat()
+    if pile == "open-first":
+        return game, seat
+    game.state.turn_number = 2
+    if pile == PlayType.OPEN:
+        game.state.current_play_type = PlayType.OPEN
+        game.state.last_play = None
+    else:
+        game.state.current_play_type = pile
+        game.state.last_play = Play(cards=WEAKEST_PILES[pile], play_type=pile)
+    return game, seat
+
+
+def _cases(games: list[Game]) -> dict[str, Callable[[], Any]]:
+    cases: dict[str, Callable[[], Any]] = {}
+
+    # classify --------------------------------------------------------
+    plays_by_type: dict[str, list[list[Card]]] = {}
+    for game in games:
+        seat = game.state.get_current_seat()
+        for play in game.rules._determine_open(hand=game.players[seat].hand):
+            plays_by_type.setdefault(play["play_type"], []).append(play["cards"])
+    for pile, cards in WEAKEST_PILES.items():
+        plays_by_type.setdefault(pile, []).append(cards)
+    for play_type, plays in sorted(plays_by_type.items()):
+        cases[f"classify[{play_type}]"] = lambda plays=plays: [
+            classify(cards) for cards in plays
+        ]
+
+    # Rules._determine_* ----------------------------------------------
+    hands = [(g.rules, g.players[g.state.get_current_seat()].hand) for g in games]
+    for kind in DETERMINE_KINDS:
+        cases[f"determine_{kind}"] = lambda kind=kind: [
+            getattr(rules, f"_determine_{kind}")(hand=hand) for rules, hand in hands
+        ]
+
+    # get_valid_plays per pile ----------------------------------------
+    for pile in ["open-first", PlayType.OPEN, *WEAKEST_PILES]:
+        positions = [_with_pile(game, pile) for game in games]
+        cases[f"valid_plays[{pile}]"] = lambda positions=positions: [
+            g.rules.get_valid_plays(player_idx=seat) for g, seat in positions
+        ]
+
+    # Serialisation -----------------------------------------------------
+    snapshots = [json.loads(json.dumps(g.to_full_dict())) for g in games]
+    cases["from_state_dict"] = lambda: [Game.from_state_dict(s) for s in snapshots]
+    cases["from_state_dict[trusted]"] = lambda: [
+        Game.from_state_dict(s, trusted=True) for s in snapshots
+    ]
+    cases["to_full_dict"] = lambda: [g.to_full_dict() for g in games]
+    cases["to_public_dict"] = lambda: [g.to_public_dict() for g in games]
+    cases["make_state_sync"] = lambda: [
+        make_state_sync(session_id=g.id, seq=1, game=g) for g in games
+    ]
+    return cases
+
+
+def _ops_per_second(fn: Callable[[], list], min_time: float) -> float:
+    """Best of three rounds of at least *min_time* seconds each."""
+    best = 0.0
+    for _ in range(3):
+        ops = 0
+        start = time.perf_counter()
+        while (elapsed := time.perf_counter() - start) < min_time:
+            ops += len(fn())
+        best = max(best, ops / elapsed)
+    return best
+
+
+def run(positions: int, min_time: float, only: str | None = None) -> dict[str, float]:
+    cases = _cases(_games(positions))
+    return {
+        name: _ops_per_second(fn, min_time)
+        for name, fn in cases.items()
+        if only is None or only in name
+    }
+
+
+def regressions(
+    results: dict[str, float], baseline: dict[str, float], max_regression: float
+) -> dict[str, float]:
+    """Return ``{case: change}`` for cases slower than the allowed threshold."""
+    slower = {}
+    for name, ops in results.items():
+        if name in baseline:
+            change = ops / baseline[name] - 1
+            if change < -max_regression:
+                slower[name] = change
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--positions", type=int, default=200)
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--only", help="run cases whose name contains this")
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--baseline", metavar="PATH")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = run(args.positions, args.min_time, args.only)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    for name, ops in results.items():
+        line = f"{name:<34} {ops:14,.0f} ops/s"
+        if name in baseline:
+            line += f"  ({ops / baseline[name] - 1:+7.1%} vs baseline)"
+        print(line)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    slower = regressions(results, baseline, args.max_regression)
+    if slower:
+        print(
+            f"\n{len(slower)} case(s) regressed more than {args.max_regression:.0%}: "
+            + ", ".join(sorted(slower)),
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Per-decision cost of bot move selection: legacy ``print`` vs. tracer.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_tracing [--decisions 2000]
+
+Three variants are timed over the same reproducible game positions:
+
+* ``print``           – the previous behaviour (hand, pile and play lists
+                        written to stdout on every decision; stdout is sent to
+                        ``os.devnull`` so only formatting + write cost counts)
+* ``trace-disabled``  – current code with tracing off (the default)
+* ``trace-sampled``   – current code with every decision traced
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import random
+import time
+
+os.environ.setdefault("ENV", "test")
+
+from thirteen_backend.domain.game import Game  # noqa: E402
+from thirteen_backend.services.bot.bot_handlers import (  # noqa: E402
+    _choose_bot_move,
+    _weigh_plays,
+)
+from thirteen_backend.tracing import TRACER  # noqa: E402
+
+
+def _positions(count: int, seed: int = 1234) -> list[tuple[Game, int]]:
+    """Build *count* (game, seat) positions by playing random legal moves."""
+    rng = random.Random(seed)
+    positions: list[tuple[Game, int]] = []
+    while len(positions) < count:
+        random.seed(rng.random())
+        game = Game()
+        for _ in range(rng.randrange(0, 12)):
+            seat = game.state.get_current_seat()
+            plays = game.rules.get_valid_plays(player_idx=seat)
+            if plays:
+                game.apply_play(player_idx=seat, play=rng.choice(plays))
+            else:
+                game.apply_pass(player_idx=seat)
+        positions.append((game, game.state.get_current_seat()))
+    return positions
+
+
+async def _legacy_choose_bot_move(*, engine: Game, bot_idx: int):
+    """Bot decision as it was before tracing replaced the ``print`` calls."""
+    state = engine.state
+    print(f"hand: {state.players_state[bot_idx].hand}")
+    print(f"current_play_type: {state.current_play_type}")
+    print(f"last_play: {state.last_play}")
+    valid_plays = engine.rules.get_valid_plays(player_idx=bot_idx)
+    if not valid_plays:
+        return []
+    print(f"valid_plays: {valid_plays}")
+    weighted_plays = await _weigh_plays(valid_plays=valid_plays)
+    if not weighted_plays:
+        return []
+    print(f"weighted_plays: {weighted_plays}")
+    return weighted_plays[0]
+
+
+async def _time(choose, positions: list[tuple[Game, int]]) -> float:
+    start = time.perf_counter()
+    for game, seat in positions:
+        await choose(engine=game, bot_idx=seat)
+    return (time.perf_counter() - start) / len(positions)
+
+
+async def _run(decisions: int) -> dict[str, float]:
+    positions = _positions(decisions)
+    results: dict[str, float] = {}
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results["print"] = await _time(_legacy_choose_bot_move, positions)
+
+    TRACER.configure(sample_rate=0.0, sessions=())
+    results["trace-disabled"] = await _time(_choose_bot_move, positions)
+
+    TRACER.configure(sample_rate=1.0, sessions=())
+    results["trace-sampled"] = await _time(_choose_bot_move, positions)
+    TRACER.configure(sample_rate=0.0, sessions=())
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decisions", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args.decisions))
+    baseline = results["print"]
+    for name, seconds in results.items():
+        print(
+            f"{name:<16} {seconds * 1e6:9.1f} µs/decision"
+            f"  ({baseline / seconds:4.2f}x vs print)"
+        )
+
+
+if __name__ == "__main__":
+    main()
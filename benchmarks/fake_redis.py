@@ -0,0 +1,133 @@
+"""In-memory stand-in for the ``redis.asyncio`` client used by gameplay.
+
+Implements just the commands the request and WebSocket paths issue (state
+and sequencer keys, session event streams, ``MULTI`` pipelines), with the
+same ``bytes`` return types as a real client, so the load generator can run
+the app in-process without a Redis server. TTLs and stream trimming are
+ignored; background consumers (``XREADGROUP`` & co.) are not supported.
+"""
+
+from typing import Any
+
+
+def _b(value: Any) -> bytes:
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+def _stream_id(entry_id: Any) -> tuple[int, int]:
+    entry_id = entry_id.decode() if isinstance(entry_id, bytes) else str(entry_id)
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.sorted_sets: dict[str, dict[bytes, float]] = {}
+        self.streams: dict[str, list[tuple[tuple[int, int], dict]]] = {}
+
+    async def ping(self) -> bool:
+        return True
+
+    async def aclose(self) -> None:
+        return None
+
+    # Strings -----------------------------------------------------------
+    async def get(self, name: str) -> bytes | None:
+        return self.values.get(name)
+
+    async def set(self, name: str, value: Any) -> bool:
+        self.values[name] = _b(value)
+        return True
+
+    async def setex(self, name: str, time: int, value: Any) -> bool:
+        return await self.set(name, value)
+
+    async def incr(self, name: str, amount: int = 1) -> int:
+        value = int(self.values.get(name, b"0")) + amount
+        self.values[name] = _b(value)
+        return value
+
+    async def expire(self, name: str, time: int) -> bool:
+        return name in self.values or name in self.streams or name in self.sorted_sets
+
+    # Sorted sets ---------------------------------------------------------
+    async def zadd(self, name: str, mapping: dict) -> int:
+        members = self.sorted_sets.setdefault(name, {})
+        before = len(members)
+        members.update({_b(k): float(v) for k, v in mapping.items()})
+        return len(members) - before
+
+    async def zcard(self, name: str) -> int:
+        return len(self.sorted_sets.get(name, ()))
+
+    # Streams -------------------------------------------------------------
+    async def xadd(self, name: str, fields: dict, id: Any = "*", **_trim: Any) -> bytes:
+        entries = self.streams.setdefault(name, [])
+        if id == "*":
+            last = entries[-1][0] if entries else (0, 0)
+            entry_id = (last[0], last[1] + 1)
+        else:
+            entry_id = _stream_id(id)
+        entries.append((entry_id, {_b(k): _b(v) for k, v in fields.items()}))
+        return _b(f"{entry_id[0]}-{entry_id[1]}")
+
+    async def xrange(
+        self, name: str, min: Any = "-", max: Any = "+", count: int | None = None
+    ) -> list:
+        return self._range(name, min, max, count, reverse=False)
+
+    async def xrevrange(
+        self, name: str, max: Any = "+", min: Any = "-", count: int | None = None
+    ) -> list:
+        return self._range(name, min, max, count, reverse=True)
+
+    def _range(self, name, min, max, count, reverse) -> list:
+        low = (0, 0) if min == "-" else _stream_id(min)
+        high = None if max == "+" else _stream_id(max)
+        entries = [
+            (_b(f"{eid[0]}-{eid[1]}"), fields)
+            for eid, fields in self.streams.get(name, [])
+            if eid >= low and (high is None or eid <= high)
+        ]
+        if reverse:
+            entries.reverse()
+        return entries[:count] if count is not None else entries
+
+    # Pipelines -------------------------------------------------------------
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them back to back on :meth:`execute` (the
+    fake is single-threaded, so that is as atomic as ``MULTI``)."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self._commands.clear()
+
+    def __getattr__(self, command: str):
+        if not hasattr(self._redis, command):
+            raise AttributeError(command)
+
+        def queue(*args: Any, **kwargs: Any) -> "FakePipeline":
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self, raise_on_error: bool = True) -> list:
+        commands, self._commands = self._commands, []
+        return [
+            await getattr(self._redis, command)(*args, **kwargs)
+            for command, args, kwargs in commands
+        ]
@@ -0,0 +1,336 @@
+"""End-to-end WebSocket load generator.
+
+Run from the repository root::
+
+    # In-process: the FastAPI app with an in-memory Redis, no servers needed
+    python -m benchmarks.load_ws --clients 1000 --moves 5
+
+    # Against a running stack (requires the ``websockets`` package)
+    python -m benchmarks.load_ws --url http://localhost:8000 --clients 200
+
+Every client creates a session with ``POST /sessions``, opens
+``/ws/{session_id}/{player_id}`` and plays legal moves as the human seat:
+whenever a STATE_SYNC carries ``valid_plays`` it sends a random one of them
+(or PASS when there is none) until it has made ``--moves`` moves. Clients
+start over ``--ramp-up`` seconds and all run concurrently.
+
+Reported percentiles:
+
+* ``create``    – ``POST /sessions`` round trip (includes the bots' opening
+                  moves when a bot leads)
+* ``connect``   – WebSocket open until the initial STATE_SYNC arrives
+* ``move_ack``  – PLAY/PASS sent until the STATE_SYNC of that move arrives
+* ``broadcast`` – server ``ts`` of a STATE_SYNC until the client receives it
+                  (meaningful in-process or with synchronised clocks)
+
+In-process runs use ``SESSION_WRITE_MODE=outbox`` so no database is needed,
+and bots keep their regular pacing between moves.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+# ---------------------------------------------------------------------------
+# Transports
+# ---------------------------------------------------------------------------
+
+
+class InProcessWebSocket:
+    """Drives an ASGI app's WebSocket endpoint directly through its
+    ``receive``/``send`` callables, without sockets or a server."""
+
+    def __init__(self, app: Callable, path: str, client_port: int) -> None:
+        self._app = app
+        self._path = path
+        self._port = client_port
+        self._to_app: asyncio.Queue = asyncio.Queue()
+        self._to_client: asyncio.Queue = asyncio.Queue()
+        self._accepted = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": self._path,
+            "raw_path": self._path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "subprotocols": [],
+            # The manager keys connections by client address.
+            "client": ("127.0.0.1", self._port),
+            "server": ("loadtest", 80),
+        }
+        await self._to_app.put({"type": "websocket.connect"})
+        self._task = asyncio.create_task(
+            self._app(scope, self._to_app.get, self._from_app)
+        )
+        accepted = asyncio.create_task(self._accepted.wait())
+        await asyncio.wait({accepted, self._task}, return_when="FIRST_COMPLETED")
+        if not self._accepted.is_set():
+            accepted.cancel()
+            raise ConnectionError(f"WebSocket {self._path} was not accepted")
+
+    async def _from_app(self, message: dict) -> None:
+        if message["type"] == "websocket.accept":
+            self._accepted.set()
+        elif message["type"] == "websocket.send":
+            await self._to_client.put(message.get("text") or message.get("bytes"))
+        elif message["type"] == "websocket.close":
+            await self._to_client.put(None)
+
+    async def send(self, text: str) -> None:
+        await self._to_app.put({"type": "websocket.receive", "text": text})
+
+    async def recv(self) -> str | None:
+        """Next message, or ``None`` once the server closed the socket."""
+        return await self._to_client.get()
+
+    async def close(self) -> None:
+        await self._to_app.put({"type": "websocket.disconnect", "code": 1000})
+        if self._task is not None:
+            await asyncio.wait({self._task}, timeout=5)
+
+
+class RemoteWebSocket:
+    def __init__(self, url: str) -> None:
+        self._url = url
+        self._ws = None
+
+    async def connect(self) -> None:
+        try:
+            import websockets
+        except ModuleNotFoundError as exc:  # pragma: no cover
+            raise SystemExit("--url mode needs the 'websockets' package") from exc
+        self._ws = await websockets.connect(self._url, max_size=None)
+
+    async def send(self, text: str) -> None:
+        await self._ws.send(text)
+
+    async def recv(self) -> str | None:
+        import websockets
+
+        try:
+            return await self._ws.recv()
+        except websockets.ConnectionClosed:
+            return None
+
+    async def close(self) -> None:
+        await self._ws.close()
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = {
+            "create": [],
+            "connect": [],
+            "move_ack": [],
+            "broadcast": [],
+        }
+        self.moves = 0
+        self.errors: dict[str, int] = {}
+
+    def error(self, kind: str) -> None:
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+
+def _broadcast_lag(message: dict) -> float:
+    sent = datetime.fromisoformat(message["ts"])
+    return (datetime.now(timezone.utc) - sent).total_seconds()
+
+
+async def run_client(
+    *,
+    http: Any,
+    open_ws: Callable[[str], Any],
+    stats: Stats,
+    moves: int,
+    idle_timeout: float,
+    rng: random.Random,
+) -> None:
+    start = time.perf_counter()
+    response = await http.post(
+        "/sessions", json={"times_shuffled": 1, "deck_count": 1, "players_count": 4}
+    )
+    if response.status_code != 201:
+        stats.error(f"create_{response.status_code}")
+        return
+    stats.latencies["create"].append(time.perf_counter() - start)
+    created = response.json()["data"]
+
+    ws = open_ws(f"/ws/{created['session_id']}/{created['player_id']}")
+    start = time.perf_counter()
+    try:
+        await ws.connect()
+    except Exception:
+        stats.error("connect")
+        return
+
+    sent_at: float | None = None
+    seq = -1
+    first = True
+    made = 0
+    try:
+        while made < moves:
+            try:
+                raw = await asyncio.wait_for(ws.recv(), timeout=idle_timeout)
+            except asyncio.TimeoutError:
+                stats.error("stalled")  # no message although a move was due
+                return
+            if raw is None:
+                stats.error("closed")
+                return
+            message = json.loads(raw)
+            if message.get("type") != "STATE_SYNC":
+                stats.error(f"message_{message.get('type')}")
+                continue
+            if first:
+                stats.latencies["connect"].append(time.perf_counter() - start)
+                first = False
+            else:
+                stats.latencies["broadcast"].append(_broadcast_lag(message))
+            if sent_at is not None and message["seq"] > seq:
+                stats.latencies["move_ack"].append(time.perf_counter() - sent_at)
+                sent_at = None
+            seq = max(seq, message["seq"])
+
+            valid_plays = message.get("valid_plays")
+            if valid_plays is None or sent_at is not None:
+                continue  # not our turn, or our move is in flight
+            if valid_plays:
+                _play_type, codes = rng.choice(valid_plays)
+                outgoing = {
+                    "type": "PLAY",
+                    "payload": [{"rank": c[:-1], "suit": c[-1:]} for c in codes],
+                }
+            else:
+                outgoing = {"type": "PASS"}
+            sent_at = time.perf_counter()
+            await ws.send(json.dumps(outgoing))
+            made += 1
+            stats.moves += 1
+    finally:
+        await ws.close()
+
+
+# ---------------------------------------------------------------------------
+# Setup
+# ---------------------------------------------------------------------------
+
+
+def _in_process_app():
+    os.environ.setdefault("ENV", "test")
+    os.environ["SESSION_WRITE_MODE"] = "outbox"
+    for key, value in {
+        "BACKEND_DB_DIALECT": "postgresql",
+        "BACKEND_DB_DRIVER": "asyncpg",
+        "BACKEND_DB_USER": "loadtest",
+        "BACKEND_DB_HOST": "localhost",
+        "BACKEND_DB_PORT": "5432",
+        "BACKEND_DB_NAME": "loadtest",
+    }.items():
+        os.environ.setdefault(key, value)
+
+    from app import app
+    from benchmarks.fake_redis import FakeRedis
+
+    # The lifespan (Redis connection, background consumers) is not run.
+    app.state.redis_client = FakeRedis()
+    return app
+
+
+async def _run(args: argparse.Namespace) -> Stats:
+    import httpx
+
+    if args.url:
+        http = httpx.AsyncClient(base_url=args.url, timeout=30)
+        ws_base = args.url.replace("http", "ws", 1)
+
+        def open_ws(path: str) -> RemoteWebSocket:
+            return RemoteWebSocket(ws_base + path)
+
+    else:
+        app = _in_process_app()
+        http = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://loadtest"
+        )
+        ports = iter(range(1, 1 << 30))
+
+        def open_ws(path: str) -> InProcessWebSocket:
+            return InProcessWebSocket(app, path, client_port=next(ports))
+
+    stats = Stats()
+    rng = random.Random(args.seed)
+
+    async def delayed(i: int) -> None:
+        await asyncio.sleep(args.ramp_up * i / max(args.clients, 1))
+        try:
+            await run_client(
+                http=http,
+                open_ws=open_ws,
+                stats=stats,
+                moves=args.moves,
+                idle_timeout=args.idle_timeout,
+                rng=random.Random(rng.random()),
+            )
+        except Exception as exc:
+            stats.error(type(exc).__name__)
+
+    async with http:
+        await asyncio.gather(*(delayed(i) for i in range(args.clients)))
+    return stats
+
+
+def _percentiles(values: list[float]) -> str:
+    if not values:
+        return "no samples"
+    values = sorted(values)
+    cuts = (
+        statistics.quantiles(values, n=100, method="inclusive")
+        if len(values) > 1
+        else values * 99
+    )
+    return (
+        f"n={len(values):<7} p50={cuts[49] * 1000:8.1f}ms "
+        f"p90={cuts[89] * 1000:8.1f}ms p99={cuts[98] * 1000:8.1f}ms "
+        f"max={values[-1] * 1000:8.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="base URL of a running server")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--moves", type=int, default=5, help="moves per client")
+    parser.add_argument("--ramp-up", type=float, default=5.0)
+    parser.add_argument("--idle-timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = asyncio.run(_run(args))
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.clients} clients, {stats.moves} moves in {elapsed:.1f}s")
+    for name, values in stats.latencies.items():
+        print(f"{name:<10} {_percentiles(values)}")
+    if stats.errors:
+        print("errors    ", ", ".join(f"{k}={v}" for k, v in stats.errors.items()))
+
+
+if __name__ == "__main__":
+    main()
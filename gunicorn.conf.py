@@ -0,0 +1,26 @@
+"""Gunicorn settings for production (``bin/entrypoint.sh``).
+
+Enables prometheus_client multiprocess mode so ``/metrics`` reports the sum
+over all workers rather than whichever worker served the scrape.
+"""
+
+import os
+import shutil
+
+# Must be in the environment before any worker imports prometheus_client.
+multiproc_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", "/tmp/thirteen-prometheus"
+)
+
+
+def on_starting(server):
+    # Files left by a previous run would be aggregated as if still live.
+    shutil.rmtree(multiproc_dir, ignore_errors=True)
+    os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    # Drop the dead worker's live gauges; its counters keep being summed.
+    multiprocess.mark_process_dead(worker.pid, multiproc_dir)
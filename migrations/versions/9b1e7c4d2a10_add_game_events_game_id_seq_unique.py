@@ -0,0 +1,29 @@
+"""add_game_events_game_id_seq_unique
+
+Revision ID: 9b1e7c4d2a10
+Revises: 332146ba8bf3
+Create Date: 2026-10-19 10:12:04.118362
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b1e7c4d2a10"
+down_revision: Union[str, Sequence[str], None] = "332146ba8bf3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_unique_constraint(
+        "uq_game_events_game_id_seq", "game_events", ["game_id", "seq"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_game_events_game_id_seq", "game_events", type_="unique")
@@ -0,0 +1,47 @@
+"""create_game_hands_table
+
+Revision ID: c3a8f2d51e07
+Revises: 9b1e7c4d2a10
+Create Date: 2026-10-19 14:03:27.511904
+
+"""
+
+from typing import Sequence, Union
+from uuid import uuid4
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a8f2d51e07"
+down_revision: Union[str, Sequence[str], None] = "9b1e7c4d2a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "game_hands",
+        sa.Column("id", sa.UUID, primary_key=True, default=uuid4),
+        sa.Column(
+            "game_id",
+            sa.UUID,
+            sa.ForeignKey("game_sessions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("hand_number", sa.Integer, nullable=False),
+        sa.Column("placements", postgresql.JSONB, nullable=False),
+        sa.Column("turns", sa.Integer, nullable=False),
+        sa.Column("bombs", postgresql.JSONB, nullable=False),
+        sa.Column("ended_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "game_id", "hand_number", name="uq_game_hands_game_id_hand_number"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("game_hands")
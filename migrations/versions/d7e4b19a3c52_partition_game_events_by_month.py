@@ -0,0 +1,102 @@
+"""partition_game_events_by_month
+
+Revision ID: d7e4b19a3c52
+Revises: c3a8f2d51e07
+Create Date: 2026-10-19 15:41:09.207315
+
+Rebuilds ``game_events`` as a table range-partitioned by month on ``ts``
+with a ``JSONB`` payload. PostgreSQL requires every unique key of a
+partitioned table to contain the partition key, so the ``(game_id, seq)``
+constraint added in ``9b1e7c4d2a10`` becomes ``(game_id, seq, ts)`` and the
+primary key becomes ``(id, ts)``. Existing rows are copied into partitions
+covering their months; later partitions are created by
+``thirteen_backend.services.game_event_retention``.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7e4b19a3c52"
+down_revision: Union[str, Sequence[str], None] = "c3a8f2d51e07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = "id, seq, turn, type, payload, ts, game_id"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.rename_table("game_events", "game_events_unpartitioned")
+    op.execute("""
+        CREATE TABLE game_events (
+            id UUID NOT NULL,
+            seq INTEGER NOT NULL,
+            turn INTEGER NOT NULL,
+            type VARCHAR(20) NOT NULL,
+            payload JSONB,
+            ts TIMESTAMP WITH TIME ZONE NOT NULL,
+            game_id UUID NOT NULL
+                REFERENCES game_sessions (id) ON DELETE CASCADE,
+            CONSTRAINT pk_game_events PRIMARY KEY (id, ts),
+            CONSTRAINT uq_game_events_game_id_seq_ts UNIQUE (game_id, seq, ts)
+        ) PARTITION BY RANGE (ts)
+        """)
+    # One partition per month from the oldest stored event through two
+    # months ahead.
+    op.execute("""
+        DO $$
+        DECLARE
+            month timestamptz := date_trunc(
+                'month',
+                coalesce((SELECT min(ts) FROM game_events_unpartitioned), now()),
+                'UTC'
+            );
+            last_month timestamptz := date_trunc('month', now(), 'UTC')
+                + interval '2 months';
+        BEGIN
+            WHILE month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF game_events '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'game_events_p' || to_char(month AT TIME ZONE 'UTC', 'YYYYMM'),
+                    month,
+                    month + interval '1 month'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END
+        $$
+        """)
+    op.execute(
+        f"INSERT INTO game_events ({_COLUMNS}) "
+        f"SELECT id, seq, turn, type, payload::jsonb, ts, game_id "
+        f"FROM game_events_unpartitioned"
+    )
+    op.drop_table("game_events_unpartitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.rename_table("game_events", "game_events_partitioned")
+    op.execute("""
+        CREATE TABLE game_events (
+            id UUID PRIMARY KEY,
+            seq INTEGER NOT NULL,
+            turn INTEGER NOT NULL,
+            type VARCHAR(20) NOT NULL,
+            payload JSON,
+            ts TIMESTAMP WITH TIME ZONE NOT NULL,
+            game_id UUID NOT NULL
+                REFERENCES game_sessions (id) ON DELETE CASCADE,
+            CONSTRAINT uq_game_events_game_id_seq UNIQUE (game_id, seq)
+        )
+        """)
+    op.execute(
+        f"INSERT INTO game_events ({_COLUMNS}) "
+        f"SELECT id, seq, turn, type, payload::json, ts, game_id "
+        f"FROM game_events_partitioned ON CONFLICT DO NOTHING"
+    )
+    op.drop_table("game_events_partitioned")
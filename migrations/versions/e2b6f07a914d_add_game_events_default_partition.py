@@ -0,0 +1,41 @@
+"""add_game_events_default_partition
+
+Revision ID: e2b6f07a914d
+Revises: d7e4b19a3c52
+Create Date: 2026-10-19 18:12:44.531870
+
+Adds ``game_events_default`` as the DEFAULT partition of ``game_events``.
+Without it an event whose ``ts`` falls in a month with no partition (the
+maintenance job has not run for longer than ``GAME_EVENT_PARTITIONS_AHEAD``
+months, or a late flush of a month already dropped) fails to insert and
+blocks the flusher's whole batch. Such rows now land in the default
+partition; ``thirteen_backend.services.game_event_retention`` moves them
+into their month's partition when it creates it and deletes the ones older
+than the retention window.
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b6f07a914d"
+down_revision: Union[str, Sequence[str], None] = "d7e4b19a3c52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE TABLE game_events_default PARTITION OF game_events DEFAULT")
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Rows still held by the default partition belong to no monthly partition
+    and are dropped with it.
+    """
+    op.execute("ALTER TABLE game_events DETACH PARTITION game_events_default")
+    op.execute("DROP TABLE game_events_default")
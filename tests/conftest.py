@@ -1,3 +1,4 @@
+import importlib.machinery
 import json as _std_json
 import os
 import sys
@@ -28,6 +29,8 @@ if "orjson" not in sys.modules:
 
     orjson_stub.dumps = _dumps  # type: ignore
     orjson_stub.loads = _loads  # type: ignore
+    # importlib.util.find_spec("orjson") (used by python-json-logger) needs a spec
+    orjson_stub.__spec__ = importlib.machinery.ModuleSpec("orjson", None)
     sys.modules["orjson"] = orjson_stub
 
 # ---------------------------------------------------------------------------
@@ -52,7 +55,11 @@ if "fastapi" not in sys.modules:
     class _WebSocketDisconnect(Exception):
         pass
 
+    class _Request:  # pylint:disable=too-few-public-methods
+        pass
+
     fastapi_stub.WebSocket = _WebSocket  # type: ignore
+    fastapi_stub.Request = _Request  # type: ignore
     fastapi_stub.WebSocketDisconnect = _WebSocketDisconnect  # type: ignore
 
     # Minimal APIRouter stand-in so that import time side-effects don't explode
@@ -56,3 +56,21 @@ def test_image_code(suit, rank, expected):
 def test_invalid_card_raises(suit, rank):
     with pytest.raises(ValueError):
         Card(suit=suit, rank=rank)
+
+
+def test_to_dict_returns_an_independent_copy():
+    card = Card(suit="H", rank="10")
+
+    assert card.to_dict() == {
+        "rank": "10",
+        "rank_string": "10",
+        "suit": "H",
+        "suit_string": "Hearts",
+        "full_name": "10 of Hearts",
+        "comparable_value": card.comparable_value,
+        "card_url": "10H",
+    }
+    # Callers get their own copy, so a mutation cannot leak to other games
+    card.to_dict()["rank"] = "J"
+    assert card.to_dict()["rank"] == "10"
+    assert card.to_dict() is not card.to_dict()
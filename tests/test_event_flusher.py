@@ -0,0 +1,356 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ResponseError
+from sqlalchemy.exc import IntegrityError
+
+from thirteen_backend.services import event_flusher as flusher_module
+from thirteen_backend.services import event_stream_consumer as consumer_module
+from thirteen_backend.services.event_flusher import EventFlusher
+
+
+class FakeEventStreams:
+    """In-memory stand-in for the Redis stream consumer-group helpers."""
+
+    def __init__(self, events_by_game: dict[str, list[dict]]):
+        self.streams = {
+            f"session:{game_id}:event-stream": [(f"{e['seq']}-1", e) for e in events]
+            for game_id, events in events_by_game.items()
+        }
+        # group -> stream -> index of the next undelivered entry
+        self.cursors: dict[str, dict[str, int]] = {}
+        # group -> stream -> {entry_id: (consumer, event)}
+        self.pending: dict[str, dict[str, dict]] = {}
+        self.deleted: set[str] = set()
+        self.group_creations = 0
+
+    async def iter_streams(self, *, redis_client, since=0, chunk_size=100):
+        keys = list(self.streams)
+        for start in range(0, len(keys), chunk_size):
+            yield keys[start : start + chunk_size]
+
+    async def count_streams(self, *, redis_client):
+        return len(self.streams)
+
+    async def ensure_group(self, *, redis_client, group, stream_keys, mkstream=False):
+        cursors = self.cursors.setdefault(group, {})
+        self.group_creations += len(stream_keys)
+        for key in stream_keys:
+            cursors.setdefault(key, 0)
+            self.pending.setdefault(group, {}).setdefault(key, {})
+        return stream_keys
+
+    async def read_group(self, *, redis_client, group, consumer, stream_keys, count):
+        result = {}
+        for key in stream_keys:
+            start = self.cursors[group][key]
+            batch = self.streams[key][start : start + count]
+            if not batch:
+                continue
+            count -= len(batch)
+            self.cursors[group][key] = start + len(batch)
+            for entry_id, event in batch:
+                self.pending[group][key][entry_id] = (consumer, event)
+            result[key] = batch
+            if count <= 0:
+                break
+        return result
+
+    async def claim_stale(
+        self, *, redis_client, group, consumer, stream_keys, min_idle_ms, count
+    ):
+        result = {}
+        for key in stream_keys:
+            claimed = []
+            for entry_id, (_, event) in self.pending[group][key].items():
+                claimed.append((entry_id, event))
+                self.pending[group][key][entry_id] = (consumer, event)
+            if claimed:
+                result[key] = claimed[:count]
+        return result
+
+    async def unregister_idle(self, *, redis_client, before):
+        return 0
+
+    async def ack(self, *, redis_client, group, entry_ids, delete=False):
+        for key, ids in entry_ids.items():
+            for entry_id in ids:
+                self.pending[group][key].pop(entry_id, None)
+                if delete:
+                    self.deleted.add(entry_id)
+
+    def unacked(self, group: str) -> int:
+        return sum(len(p) for p in self.pending.get(group, {}).values())
+
+
+class FakeDbSession:
+    def __init__(self, store: list, fail: bool = False):
+        self.store = store
+        self.fail = fail
+        self.pending: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        raise AssertionError("bulk insert helper should be patched")
+
+    async def commit(self):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.store.extend(self.pending)
+
+
+class FakeDriverError(Exception):
+    def __init__(self, sqlstate: str):
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+def integrity_error(sqlstate: str = "23503") -> IntegrityError:
+    """IntegrityError as raised for the driver error *sqlstate* (default: a
+    foreign-key violation)."""
+    return IntegrityError("INSERT", {}, FakeDriverError(sqlstate))
+
+
+def _event(game_id: str, seq: int) -> dict:
+    return {
+        "id": str(uuid4()),
+        "seq": seq,
+        "turn": seq,
+        "type": "PLAY",
+        "payload": None,
+        "ts": datetime.now(timezone.utc).isoformat(),
+        "game_id": game_id,
+    }
+
+
+@pytest.fixture()
+def streams(monkeypatch):
+    games = {str(uuid4()): [], str(uuid4()): []}
+    for game_id in games:
+        games[game_id].extend(_event(game_id, seq) for seq in range(3))
+    fake = FakeEventStreams(games)
+
+    monkeypatch.setattr(consumer_module, "iter_event_streams", fake.iter_streams)
+    monkeypatch.setattr(consumer_module, "ensure_event_stream_group", fake.ensure_group)
+    monkeypatch.setattr(consumer_module, "read_event_stream_group", fake.read_group)
+    monkeypatch.setattr(
+        consumer_module, "claim_stale_event_stream_entries", fake.claim_stale
+    )
+    monkeypatch.setattr(consumer_module, "ack_event_stream", fake.ack)
+    monkeypatch.setattr(flusher_module, "count_event_streams", fake.count_streams)
+    monkeypatch.setattr(
+        flusher_module, "unregister_idle_event_streams", fake.unregister_idle
+    )
+
+    async def bulk_insert(*, db_session, rows):
+        db_session.pending.extend(rows)
+
+    monkeypatch.setattr(
+        flusher_module.game_event_repository, "bulk_insert_game_events", bulk_insert
+    )
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_consume_once_writes_batch_then_acks(streams):
+    stored: list = []
+    flusher = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession(stored),
+        batch_size=4,
+    )
+
+    assert await flusher.consume_once() == 4
+    assert len(stored) == 4
+    assert streams.unacked(EventFlusher.group) == 0
+    assert not streams.deleted  # other groups still read the session streams
+
+    assert await flusher.consume_once() == 2
+    assert sorted(r["seq"] for r in stored) == [0, 0, 1, 1, 2, 2]
+    assert await flusher.consume_once() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_leaves_entries_pending(streams):
+    flusher = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession([], fail=True),
+        batch_size=10,
+    )
+
+    with pytest.raises(RuntimeError):
+        await flusher.consume_once()
+
+    assert streams.unacked(EventFlusher.group) == 6
+
+
+@pytest.mark.asyncio
+async def test_stale_pending_entries_are_reclaimed(streams):
+    crashed = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession([], fail=True),
+        batch_size=10,
+    )
+    with pytest.raises(RuntimeError):
+        await crashed.consume_once()
+
+    stored: list = []
+    survivor = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession(stored),
+        batch_size=10,
+    )
+    survivor._last_reclaim = float("-inf")
+
+    assert await survivor.consume_once() == 6
+    assert sorted(r["seq"] for r in stored) == [0, 0, 1, 1, 2, 2]
+    assert streams.unacked(EventFlusher.group) == 0
+
+
+@pytest.mark.asyncio
+async def test_groups_consume_independently(streams):
+    class AnalyticsConsumer(consumer_module.EventStreamConsumer):
+        group = "analytics"
+
+        def __init__(self):
+            super().__init__(redis_client=None, batch_size=10)
+            self.seen: list = []
+
+        async def handle(self, events):
+            self.seen.extend(events)
+
+    stored: list = []
+    flusher = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession(stored),
+        batch_size=10,
+    )
+    analytics = AnalyticsConsumer()
+
+    assert await flusher.consume_once() == 6
+    assert await analytics.consume_once() == 6
+    assert len(stored) == len(analytics.seen) == 6
+
+
+@pytest.fixture()
+def unstored_session(streams, monkeypatch):
+    """Make every session but the first missing from Postgres."""
+    known_game = next(iter(streams.streams)).split(":")[1]
+
+    async def bulk_insert(*, db_session, rows):
+        if any(str(r["game_id"]) != known_game for r in rows):
+            raise integrity_error()
+        db_session.pending.extend(rows)
+
+    async def existing_ids(*, db_session, ids):
+        return {i for i in ids if str(i) == known_game}
+
+    monkeypatch.setattr(
+        flusher_module.game_event_repository, "bulk_insert_game_events", bulk_insert
+    )
+    monkeypatch.setattr(
+        flusher_module.sessions_repository, "get_existing_session_ids", existing_ids
+    )
+    return known_game
+
+
+@pytest.mark.asyncio
+async def test_events_of_unstored_sessions_are_deferred(streams, unstored_session):
+    stored: list = []
+    flusher = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession(stored),
+        batch_size=10,
+    )
+
+    assert await flusher.consume_once() == 3
+    assert {str(r["game_id"]) for r in stored} == {unstored_session}
+    assert streams.unacked(EventFlusher.group) == 3
+
+
+@pytest.mark.asyncio
+async def test_deferred_events_are_dropped_once_too_old(streams, unstored_session):
+    stored: list = []
+    flusher = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession(stored),
+        batch_size=10,
+    )
+    flusher._defer_max_age = 0
+
+    assert await flusher.consume_once() == 6
+    assert {str(r["game_id"]) for r in stored} == {unstored_session}
+    assert streams.unacked(EventFlusher.group) == 0
+
+
+@pytest.mark.asyncio
+async def test_other_integrity_errors_leave_batch_pending(streams, monkeypatch):
+    async def bulk_insert(*, db_session, rows):
+        raise integrity_error("23502")  # not_null_violation
+
+    monkeypatch.setattr(
+        flusher_module.game_event_repository, "bulk_insert_game_events", bulk_insert
+    )
+    flusher = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession([]),
+        batch_size=10,
+    )
+
+    with pytest.raises(IntegrityError):
+        await flusher.consume_once()
+    assert streams.unacked(EventFlusher.group) == 6
+
+
+@pytest.mark.asyncio
+async def test_groups_are_created_once_and_rounds_scan_recent_streams(
+    streams, monkeypatch
+):
+    scans: list = []
+    iter_streams = streams.iter_streams
+
+    def recording_iter(*, redis_client, since=0, chunk_size=100):
+        scans.append(since)
+        return iter_streams(redis_client=redis_client, since=since)
+
+    monkeypatch.setattr(consumer_module, "iter_event_streams", recording_iter)
+    flusher = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession([]),
+        batch_size=10,
+    )
+
+    await flusher.consume_once()
+    await flusher.consume_once()
+
+    assert streams.group_creations == 2  # one per stream, not per round
+    assert scans[0] == 0  # the first round scans every registered stream
+    assert scans[1] > 0
+
+
+@pytest.mark.asyncio
+async def test_vanished_stream_is_rechecked_next_round(streams, monkeypatch):
+    read_group = streams.read_group
+    failures = [ResponseError("NOGROUP No such key or consumer group")]
+
+    async def flaky_read(**kwargs):
+        if failures:
+            raise failures.pop()
+        return await read_group(**kwargs)
+
+    monkeypatch.setattr(consumer_module, "read_event_stream_group", flaky_read)
+    flusher = EventFlusher(
+        redis_client=None,
+        session_factory=lambda: FakeDbSession([]),
+        batch_size=10,
+    )
+
+    assert await flusher.consume_once() == 0
+    assert await flusher.consume_once() == 6
+    assert streams.group_creations == 4
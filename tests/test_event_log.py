@@ -0,0 +1,96 @@
+import json
+import random
+
+import pytest
+
+from thirteen_backend.domain.game import Game
+from thirteen_backend.services import event_log
+from thirteen_backend.services.event_log import (
+    make_action,
+    make_event_payload,
+    replay_events,
+)
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_every_ten(monkeypatch):
+    monkeypatch.setattr(event_log.config, "EVENT_CHECKPOINT_INTERVAL", 10)
+
+
+def _stored(data: dict) -> dict:
+    return json.loads(json.dumps(data))
+
+
+def _play_logged_game(moves: int) -> tuple[Game, list[dict], list[dict]]:
+    """Play *moves* moves, returning the game, its event log and the full
+    state after every event (JSON round-tripped, as stored in Redis)."""
+    random.seed(7)
+    game = Game()
+    events = [
+        {
+            "seq": 0,
+            "payload": _stored(
+                make_event_payload(engine=game, seq=0, action=None, checkpoint=True)
+            ),
+        }
+    ]
+    states = [_stored(game.to_full_dict())]
+    for seq in range(1, moves + 1):
+        seat = game.state.get_current_seat()
+        hand_number = game.state.hand_number
+        plays = (
+            None
+            if seat in game.state.passed_players
+            else game.rules.get_valid_plays(player_idx=seat)
+        )
+        play = plays[0] if plays else None
+        if play:
+            game.apply_play(player_idx=seat, play=play)
+        else:
+            game.apply_pass(player_idx=seat)
+        events.append(
+            {
+                "seq": seq,
+                "payload": _stored(
+                    make_event_payload(
+                        engine=game,
+                        seq=seq,
+                        action=make_action(player_idx=seat, play=play),
+                        checkpoint=game.state.hand_number != hand_number,
+                    )
+                ),
+            }
+        )
+        states.append(_stored(game.to_full_dict()))
+    return game, events, states
+
+
+def test_only_checkpoint_events_carry_state():
+    _, events, _ = _play_logged_game(moves=25)
+
+    assert [e["seq"] for e in events if "checkpoint" in e["payload"]] == [0, 10, 20]
+    assert set(events[5]["payload"]) == {"hand_number", "action"}
+
+
+@pytest.mark.parametrize("seq", [0, 1, 9, 10, 17, 25])
+def test_replay_matches_live_state(seq):
+    _, events, states = _play_logged_game(moves=25)
+
+    assert _stored(replay_events(events, seq=seq).to_full_dict()) == states[seq]
+
+
+def test_replay_from_partial_log_uses_nearest_checkpoint():
+    game, events, _ = _play_logged_game(moves=25)
+
+    replayed = replay_events(events[12:])
+
+    assert _stored(replayed.to_full_dict()) == _stored(game.to_full_dict())
+
+
+def test_replay_rejects_missing_checkpoint_or_gap():
+    _, events, _ = _play_logged_game(moves=25)
+
+    with pytest.raises(ValueError):
+        replay_events(events[11:20])
+    with pytest.raises(ValueError):
+        replay_events(events[:14] + events[15:19])
@@ -49,3 +49,21 @@ def test_game_serialisation_roundtrip():
     # Other high-level state attributes
     assert restored.state.turn_number == original.state.turn_number
     assert restored.current_turn_order == original.current_turn_order
+
+
+def test_trusted_decode_reuses_interned_cards():
+    import json
+
+    from thirteen_backend.domain.card import INTERNED_CARDS
+    from thirteen_backend.domain.deck import DeckConfig
+
+    original = Game(cfg=DeckConfig(times_shuffled=2))
+    state_dict = json.loads(json.dumps(original.to_full_dict()))
+
+    trusted = Game.from_state_dict(state_dict, trusted=True)
+    checked = Game.from_state_dict(json.loads(json.dumps(original.to_full_dict())))
+
+    assert trusted.to_full_dict() == checked.to_full_dict()
+    assert trusted.cfg == original.cfg
+    for player in trusted.players:
+        assert all(c is INTERNED_CARDS[(c.suit, c.rank)] for c in player.hand)
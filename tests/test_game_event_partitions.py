@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from thirteen_backend.repositories import game_event_partition_repository as partitions
+from thirteen_backend.services import game_event_retention as retention_module
+from thirteen_backend.services.game_event_retention import GameEventRetention
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_partition_names_round_trip_and_month_arithmetic():
+    month = partitions.month_start(_utc(2026, 12, 31, 23, 59))
+
+    assert month == _utc(2026, 12, 1)
+    assert partitions.partition_name(month) == "game_events_p202612"
+    assert partitions.partition_month("game_events_p202612") == month
+    assert partitions.partition_month("game_events_default") is None
+    assert partitions.add_months(month, 1) == _utc(2027, 1, 1)
+    assert partitions.add_months(month, -12) == _utc(2025, 12, 1)
+
+
+def test_only_whole_months_before_cutoff_expire():
+    names = ["game_events_p202603", "game_events_p202604", "game_events_p202605"]
+
+    assert partitions.expired_partitions(names, _utc(2026, 5, 1)) == [
+        "game_events_p202603",
+        "game_events_p202604",
+    ]
+
+
+class RecordingDbSession:
+    def __init__(self, existing: list[str]):
+        self.existing = existing
+        self.sql: list[str] = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self.sql.append(str(stmt))
+        return [(name,) for name in self.existing]
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.mark.asyncio
+async def test_retention_creates_upcoming_and_drops_expired_partitions():
+    db_session = RecordingDbSession(
+        existing=["game_events_p202603", "game_events_p202604", "game_events_p202610"]
+    )
+    retention = GameEventRetention(
+        session_factory=lambda: db_session, retention_months=6, months_ahead=2
+    )
+
+    dropped = await retention.run_once(now=_utc(2026, 10, 19))
+
+    assert dropped == ["game_events_p202603"]
+    assert "pg_advisory_xact_lock" in db_session.sql[0]
+    # The current month exists; the next two are built, filled from the
+    # default partition and attached.
+    created = [s for s in db_session.sql if s.startswith("CREATE TABLE")]
+    assert [s.split()[2] for s in created] == [
+        "game_events_p202611",
+        "game_events_p202612",
+    ]
+    moved = [s for s in db_session.sql if "DELETE FROM game_events_default" in s]
+    assert len(moved) == 3  # two new months plus the expired rows
+    assert "INSERT INTO game_events_p202612" in moved[1]
+    assert "ts < :cutoff" in moved[2]
+    attached = [s for s in db_session.sql if "ATTACH PARTITION" in s]
+    assert attached[-1].endswith(
+        "game_events_p202612 "
+        "FOR VALUES FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')"
+    )
+    assert "DROP TABLE game_events_p202603" in db_session.sql
+    assert db_session.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_zero_retention_keeps_every_partition(monkeypatch):
+    async def fail(**kwargs):
+        raise AssertionError("nothing should be dropped")
+
+    monkeypatch.setattr(
+        retention_module.partitions, "drop_game_event_partitions_before", fail
+    )
+    retention = GameEventRetention(
+        session_factory=lambda: RecordingDbSession([]), retention_months=0
+    )
+
+    assert await retention.run_once() == []
@@ -109,3 +109,141 @@ def test_game_state_handle_new_hand_and_lead(seeded_game):
     assert state.passed_players == []
     assert state.current_play_pile == []
     assert state.current_play_type == PlayType.OPEN
+
+
+# ---------------------------------------------------------------------------
+# push_* / undo – branch exploration without copying the game
+# ---------------------------------------------------------------------------
+
+
+def _current_seat(game):
+    state = game.state
+    return state.current_turn_order[
+        (state.turn_number - 1) % len(state.current_turn_order)
+    ]
+
+
+def test_push_and_undo_restores_state(seeded_game):
+    game = seeded_game
+    snapshot = game.to_full_dict()
+    rng = random.Random(7)
+
+    for _ in range(30):
+        seat = _current_seat(game)
+        plays = game.rules.get_valid_plays(player_idx=seat)
+        if plays:
+            game.push_play(player_idx=seat, play=rng.choice(plays))
+        else:
+            game.push_pass(player_idx=seat)
+
+    assert game.undo_depth == 30
+    assert game.to_full_dict() != snapshot
+
+    while game.undo_depth:
+        game.undo()
+
+    assert game.to_full_dict() == snapshot
+    assert game.current_turn_order is game.state.current_turn_order
+
+
+def test_undo_across_new_hand(seeded_game):
+    game = seeded_game
+    state = game.state
+    winner, loser = state.current_turn_order[:2]
+    for seat in state.current_turn_order[2:]:
+        game.players[seat].hand = []
+    state.current_turn_order = game.current_turn_order = [winner, loser]
+    game.players[winner].hand = game.players[winner].hand[:1]
+    snapshot = game.to_full_dict()
+
+    last_card = game.players[winner].hand[0]
+    game.push_play(
+        player_idx=winner,
+        play={"cards": [last_card], "play_type": PlayType.SINGLE},
+    )
+    assert state.hand_number == 2
+    assert sum(len(p.hand) for p in game.players) == 52
+
+    game.undo()
+
+    assert game.to_full_dict() == snapshot
+    assert game.players[winner].hand == [last_card]
+
+
+def test_push_play_failure_leaves_state_untouched(seeded_game):
+    game = seeded_game
+    snapshot = game.to_full_dict()
+    seat = game.state.current_leader
+    foreign = next(c for c in game.players[(seat + 1) % 4].hand)
+
+    with pytest.raises(ValueError):
+        game.push_play(
+            player_idx=seat,
+            play={
+                "cards": [game.players[seat].hand[0], foreign],
+                "play_type": PlayType.PAIR,
+            },
+        )
+
+    assert game.undo_depth == 0
+    assert game.to_full_dict() == snapshot
+
+
+def test_finished_hand_summary_and_placements(seeded_game):
+    game = seeded_game
+    state = game.state
+    winner, loser = state.current_turn_order[:2]
+    for seat in state.current_turn_order[2:]:
+        game.players[seat].hand = []
+    state.current_turn_order = game.current_turn_order = [winner, loser]
+    state.placements_this_hand = [s for s in range(4) if s not in (winner, loser)]
+    game.players[winner].hand = game.players[winner].hand[:1]
+    state.add_bomb(loser)
+
+    game.apply_play(
+        player_idx=winner,
+        play={"cards": list(game.players[winner].hand), "play_type": PlayType.SINGLE},
+    )
+
+    summary = game.last_hand_summary
+    assert summary["hand_number"] == 1
+    assert summary["placements"][str(winner)] == 3
+    assert summary["placements"][str(loser)] == 4
+    assert summary["bombs"] == {str(loser): 1}
+    assert state.hand_number == 2 and state.bombs_this_hand == []
+    assert game.players[loser].placements == [4]
+
+    reloaded = Game.from_state_dict(game.to_full_dict())
+    assert [p.placements for p in reloaded.players] == [
+        p.placements for p in game.players
+    ]
+
+    game.apply_pass(player_idx=game.state.current_leader)
+    assert game.last_hand_summary is None
+
+
+def test_bombs_are_counted_and_undone(seeded_game):
+    game = seeded_game
+    seat = game.state.current_leader
+    quartet = [Card(suit=s, rank="7") for s in "DCHS"]
+    for player in game.players:
+        player.hand = [c for c in player.hand if c not in quartet]
+    game.players[seat].hand.extend(quartet)
+
+    # Leading a quartet on an open pile is not a bomb
+    game.push_play(
+        player_idx=seat, play={"cards": quartet, "play_type": PlayType.QUARTET}
+    )
+    assert game.players[seat].bombs_played == 0
+    game.undo()
+
+    game.state.current_play_type = PlayType.SINGLE
+    game.push_play(
+        player_idx=seat, play={"cards": quartet, "play_type": PlayType.QUARTET}
+    )
+    assert game.players[seat].bombs_played == 1
+    assert game.state.bombs_this_hand[seat] == 1
+
+    game.undo()
+    assert game.players[seat].bombs_played == 0
+    assert not any(game.state.bombs_this_hand)
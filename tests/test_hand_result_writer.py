@@ -0,0 +1,127 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from tests.test_event_flusher import FakeDbSession, FakeEventStreams, integrity_error
+from thirteen_backend.services import event_stream_consumer as consumer_module
+from thirteen_backend.services import hand_result_writer as writer_module
+from thirteen_backend.services.hand_result_writer import HandResultWriter
+
+
+def _event(game_id: str, seq: int, hand_number: int | None = None) -> dict:
+    payload = {"hand_number": 1, "action": None}
+    if hand_number is not None:
+        payload["hand_summary"] = {
+            "hand_number": hand_number,
+            "placements": {"0": 1, "1": 2, "2": 3, "3": 4},
+            "turns": 12,
+            "bombs": {},
+        }
+    return {
+        "id": str(uuid4()),
+        "seq": seq,
+        "turn": seq,
+        "type": "PLAY",
+        "payload": payload,
+        "ts": datetime.now(timezone.utc).isoformat(),
+        "game_id": game_id,
+    }
+
+
+@pytest.fixture()
+def hands(monkeypatch):
+    games = [str(uuid4()), str(uuid4())]
+    fake = FakeEventStreams(
+        {
+            game_id: [_event(game_id, 1), _event(game_id, 2, hand_number=1)]
+            for game_id in games
+        }
+    )
+    monkeypatch.setattr(consumer_module, "iter_event_streams", fake.iter_streams)
+    monkeypatch.setattr(consumer_module, "ensure_event_stream_group", fake.ensure_group)
+    monkeypatch.setattr(consumer_module, "read_event_stream_group", fake.read_group)
+    monkeypatch.setattr(consumer_module, "ack_event_stream", fake.ack)
+
+    refreshed: list = []
+
+    async def bulk_insert(*, db_session, rows):
+        db_session.pending.extend(rows)
+
+    async def refresh(*, db_session, game_ids):
+        refreshed.append(game_ids)
+
+    repo = writer_module.game_hand_repository
+    monkeypatch.setattr(repo, "bulk_insert_game_hands", bulk_insert)
+    monkeypatch.setattr(repo, "refresh_session_placements", refresh)
+    return fake, games, refreshed
+
+
+@pytest.mark.asyncio
+async def test_writer_stores_hand_summaries_only(hands):
+    fake, games, refreshed = hands
+    stored: list = []
+    writer = HandResultWriter(
+        redis_client=None, session_factory=lambda: FakeDbSession(stored)
+    )
+
+    assert await writer.consume_once() == 4
+    assert sorted(str(r["game_id"]) for r in stored) == sorted(games)
+    assert all(r["hand_number"] == 1 and r["turns"] == 12 for r in stored)
+    assert refreshed == [{UUID(g) for g in games}]
+    assert fake.unacked(HandResultWriter.group) == 0
+
+
+@pytest.mark.asyncio
+async def test_hands_of_unstored_sessions_are_deferred(hands, monkeypatch):
+    fake, games, _ = hands
+    calls = {"n": 0}
+
+    async def bulk_insert(*, db_session, rows):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise integrity_error()
+        db_session.pending.extend(rows)
+
+    async def existing_ids(*, db_session, ids):
+        return {UUID(games[0])}
+
+    monkeypatch.setattr(
+        writer_module.game_hand_repository, "bulk_insert_game_hands", bulk_insert
+    )
+    monkeypatch.setattr(
+        writer_module.sessions_repository, "get_existing_session_ids", existing_ids
+    )
+    stored: list = []
+    writer = HandResultWriter(
+        redis_client=None, session_factory=lambda: FakeDbSession(stored)
+    )
+
+    assert await writer.consume_once() == 3
+    assert [str(r["game_id"]) for r in stored] == [games[0]]
+    assert fake.unacked(HandResultWriter.group) == 1
+
+
+class _CapturingDbSession:
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+
+@pytest.mark.asyncio
+async def test_refresh_session_placements_compiles_for_postgres():
+    from sqlalchemy.dialects import postgresql
+
+    from thirteen_backend.repositories.game_hand_repository import (
+        refresh_session_placements,
+    )
+
+    db_session = _CapturingDbSession()
+    await refresh_session_placements(db_session=db_session, game_ids={uuid4()})
+
+    (stmt,) = db_session.statements
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "jsonb_agg(game_hands.placements ORDER BY game_hands.hand_number)" in sql
+    assert "WITHIN GROUP" not in sql
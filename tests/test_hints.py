@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from thirteen_backend.domain.card import Card
+from thirteen_backend.domain.game import Game
+from thirteen_backend.services.hints import HintCache, encode_plays
+from thirteen_backend.types import PlayType
+
+
+@pytest.fixture()
+def human_turn_game():
+    """Return a *Game* where the human (seat 0) is on turn."""
+    seed = 0
+    while True:
+        random.seed(seed)
+        game = Game()
+        if game.state.get_current_seat() == 0:
+            return game
+        seed += 1
+
+
+def test_encode_plays_uses_card_codes():
+    plays = [
+        {"cards": [Card("D", "10"), Card("S", "10")], "play_type": PlayType.PAIR},
+        {"cards": [Card("H", "J")], "play_type": PlayType.SINGLE},
+    ]
+    assert encode_plays(plays) == [["pair", ["10D", "10S"]], ["single", ["JH"]]]
+
+
+def test_hints_cached_per_sequence(human_turn_game, monkeypatch):
+    game = human_turn_game
+    calls = []
+    original = game.rules.get_valid_plays
+
+    def counting(player_idx):
+        calls.append(player_idx)
+        return original(player_idx=player_idx)
+
+    monkeypatch.setattr(game.rules, "get_valid_plays", counting)
+    cache = HintCache()
+
+    first = cache.get_hints(session_id="s1", seq=3, engine=game)
+    again = cache.get_hints(session_id="s1", seq=3, engine=game)
+
+    assert first and first is again
+    assert all("3D" in codes for _, codes in first)  # opening turn
+    assert calls == [0]
+
+    cache.get_hints(session_id="s1", seq=4, engine=game)
+    assert calls == [0, 0]
+
+
+def test_no_hints_when_not_human_turn(human_turn_game):
+    game = human_turn_game
+    game.apply_pass(player_idx=0)
+    cache = HintCache()
+
+    assert cache.get_hints(session_id="s1", seq=1, engine=game) is None
+
+
+def test_cache_evicts_oldest_session(human_turn_game):
+    cache = HintCache(max_sessions=2)
+    for session_id in ("a", "b", "c"):
+        cache.get_hints(session_id=session_id, seq=1, engine=human_turn_game)
+
+    assert len(cache) == 2
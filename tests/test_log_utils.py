@@ -0,0 +1,44 @@
+import io
+import json
+import logging
+
+from thirteen_backend.utils.log_formatter import LazyJsonFormatter
+from thirteen_backend.utils.log_utils import lazy
+
+
+def _make_logger(level: int) -> tuple[logging.Logger, io.StringIO]:
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(LazyJsonFormatter("%(levelname)s %(message)s"))
+    logger = logging.getLogger(f"test-log-utils-{level}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(level)
+    return logger, stream
+
+
+def test_lazy_field_not_built_when_record_dropped():
+    logger, stream = _make_logger(logging.WARNING)
+    calls = []
+
+    logger.info("dropped", extra={"state": lazy(lambda: calls.append(1))})
+
+    assert calls == []
+    assert stream.getvalue() == ""
+
+
+def test_lazy_field_serialised_as_nested_json_once():
+    logger, stream = _make_logger(logging.INFO)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"hand_counts": [13, 12]}
+
+    field = lazy(build)
+    logger.info("emitted %s", field, extra={"state": field})
+
+    record = json.loads(stream.getvalue())
+    assert record["state"] == {"hand_counts": [13, 12]}
+    assert record["message"] == "emitted {'hand_counts': [13, 12]}"
+    assert calls == [1]
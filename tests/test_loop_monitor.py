@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from thirteen_backend.diagnostics import loop_monitor as monitor_module
+from thirteen_backend.diagnostics.loop_monitor import LoopMonitor, session_task_name
+
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_lag_is_sampled_while_running():
+    before = _sample("event_loop_lag_seconds_count")
+    monitor = LoopMonitor(interval_seconds=0.01, slow_callback_seconds=1)
+
+    monitor.start()
+    await asyncio.sleep(0.1)
+    await monitor.stop()
+
+    assert _sample("event_loop_lag_seconds_count") > before
+
+
+@pytest.mark.asyncio
+async def test_blocking_step_is_reported_with_its_session(monkeypatch):
+    reports: list = []
+
+    def warning(msg, *args, extra=None):
+        reports.append(extra)
+
+    monkeypatch.setattr(monitor_module.LOGGER, "warning", warning)
+    before = _sample("event_loop_slow_callbacks_total")
+    # Default settings: a 0.25s sampling interval would hide a 0.3s step
+    monitor = LoopMonitor(interval_seconds=0.25, slow_callback_seconds=0.1)
+
+    async def hog():
+        await asyncio.sleep(0.03)
+        time.sleep(0.3)  # CPU work that belongs in an executor
+
+    monitor.start()
+    await asyncio.create_task(hog(), name=session_task_name("abc"))
+    await asyncio.sleep(0.15)  # let the watchdog see the heartbeat resume
+    await monitor.stop()
+
+    assert _sample("event_loop_slow_callbacks_total") == before + 1
+    blocked, resumed = reports
+    assert blocked["session_id"] == resumed["session_id"] == "abc"
+    assert blocked["coroutine"].endswith("hog")
+    assert blocked["stack"].endswith("hog")
+    # Full stall length, not just how overdue the wakeup was when detected
+    assert 0.3 <= resumed["blocked_seconds"] < 0.3 + 0.1
@@ -0,0 +1,73 @@
+import pytest
+from prometheus_client import REGISTRY, generate_latest
+
+from thirteen_backend import metrics
+
+
+def test_single_process_uses_default_registry(monkeypatch):
+    monkeypatch.setattr(metrics.config, "PROMETHEUS_MULTIPROC_DIR", None)
+
+    assert metrics.metrics_registry() is REGISTRY
+
+
+def test_multiprocess_registry_reads_the_shared_directory(monkeypatch, tmp_path):
+    monkeypatch.setattr(metrics.config, "PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    registry = metrics.metrics_registry()
+
+    assert registry is not REGISTRY
+    # Nothing has been written to the directory yet – an empty exposition.
+    assert generate_latest(registry) == b""
+
+
+def _stage_samples(stage: str) -> list:
+    return [
+        sample
+        for metric in metrics.MOVE_STAGE_DURATION.collect()
+        for sample in metric.samples
+        if sample.labels.get("stage") == stage
+    ]
+
+
+def test_move_stage_is_timed_with_a_session_exemplar():
+    count_before = REGISTRY.get_sample_value(
+        "move_stage_duration_seconds_count", {"stage": "apply"}
+    )
+
+    with metrics.time_move_stage("apply", "session-1"):
+        pass
+
+    assert (
+        REGISTRY.get_sample_value(
+            "move_stage_duration_seconds_count", {"stage": "apply"}
+        )
+        == (count_before or 0) + 1
+    )
+    exemplars = [s.exemplar for s in _stage_samples("apply") if s.exemplar]
+    assert {"session_id": "session-1"} in [e.labels for e in exemplars]
+
+
+def test_failed_stage_is_still_observed():
+    labels = {"stage": "persist"}
+    count_before = REGISTRY.get_sample_value(
+        "move_stage_duration_seconds_count", labels
+    )
+
+    with pytest.raises(RuntimeError):
+        with metrics.time_move_stage("persist", "session-2"):
+            raise RuntimeError("redis down")
+
+    assert (
+        REGISTRY.get_sample_value("move_stage_duration_seconds_count", labels)
+        == (count_before or 0) + 1
+    )
+
+
+def test_worker_process_metrics_are_published():
+    if not metrics._PROCESS_COLLECTOR.collect():
+        pytest.skip("no /proc on this platform")
+
+    metrics.update_process_metrics()
+
+    assert REGISTRY.get_sample_value("worker_process_resident_memory_bytes") > 0
+    assert REGISTRY.get_sample_value("worker_process_cpu_seconds") > 0
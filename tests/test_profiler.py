@@ -0,0 +1,82 @@
+import asyncio
+import sys
+import threading
+import time
+
+import pytest
+
+from thirteen_backend.diagnostics.profiler import (
+    Profile,
+    ProfilerBusyError,
+    SamplingProfiler,
+    collapse_stack,
+)
+
+
+def test_collapse_stack_lists_outermost_frame_first():
+    def inner():
+        return collapse_stack(sys._getframe())
+
+    def outer():
+        return inner()
+
+    stack = outer().split(";")
+
+    assert stack[-2:] == [f"{__name__}:outer", f"{__name__}:inner"]
+
+
+def test_collapsed_output_is_flamegraph_ready():
+    profile = Profile(duration_seconds=1, interval_seconds=0.01)
+    profile.stacks.update({"a;b": 3, "a;c": 1})
+
+    assert profile.collapsed() == "a;b 3\na;c 1\n"
+    assert profile.loop_lag_summary() == {"samples": 0}
+
+
+def _spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.mark.asyncio
+async def test_profile_samples_other_threads_and_loop_lag():
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin, args=(stop,))
+    worker.start()
+    try:
+        result = await SamplingProfiler().profile(duration=0.2, interval=0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert result.samples > 0
+    assert any(stack.endswith(f"{__name__}:_spin") for stack in result.stacks)
+    # The sampler thread does not profile itself
+    assert not any(":_sample;" in stack for stack in result.stacks)
+    assert result.loop_lag_summary()["samples"] > 0
+
+
+@pytest.mark.asyncio
+async def test_blocking_the_loop_shows_up_as_lag():
+    async def block():
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)
+
+    profiler = SamplingProfiler()
+    result, _ = await asyncio.gather(
+        profiler.profile(duration=0.2, interval=0.01), block()
+    )
+
+    assert result.loop_lag_summary()["max_ms"] >= 50
+
+
+@pytest.mark.asyncio
+async def test_only_one_profile_runs_at_a_time():
+    profiler = SamplingProfiler()
+    running = asyncio.create_task(profiler.profile(duration=0.1, interval=0.01))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ProfilerBusyError):
+        await profiler.profile(duration=0.1, interval=0.01)
+    await running
+    assert profiler.running is False
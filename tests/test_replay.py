@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from thirteen_backend.domain.deck import DeckConfig
+from thirteen_backend.domain.game import Game
+from thirteen_backend.domain.replay import replay_game
+from thirteen_backend.domain.rules import InvalidPlayError
+from thirteen_backend.services.event_log import make_action
+
+
+def _full(game: Game) -> dict:
+    return json.loads(json.dumps(game.to_full_dict()))
+
+
+def _play(game: Game, moves: int) -> list[dict]:
+    actions = []
+    for _ in range(moves):
+        seat = game.state.get_current_seat()
+        plays = (
+            None
+            if seat in game.state.passed_players
+            else game.rules.get_valid_plays(player_idx=seat)
+        )
+        play = plays[0] if plays else None
+        if play:
+            game.apply_play(player_idx=seat, play=play)
+        else:
+            game.apply_pass(player_idx=seat)
+        actions.append(make_action(player_idx=seat, play=play))
+    return actions
+
+
+def test_same_seed_deals_same_hands_for_every_hand():
+    first, second = Game(seed=42), Game(seed=42)
+    assert [p.hand for p in first.players] == [p.hand for p in second.players]
+
+    first._start_new_hand()
+    second._start_new_hand()
+    assert [p.hand for p in first.players] == [p.hand for p in second.players]
+    assert [p.hand for p in Game(seed=43).players] != [p.hand for p in first.players]
+
+
+def test_seed_and_cfg_survive_state_dict_round_trip():
+    game = Game(cfg=DeckConfig(players_count=3), seed=99)
+
+    restored = Game.from_state_dict(_full(game))
+
+    assert restored.seed == 99
+    assert restored.cfg.players_count == 3
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_replay_reproduces_state_at_every_step(validate):
+    game = Game(seed=2024)
+    ids = [p.id for p in game.players]
+    states, actions = [_full(game)], []
+    for _ in range(30):
+        actions += _play(game, moves=1)
+        states.append(_full(game))
+
+    for upto in (0, 1, 15, 30):
+        replayed = replay_game(
+            seed=2024,
+            actions=actions[:upto],
+            game_id=game.id,
+            player_ids=ids,
+            validate=validate,
+        )
+        assert _full(replayed) == states[upto]
+        assert replayed.state.quiet is False
+
+
+def test_validating_replay_rejects_out_of_turn_move():
+    game = Game(seed=5)
+    actions = _play(game, moves=1)
+    wrong_seat = (actions[0]["seat"] + 1) % 4
+
+    with pytest.raises(InvalidPlayError):
+        replay_game(seed=5, actions=[{**actions[0], "seat": wrong_seat}], validate=True)
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import REGISTRY
+
+from thirteen_backend.api.middleware import UNMATCHED_ROUTE, RequestMetricsMiddleware
+
+
+def _count(path: str, status: int) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "http_request_total",
+            {"method": "GET", "path": path, "status": str(status)},
+        )
+        or 0.0
+    )
+
+
+def _app(route=None, status=200):
+    async def app(scope, receive, send):
+        if route is not None:
+            scope["route"] = route  # what the router does on a match
+        await send({"type": "http.response.start", "status": status})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+async def _call(middleware, path: str) -> list:
+    sent: list = []
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware({"type": "http", "method": "GET", "path": path}, None, send)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_requests_are_labelled_by_route_template():
+    route = SimpleNamespace(path="/ws/{session_id}/stats")
+    middleware = RequestMetricsMiddleware(_app(route))
+    before = _count("/ws/{session_id}/stats", 200)
+
+    sent = await _call(middleware, "/ws/abc/stats")
+    await _call(middleware, "/ws/def/stats")
+
+    assert sent[0]["status"] == 200
+    assert _count("/ws/{session_id}/stats", 200) == before + 2
+    assert _count("/ws/abc/stats", 200) == 0
+
+
+@pytest.mark.asyncio
+async def test_unmatched_paths_share_one_series():
+    middleware = RequestMetricsMiddleware(_app(status=404))
+    before = _count(UNMATCHED_ROUTE, 404)
+
+    await _call(middleware, "/wp-admin.php")
+    await _call(middleware, "/.env")
+
+    assert _count(UNMATCHED_ROUTE, 404) == before + 2
+
+
+@pytest.mark.asyncio
+async def test_excluded_paths_are_not_measured():
+    middleware = RequestMetricsMiddleware(
+        _app(status=200), excluded_paths=("/metrics",)
+    )
+    before = _count(UNMATCHED_ROUTE, 200)
+
+    sent = await _call(middleware, "/metrics")
+
+    assert sent[0]["status"] == 200
+    assert _count(UNMATCHED_ROUTE, 200) == before
+
+
+@pytest.mark.asyncio
+async def test_excluded_paths_match_whole_segments():
+    middleware = RequestMetricsMiddleware(_app(status=200), excluded_paths=("/admin",))
+    before = _count(UNMATCHED_ROUTE, 200)
+
+    await _call(middleware, "/admin")
+    await _call(middleware, "/admin/profile")
+    await _call(middleware, "/administrator")
+
+    assert _count(UNMATCHED_ROUTE, 200) == before + 1
@@ -0,0 +1,158 @@
+import contextlib
+import io
+import random
+import types
+
+import pytest
+
+from thirteen_backend.domain.card import Card
+from thirteen_backend.domain.game import Game
+from thirteen_backend.domain.rules import InvalidPlayError, Rules
+from thirteen_backend.types import PlayType
+
+
+def _make_engine(
+    hand: list[Card],
+    *,
+    current_play_type: PlayType,
+    turn_number: int = 2,
+    last_play=None,
+    passed_players=None,
+):
+    """Return a stub that mimics *Game* enough for *Rules.validate_play*."""
+    player_stub = types.SimpleNamespace(hand=hand)
+    state_stub = types.SimpleNamespace(
+        players_state=[player_stub],
+        current_play_type=current_play_type,
+        turn_number=turn_number,
+        last_play=last_play,
+        passed_players=passed_players or [],
+    )
+    return types.SimpleNamespace(state=state_stub)
+
+
+def _cards(*codes: str) -> list[Card]:
+    """Build cards from ``"<rank><suit>"`` codes, e.g. ``"10H"``."""
+    return [Card(suit=code[-1], rank=code[:-1]) for code in codes]
+
+
+def test_validate_single_beats_single():
+    hand = _cards("5D", "7C")
+    engine = _make_engine(
+        hand,
+        current_play_type=PlayType.SINGLE,
+        last_play={"cards": _cards("6S"), "play_type": PlayType.SINGLE},
+    )
+    play = Rules(engine).validate_play(player_idx=0, cards=_cards("7C"))
+
+    assert play["play_type"] == PlayType.SINGLE
+    assert play["cards"] == _cards("7C")
+
+
+@pytest.mark.parametrize(
+    "cards,reason",
+    [
+        (["5D"], "does not beat"),
+        (["9H"], "not in the player's hand"),
+        (["7C", "7C"], "only be played once"),
+        (["5D", "7C"], "valid combination"),
+        ([], "at least one card"),
+    ],
+)
+def test_validate_rejects_illegal_singles(cards, reason):
+    hand = _cards("5D", "7C")
+    engine = _make_engine(
+        hand,
+        current_play_type=PlayType.SINGLE,
+        last_play={"cards": _cards("6S"), "play_type": PlayType.SINGLE},
+    )
+    with pytest.raises(InvalidPlayError, match=reason):
+        Rules(engine).validate_play(player_idx=0, cards=_cards(*cards))
+
+
+def test_validate_rejects_wrong_type_and_passed_player():
+    hand = _cards("8D", "8C", "9H")
+    last_play = {"cards": _cards("4D", "4S"), "play_type": PlayType.PAIR}
+    engine = _make_engine(hand, current_play_type=PlayType.PAIR, last_play=last_play)
+
+    with pytest.raises(InvalidPlayError, match="cannot be played"):
+        Rules(engine).validate_play(player_idx=0, cards=_cards("9H"))
+
+    engine.state.passed_players = [0]
+    with pytest.raises(InvalidPlayError, match="already passed"):
+        Rules(engine).validate_play(player_idx=0, cards=_cards("8D", "8C"))
+
+
+def test_validate_bombs():
+    quartet = _cards("4D", "4C", "4H", "4S")
+    dseq = _cards("5D", "5C", "6D", "6C", "7D", "7C")
+    engine = _make_engine(
+        quartet + dseq,
+        current_play_type=PlayType.SINGLE,
+        last_play={"cards": _cards("3S"), "play_type": PlayType.SINGLE},
+    )
+    rules = Rules(engine)
+
+    assert rules.validate_play(0, quartet)["play_type"] == PlayType.QUARTET
+    assert rules.validate_play(0, dseq)["play_type"] == PlayType.DOUBLE_SEQUENCE
+
+    engine.state.current_play_type = PlayType.PAIR
+    engine.state.last_play = {"cards": _cards("3D", "3S"), "play_type": PlayType.PAIR}
+    with pytest.raises(InvalidPlayError):
+        rules.validate_play(0, dseq)
+    assert rules.validate_play(0, quartet)["play_type"] == PlayType.QUARTET
+
+
+def test_validate_sequence_length_and_first_turn():
+    hand = _cards("3D", "4C", "5H", "6S", "7D")
+    engine = _make_engine(
+        hand,
+        current_play_type=PlayType.SEQUENCE,
+        last_play={"cards": _cards("3C", "4D", "5D"), "play_type": PlayType.SEQUENCE},
+    )
+    with pytest.raises(InvalidPlayError, match="length"):
+        Rules(engine).validate_play(0, _cards("4C", "5H", "6S", "7D"))
+    assert Rules(engine).validate_play(0, _cards("5H", "6S", "7D"))
+
+    engine = _make_engine(hand, current_play_type=PlayType.OPEN, turn_number=1)
+    with pytest.raises(InvalidPlayError, match="3♦"):
+        Rules(engine).validate_play(0, _cards("4C", "5H", "6S"))
+    assert Rules(engine).validate_play(0, _cards("3D", "4C", "5H"))
+
+
+def test_validate_accepts_sequences_of_any_suit():
+    """Sequences are suit-agnostic; the hint list only offers the weakest."""
+    hand = _cards("9D", "10C", "JD", "JS")
+    engine = _make_engine(
+        hand,
+        current_play_type=PlayType.SEQUENCE,
+        last_play={"cards": _cards("9C", "10D", "JH"), "play_type": PlayType.SEQUENCE},
+    )
+    rules = Rules(engine)
+
+    assert rules.get_valid_plays(player_idx=0) == []
+    play = rules.validate_play(0, _cards("9D", "10C", "JS"))
+    assert play["play_type"] == PlayType.SEQUENCE
+    with pytest.raises(InvalidPlayError, match="does not beat"):
+        rules.validate_play(0, _cards("9D", "10C", "JD"))
+
+
+def test_validate_accepts_every_generated_play():
+    """``validate_play`` must accept everything ``get_valid_plays`` offers."""
+    rng = random.Random(2024)
+    for game_seed in range(5):
+        random.seed(game_seed)
+        game = Game()
+        for _ in range(40):
+            seat = game.state.get_current_seat()
+            with contextlib.redirect_stdout(io.StringIO()):
+                plays = game.rules.get_valid_plays(player_idx=seat)
+            if not plays:
+                game.apply_pass(player_idx=seat)
+                continue
+            for play in plays:
+                validated = game.rules.validate_play(
+                    player_idx=seat, cards=play["cards"]
+                )
+                assert validated["play_type"] == play["play_type"]
+            game.apply_play(player_idx=seat, play=rng.choice(plays))
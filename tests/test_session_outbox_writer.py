@@ -0,0 +1,70 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from tests.test_event_flusher import FakeDbSession, FakeEventStreams
+from thirteen_backend.domain.game import Game
+from thirteen_backend.repositories.sessions_repository import make_session_rows
+from thirteen_backend.services import event_stream_consumer as consumer_module
+from thirteen_backend.services import session_outbox_writer as writer_module
+from thirteen_backend.services.session_outbox_writer import SessionOutboxWriter
+
+
+@pytest.fixture()
+def outbox(monkeypatch):
+    ts = datetime.now(timezone.utc)
+    rows = [make_session_rows(game=Game(), ts=ts) for _ in range(3)]
+    fake = FakeEventStreams({})
+    fake.streams = {"outbox:session-rows": [(f"{i}-0", r) for i, r in enumerate(rows)]}
+
+    async def iter_outbox(*, redis_client, since):
+        yield ["outbox:session-rows"]
+
+    monkeypatch.setattr(writer_module, "iter_session_outbox", iter_outbox)
+    monkeypatch.setattr(consumer_module, "ensure_event_stream_group", fake.ensure_group)
+    monkeypatch.setattr(consumer_module, "read_event_stream_group", fake.read_group)
+    monkeypatch.setattr(consumer_module, "ack_event_stream", fake.ack)
+
+    async def insert_rows(*, db_session, rows):
+        db_session.pending.extend(rows)
+
+    monkeypatch.setattr(
+        writer_module.sessions_repository, "insert_session_rows", insert_rows
+    )
+    return fake, rows
+
+
+def test_session_rows_are_json_serialisable():
+    rows = make_session_rows(game=Game(), ts=datetime.now(timezone.utc))
+
+    assert json.loads(json.dumps(rows)) == rows
+    assert len(rows["players"]) == len(rows["game_players"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_writer_stores_outbox_rows_then_acks(outbox):
+    fake, rows = outbox
+    stored: list = []
+    writer = SessionOutboxWriter(
+        redis_client=None, session_factory=lambda: FakeDbSession(stored)
+    )
+
+    assert await writer.consume_once() == 3
+    assert stored == rows
+    assert fake.unacked(SessionOutboxWriter.group) == 0
+    assert fake.deleted == {"0-0", "1-0", "2-0"}
+    assert await writer.consume_once() == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_write_leaves_outbox_entries_pending(outbox):
+    fake, _ = outbox
+    writer = SessionOutboxWriter(
+        redis_client=None, session_factory=lambda: FakeDbSession([], fail=True)
+    )
+
+    with pytest.raises(RuntimeError):
+        await writer.consume_once()
+    assert fake.unacked(SessionOutboxWriter.group) == 3
+    assert not fake.deleted
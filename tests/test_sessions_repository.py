@@ -0,0 +1,139 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.sql.dml import Insert, Update
+
+from thirteen_backend.domain.deck import DeckConfig
+from thirteen_backend.errors import Error
+from thirteen_backend.repositories import sessions_repository
+
+
+class RecordingDbSession:
+    def __init__(self):
+        self.statements: list = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture()
+def context(monkeypatch):
+    redis_calls: list = []
+    outcome = {"ok": True}
+
+    async def initialize_session(**kwargs):
+        redis_calls.append(kwargs)
+        return outcome["ok"]
+
+    async def no_bots(**kwargs):
+        return 0
+
+    monkeypatch.setattr(
+        sessions_repository.session_state_repository,
+        "initialize_session",
+        initialize_session,
+    )
+    monkeypatch.setattr(sessions_repository, "play_bots_until_human", no_bots)
+    ctx = SimpleNamespace(db_session=RecordingDbSession(), redis_client=None)
+    return ctx, redis_calls, outcome
+
+
+@pytest.mark.asyncio
+async def test_create_session_uses_one_insert_per_table_and_one_redis_call(context):
+    ctx, redis_calls, _ = context
+
+    result = await sessions_repository.create_game_session(
+        context=ctx, cfg=DeckConfig()
+    )
+
+    tables = [stmt.table.name for stmt in ctx.db_session.statements]
+    assert tables == ["game_sessions", "players", "game_players"]
+    assert all(isinstance(stmt, Insert) for stmt in ctx.db_session.statements)
+    assert ctx.db_session.commits == 1
+    assert len(redis_calls) == 1
+    assert redis_calls[0]["init_event"].seq == 0
+    assert result["session_id"] == redis_calls[0]["game_id"]
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_cancels_the_committed_session(context):
+    ctx, _, outcome = context
+    outcome["ok"] = False
+
+    result = await sessions_repository.create_game_session(
+        context=ctx, cfg=DeckConfig()
+    )
+
+    assert isinstance(result, Error)
+    assert isinstance(ctx.db_session.statements[-1], Update)
+    assert ctx.db_session.commits == 2
+
+
+@pytest.mark.asyncio
+async def test_outbox_mode_skips_postgres(context, monkeypatch):
+    ctx, redis_calls, _ = context
+    monkeypatch.setattr(sessions_repository.config, "SESSION_WRITE_MODE", "outbox")
+
+    result = await sessions_repository.create_game_session(
+        context=ctx, cfg=DeckConfig()
+    )
+
+    assert ctx.db_session.statements == []
+    assert ctx.db_session.commits == 0
+    outbox_rows = redis_calls[0]["outbox_rows"]
+    assert outbox_rows["game_session"]["id"] == result["session_id"]
+    assert len(outbox_rows["players"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_insert_deletes_the_redis_session(context, monkeypatch):
+    ctx, redis_calls, _ = context
+    deleted: list = []
+
+    async def failing_insert(*, db_session, rows):
+        raise RuntimeError("db down")
+
+    async def delete_session(*, redis_client, game_id):
+        deleted.append(game_id)
+
+    monkeypatch.setattr(sessions_repository, "insert_session_rows", failing_insert)
+    monkeypatch.setattr(
+        sessions_repository.session_state_repository,
+        "delete_session",
+        delete_session,
+    )
+
+    with pytest.raises(RuntimeError):
+        await sessions_repository.create_game_session(context=ctx, cfg=DeckConfig())
+
+    assert deleted == [redis_calls[0]["game_id"]]
+    assert ctx.db_session.rollbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_error_cancels_the_committed_session(context, monkeypatch):
+    ctx, _, _ = context
+
+    async def initialize_session(**kwargs):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(
+        sessions_repository.session_state_repository,
+        "initialize_session",
+        initialize_session,
+    )
+
+    result = await sessions_repository.create_game_session(
+        context=ctx, cfg=DeckConfig()
+    )
+
+    assert isinstance(result, Error)
+    assert isinstance(ctx.db_session.statements[-1], Update)
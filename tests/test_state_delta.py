@@ -0,0 +1,138 @@
+import json
+
+import pytest
+
+from thirteen_backend.domain.card import Card
+from thirteen_backend.services.event_log import make_action
+from thirteen_backend.services.websocket import websocket_handlers
+from thirteen_backend.services.websocket.websocket_utils import select_delta_events
+from thirteen_backend.types import PlayType
+
+
+def _event(seq: int, *, hand_number: int = 1, action: bool = True) -> dict:
+    payload = {"hand_number": hand_number}
+    if action:
+        payload["action"] = make_action(player_idx=seq % 4, play=None)
+    return {"seq": seq, "turn": seq, "type": "PASS", "payload": payload}
+
+
+def test_make_action_encodes_play_and_pass():
+    play = {"cards": [Card(suit="D", rank="3")], "play_type": PlayType.SINGLE}
+
+    assert make_action(player_idx=2, play=play) == {
+        "seat": 2,
+        "play_type": "single",
+        "cards": ["3D"],
+    }
+    assert make_action(player_idx=1, play=None) == {
+        "seat": 1,
+        "play_type": None,
+        "cards": None,
+    }
+
+
+def test_select_delta_events_strips_baseline_and_state():
+    events = [_event(seq) for seq in range(4, 8)]
+
+    delta = select_delta_events(events=events, last_seq=4, seq=7)
+
+    assert [e["seq"] for e in delta] == [5, 6, 7]
+    assert set(delta[0]) == {"seq", "turn", "type", "action"}
+
+
+def test_select_delta_events_up_to_date_client_gets_empty_delta():
+    assert select_delta_events(events=[_event(3)], last_seq=3, seq=3) == []
+
+
+@pytest.mark.parametrize(
+    "events",
+    [
+        [],  # stream expired
+        [_event(seq) for seq in range(5, 8)],  # baseline trimmed away
+        [_event(4), _event(5), _event(7)],  # hole in the buffer
+        [_event(4), _event(5), _event(6)],  # buffer behind the sequencer
+        [_event(4), _event(5, hand_number=2), _event(6, hand_number=2), _event(7)],
+        [_event(4), _event(5, action=False), _event(6), _event(7)],
+    ],
+)
+def test_select_delta_events_falls_back_to_snapshot(events):
+    assert select_delta_events(events=events, last_seq=4, seq=7) is None
+
+
+@pytest.fixture()
+def resync(monkeypatch):
+    sent: list[str] = []
+    calls = {"state": 0}
+
+    async def get_seq(*, redis_client, game_id):
+        return 7
+
+    async def read_since(*, redis_client, game_id, last_seq, count):
+        return [_event(seq) for seq in range(last_seq, 8)][:count]
+
+    async def get_state(*, redis_client, game_id):
+        calls["state"] += 1
+        return object()
+
+    async def send_to(*, session_id, conn_id, message, message_type):
+        assert json.loads(message)["type"] == message_type
+        sent.append(message)
+
+    monkeypatch.setattr(websocket_handlers, "get_session_sequencer", get_seq)
+    monkeypatch.setattr(websocket_handlers, "read_session_events_since", read_since)
+    monkeypatch.setattr(websocket_handlers, "get_session_state", get_state)
+    monkeypatch.setattr(websocket_handlers.websocket_manager, "send_to", send_to)
+    monkeypatch.setattr(
+        websocket_handlers.hint_cache,
+        "lookup",
+        lambda *, session_id, seq: (True, None),
+    )
+    monkeypatch.setattr(
+        websocket_handlers,
+        "make_state_sync",
+        lambda *, session_id, seq, game, valid_plays: json.dumps(
+            {"type": "STATE_SYNC", "seq": seq}
+        ),
+    )
+    monkeypatch.setattr(
+        websocket_handlers.hint_cache,
+        "get_hints",
+        lambda *, session_id, seq, engine: None,
+    )
+    monkeypatch.setattr(websocket_handlers.config, "RESYNC_MAX_DELTA_EVENTS", 5)
+    return sent, calls
+
+
+@pytest.mark.asyncio
+async def test_resync_sends_delta_without_loading_state(resync):
+    sent, calls = resync
+
+    await websocket_handlers.handle_resync_request(
+        redis_client=None,
+        session_id="s",
+        player_id="p",
+        conn_id="c",
+        last_sequence=4,
+    )
+
+    message = json.loads(sent[0])
+    assert message["type"] == "STATE_DELTA"
+    assert [e["seq"] for e in message["events"]] == [5, 6, 7]
+    assert calls["state"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("last_sequence", [None, "4", 1, 9])
+async def test_resync_falls_back_to_snapshot(resync, last_sequence):
+    sent, calls = resync
+
+    await websocket_handlers.handle_resync_request(
+        redis_client=None,
+        session_id="s",
+        player_id="p",
+        conn_id="c",
+        last_sequence=last_sequence,
+    )
+
+    assert json.loads(sent[0])["type"] == "STATE_SYNC"
+    assert calls["state"] == 1
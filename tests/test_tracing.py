@@ -0,0 +1,41 @@
+import logging
+
+from thirteen_backend.tracing import Tracer
+
+
+def test_tracer_disabled_by_default():
+    tracer = Tracer()
+
+    assert tracer.enabled is False
+    assert tracer.should_trace("s1") is False
+
+
+def test_tracer_per_session_enablement():
+    tracer = Tracer()
+    tracer.enable_session("s1")
+
+    assert tracer.enabled is True
+    assert tracer.should_trace("s1") is True
+    assert tracer.should_trace("s2") is False
+
+    tracer.disable_session("s1")
+    assert tracer.enabled is False
+
+
+def test_tracer_sample_rate_is_clamped():
+    tracer = Tracer(sample_rate=5.0)
+
+    assert tracer.sample_rate == 1.0
+    assert tracer.should_trace(None) is True
+
+
+def test_trace_emits_log_record(caplog):
+    tracer = Tracer(sessions=["s1"])
+
+    with caplog.at_level(logging.INFO):
+        tracer.trace("bot.decision", session_id="s1", chosen=["3D"])
+        tracer.trace("bot.decision", session_id="s2", chosen=["4D"])
+
+    records = [r for r in caplog.records if r.getMessage() == "trace: bot.decision"]
+    assert len(records) == 1
+    assert records[0].chosen == ["3D"]
@@ -1,8 +1,15 @@
 from types import SimpleNamespace
 
 import pytest
+from prometheus_client import REGISTRY
 
+from thirteen_backend.domain.game import Game
+from thirteen_backend.models.game_event_model import GameEventType
 from thirteen_backend.services.websocket.websocket_manager import WebSocketManager
+from thirteen_backend.services.websocket.websocket_utils import (
+    make_error,
+    make_state_sync,
+)
 
 
 class DummyWebSocket:
@@ -49,3 +56,67 @@ async def test_connect_broadcast_send_disconnect():
     # Disconnect and ensure bookkeeping is cleaned
     manager.disconnect("session123", ws)
     assert manager.connection_count("session123") == 0
+
+
+def _ws_messages(direction: str, message_type: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "websocket_message_total",
+            {"direction": direction, "message_type": message_type},
+        )
+        or 0.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_session_stats_are_dropped_with_the_last_connection():
+    manager = WebSocketManager()
+    first, second = DummyWebSocket(port=1), DummyWebSocket(port=2)
+    active_before = REGISTRY.get_sample_value("websocket_connections")
+    sync_before = _ws_messages("broadcast", "STATE_SYNC")
+    other_before = _ws_messages("inbound", "other")
+
+    await manager.connect("s1", first)
+    await manager.connect("s1", second)
+    await manager.broadcast("s1", {"type": "STATE_SYNC"})
+    manager.record_received("s1", {"type": "<script>"})
+
+    stats = manager.session_stats("s1")
+    assert stats["connections"] == 2
+    assert stats["messages_sent"] == 2
+    assert stats["messages_received"] == 1
+    assert _ws_messages("broadcast", "STATE_SYNC") == sync_before + 2
+    assert _ws_messages("inbound", "other") == other_before + 1
+
+    manager.disconnect("s1", first)
+    manager.disconnect("s1", first)  # idempotent
+    assert manager.session_stats("s1")["connections"] == 1
+    manager.disconnect("s1", second)
+
+    assert manager.session_stats("s1") is None
+    assert REGISTRY.get_sample_value("websocket_connections") == active_before
+
+
+@pytest.mark.asyncio
+async def test_pre_serialised_messages_are_counted_by_type():
+    manager = WebSocketManager()
+    ws = DummyWebSocket()
+    conn_id = await manager.connect("s2", ws)
+    sync_before = _ws_messages("broadcast", "STATE_SYNC")
+    error_before = _ws_messages("direct", "ERROR")
+
+    await manager.broadcast(
+        "s2",
+        make_state_sync(session_id="s2", seq=1, game=Game()),
+        message_type=GameEventType.STATE_SYNC,
+    )
+    await manager.send_to(
+        "s2",
+        conn_id,
+        make_error(session_id="s2", seq=1, message="Not your turn"),
+        message_type=GameEventType.ERROR,
+    )
+
+    assert _ws_messages("broadcast", "STATE_SYNC") == sync_before + 1
+    assert _ws_messages("direct", "ERROR") == error_before + 1
+    manager.disconnect("s2", ws)
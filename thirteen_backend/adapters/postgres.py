@@ -1,6 +1,8 @@
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import Pool
 
-from thirteen_backend import config
+from thirteen_backend import config, metrics
 
 
 def db_dsn(
@@ -33,11 +35,59 @@ engine = create_async_engine(
         driver=config.BACKEND_DB_DRIVER,
         password=config.BACKEND_DB_PASSWORD,
     ),
-    poolclass=None,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
+    pool_timeout=config.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=config.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=config.DB_POOL_PRE_PING,
+    connect_args=(
+        {"prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE}
+        if config.BACKEND_DB_DRIVER == "asyncpg"
+        else {}
+    ),
 )
 
+
+def _track_pool_usage(pool: Pool, *, returning: bool = False) -> None:
+    checked_out = pool.checkedout()
+    overflow = pool.overflow()
+    if returning:
+        # ``checkin`` fires before the pool takes the connection back: it
+        # is still counted, and it is closed (dropping the overflow) when
+        # every idle slot is already taken.
+        if overflow >= checked_out:
+            overflow -= 1
+        checked_out -= 1
+    metrics.set_db_pool_usage(
+        size=pool.size(),
+        checked_out=checked_out,
+        overflow=max(overflow, 0),
+    )
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record) -> None:
+    metrics.increment_db_connections_opened()
+
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    _track_pool_usage(engine.pool)
+
+
+@event.listens_for(engine.sync_engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record) -> None:
+    _track_pool_usage(engine.pool, returning=True)
+
+
 _async_session_maker = async_sessionmaker(engine)
 
 
 def get_session() -> AsyncSession:
     return _async_session_maker()
+
+
+async def ping() -> None:
+    """Round-trip ``SELECT 1`` on a pooled connection (no ORM session)."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
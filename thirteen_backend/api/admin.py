@@ -0,0 +1,66 @@
+import hmac
+import os
+from typing import Literal
+
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+
+from thirteen_backend import config
+from thirteen_backend.diagnostics.profiler import ProfilerBusyError, sampling_profiler
+from thirteen_backend.exceptions import (
+    admin_forbidden,
+    invalid_profile_request,
+    profiler_busy,
+)
+from thirteen_backend.utils import api_responses
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+_LAG_HEADERS = {
+    "mean_ms": "X-Loop-Lag-Mean-Ms",
+    "p99_ms": "X-Loop-Lag-P99-Ms",
+    "max_ms": "X-Loop-Lag-Max-Ms",
+}
+
+
+def _require_admin(request: Request) -> None:
+    token = request.headers.get("x-admin-token")
+    if not config.ADMIN_TOKEN or token is None:
+        raise admin_forbidden()
+    if not hmac.compare_digest(token.encode(), config.ADMIN_TOKEN.encode()):
+        raise admin_forbidden()
+
+
+@router.get("/profile")
+async def profile_worker(
+    request: Request,
+    seconds: float = 5.0,
+    interval_ms: float = 5.0,
+    format: Literal["collapsed", "json"] = "collapsed",
+):
+    """Sample the stacks of the worker that serves this request.
+
+    ``collapsed`` output can be fed straight to flamegraph.pl or speedscope;
+    event-loop lag is reported in ``X-Loop-Lag-*`` headers (or inline for
+    ``json``). Each worker is profiled independently.
+    """
+    _require_admin(request)
+    if not 0 < seconds <= config.PROFILER_MAX_SECONDS or not 1 <= interval_ms <= 1000:
+        raise invalid_profile_request(max_seconds=config.PROFILER_MAX_SECONDS)
+
+    try:
+        result = await sampling_profiler.profile(
+            duration=seconds, interval=interval_ms / 1000
+        )
+    except ProfilerBusyError:
+        raise profiler_busy()
+
+    if format == "json":
+        return api_responses.success({"pid": os.getpid(), **result.to_dict()})
+
+    lag = result.loop_lag_summary()
+    headers = {"X-Worker-Pid": str(os.getpid())}
+    for key, header in _LAG_HEADERS.items():
+        if key in lag:
+            headers[header] = f"{lag[key]:.3f}"
+    return PlainTextResponse(result.collapsed(), headers=headers)
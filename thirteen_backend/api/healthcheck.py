@@ -2,7 +2,6 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter
-from sqlalchemy import select
 
 from thirteen_backend.adapters import postgres
 from thirteen_backend.utils import api_responses
@@ -18,6 +17,5 @@ async def healthcheck() -> Success[dict[str, Any]]:
 
 @router.get("/__ready")
 async def readiness() -> Success[None]:
-    async with postgres.get_session() as session:
-        await session.scalar(select(1))
+    await postgres.ping()
     return api_responses.success(None)
@@ -0,0 +1,65 @@
+"""Pure ASGI middleware (no ``BaseHTTPMiddleware`` task/stream overhead)."""
+
+import time
+from typing import Any, Awaitable, Callable, Iterable
+
+from thirteen_backend import metrics
+
+Scope = dict[str, Any]
+Message = dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Label for requests that matched no route (404s, scanners), so arbitrary
+# paths never become label values.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestMetricsMiddleware:
+    """Count and time HTTP requests, labelled by the matched route template
+    (``/ws/{session_id}/stats``) instead of the raw path.
+
+    Requests for one of *excluded_paths* or anything below it (metrics
+    scrapes, health checks) are passed straight through. Matching is by path
+    segment, so excluding ``/admin`` does not exclude ``/administrator``.
+    """
+
+    def __init__(self, app: ASGIApp, excluded_paths: Iterable[str] = ()) -> None:
+        self.app = app
+        self.excluded_paths = tuple(p.rstrip("/") for p in excluded_paths)
+        self._excluded_prefixes = tuple(p + "/" for p in self.excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._is_excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            # The router stores the matched route in the (shared) scope.
+            path = route_template(scope)
+            metrics.track_request(method=scope["method"], path=path, status=status)
+            metrics.track_request_duration(
+                method=scope["method"], path=path, status=status, duration=duration
+            )
+
+    def _is_excluded(self, path: str) -> bool:
+        return path in self.excluded_paths or path.startswith(self._excluded_prefixes)
+
+
+def route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return path or UNMATCHED_ROUTE
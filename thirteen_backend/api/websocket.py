@@ -1,6 +1,12 @@
+from typing import Any
+
 from fastapi import APIRouter, WebSocket
 
+from thirteen_backend.exceptions import websocket_session_not_found
 from thirteen_backend.repositories.websocket_repository import serve
+from thirteen_backend.services.websocket.websocket_manager import websocket_manager
+from thirteen_backend.utils import api_responses
+from thirteen_backend.utils.api_responses import Success
 
 router = APIRouter(
     prefix="/ws",
@@ -17,3 +23,13 @@ async def websocket_endpoint(ws: WebSocket, session_id: str, player_id: str):
         session_id=session_id,
         player_id=player_id,
     )
+
+
+@router.get("/{session_id}/stats")
+async def websocket_session_stats(session_id: str) -> Success[dict[str, Any]]:
+    """Per-session WebSocket counters of this worker (not exported to
+    Prometheus to keep its series bounded)."""
+    stats = websocket_manager.session_stats(session_id)
+    if stats is None:
+        raise websocket_session_not_found(session_id)
+    return api_responses.success(stats)
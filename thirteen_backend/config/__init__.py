@@ -11,3 +11,73 @@ BACKEND_DB_DRIVER = os.getenv("BACKEND_DB_DRIVER")
 BACKEND_DB_DIALECT = os.getenv("BACKEND_DB_DIALECT")
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 CACHE_URL = os.getenv("CACHE_URL")
+
+# SQLAlchemy connection pool / asyncpg driver tuning
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30"))
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# Per-connection prepared statement cache (asyncpg only); 0 disables it,
+# which is required behind pgbouncer in transaction pooling mode
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+
+# Shared directory for prometheus_client multiprocess mode (gunicorn); read by
+# prometheus_client itself at import time, so it must be set in the environment
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+# How often each worker publishes its CPU / RSS in multiprocess mode
+PROCESS_METRICS_INTERVAL_SECONDS = float(
+    os.getenv("PROCESS_METRICS_INTERVAL_SECONDS", "15")
+)
+
+# Decision tracing (see thirteen_backend.tracing) – disabled by default
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+TRACE_SESSIONS = [s for s in os.getenv("TRACE_SESSIONS", "").split(",") if s]
+
+# "sync" writes new sessions to Postgres inside POST /sessions, "outbox"
+# queues them in Redis for the background SessionOutboxWriter
+SESSION_WRITE_MODE = os.getenv("SESSION_WRITE_MODE", "sync").lower()
+
+# Write-behind flushing of the Redis event buffer into ``game_events``
+EVENT_FLUSH_ENABLED = os.getenv("EVENT_FLUSH_ENABLED", "true").lower() == "true"
+EVENT_FLUSH_INTERVAL_SECONDS = float(os.getenv("EVENT_FLUSH_INTERVAL_SECONDS", "1.0"))
+EVENT_FLUSH_BATCH_SIZE = int(os.getenv("EVENT_FLUSH_BATCH_SIZE", "500"))
+
+# ``game_events`` monthly partitions: how many months to create ahead, how
+# many whole months to keep (0 keeps everything) and how often to check
+GAME_EVENT_PARTITIONS_AHEAD = int(os.getenv("GAME_EVENT_PARTITIONS_AHEAD", "2"))
+GAME_EVENT_RETENTION_MONTHS = int(os.getenv("GAME_EVENT_RETENTION_MONTHS", "6"))
+GAME_EVENT_MAINTENANCE_INTERVAL_SECONDS = float(
+    os.getenv("GAME_EVENT_MAINTENANCE_INTERVAL_SECONDS", "3600")
+)
+
+# Per-session Redis event streams
+EVENT_STREAM_MAXLEN = int(os.getenv("EVENT_STREAM_MAXLEN", "1000"))
+EVENT_STREAM_RECLAIM_IDLE_SECONDS = float(
+    os.getenv("EVENT_STREAM_RECLAIM_IDLE_SECONDS", "60")
+)
+# Streams without new events for this long are unregistered and no longer
+# scanned by the consumers (keep it >= EVENT_DEFER_MAX_AGE_SECONDS)
+EVENT_STREAM_ACTIVE_SECONDS = float(os.getenv("EVENT_STREAM_ACTIVE_SECONDS", "3600"))
+# Events still waiting for their session row after this long are dropped
+EVENT_DEFER_MAX_AGE_SECONDS = float(os.getenv("EVENT_DEFER_MAX_AGE_SECONDS", "3600"))
+
+# RESYNC replies with the missed events when at most this many are missing
+RESYNC_MAX_DELTA_EVENTS = int(os.getenv("RESYNC_MAX_DELTA_EVENTS", "50"))
+
+# Events carry a full state snapshot every this many sequence numbers
+EVENT_CHECKPOINT_INTERVAL = int(os.getenv("EVENT_CHECKPOINT_INTERVAL", "25"))
+
+# Event-loop lag sampling and blocked-loop (slow callback) reports
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+LOOP_LAG_SAMPLE_INTERVAL_SECONDS = float(
+    os.getenv("LOOP_LAG_SAMPLE_INTERVAL_SECONDS", "0.25")
+)
+SLOW_CALLBACK_THRESHOLD_SECONDS = float(
+    os.getenv("SLOW_CALLBACK_THRESHOLD_SECONDS", "0.1")
+)
+
+# Admin endpoints (/admin/*) require this token in the X-Admin-Token header;
+# unset disables them
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+PROFILER_MAX_SECONDS = float(os.getenv("PROFILER_MAX_SECONDS", "30"))
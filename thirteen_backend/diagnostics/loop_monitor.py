@@ -0,0 +1,149 @@
+"""Event-loop lag histogram and blocked-loop reporter.
+
+A small asyncio task wakes up every ``LOOP_LAG_SAMPLE_INTERVAL_SECONDS`` –
+or every half ``SLOW_CALLBACK_THRESHOLD_SECONDS`` if that is shorter – and
+records how late it was woken (``event_loop_lag_seconds``). Every wakeup
+also refreshes a heartbeat watched by a daemon thread: when a wakeup is
+more than the threshold overdue the loop is stuck in a single step, and the
+watchdog logs the running task, its session and the loop thread's stack –
+while the offending code is still on it – and counts it in
+``event_loop_slow_callbacks_total``. Once the heartbeat resumes the full
+length of the stall is logged as well.
+
+Because wakeups are at most half a threshold apart, every step longer than
+1.5 thresholds is caught. Unlike ``loop.slow_callback_duration`` this needs
+no asyncio debug mode, and it costs one timer per wakeup.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+
+from thirteen_backend import config, metrics
+from thirteen_backend.diagnostics.profiler import collapse_stack
+from thirteen_backend.logger import LOGGER
+
+# Prefix of the asyncio task names serving a session (see websocket_repository)
+SESSION_TASK_PREFIX = "session:"
+
+
+def session_task_name(session_id: str) -> str:
+    return f"{SESSION_TASK_PREFIX}{session_id}"
+
+
+class LoopMonitor:
+    def __init__(
+        self,
+        *,
+        interval_seconds: float = config.LOOP_LAG_SAMPLE_INTERVAL_SECONDS,
+        slow_callback_seconds: float = config.SLOW_CALLBACK_THRESHOLD_SECONDS,
+    ) -> None:
+        self._threshold = slow_callback_seconds
+        # Wake at least twice per threshold so short stalls are not missed
+        self._interval = min(interval_seconds, slow_callback_seconds / 2)
+        self._heartbeat = time.monotonic()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(), name="loop-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    # ------------------------------------------------------------------
+    # Lag sampling (event loop)
+    # ------------------------------------------------------------------
+    async def _run(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self._interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            metrics.observe_event_loop_lag(max(0.0, now - start - self._interval))
+
+    # ------------------------------------------------------------------
+    # Blocked-loop detection (watchdog thread)
+    # ------------------------------------------------------------------
+    def _watch(self) -> None:
+        stalled_at = None  # heartbeat before the stall being reported
+        details: dict = {}
+        while not self._stop.wait(self._interval / 2):
+            heartbeat = self._heartbeat
+            if stalled_at is not None and heartbeat != stalled_at:
+                self.report_resumed(heartbeat - stalled_at, details)
+                stalled_at = None
+            overdue = time.monotonic() - heartbeat - self._interval
+            if overdue > self._threshold and stalled_at is None:
+                stalled_at = heartbeat  # once per stall
+                details = self.report_blocked(overdue)
+
+    def report_blocked(self, overdue: float) -> dict:
+        """Log and count a stall while it is happening; returns the task
+        details for :meth:`report_resumed`."""
+        task = self._current_task()
+        task_name = task.get_name() if task is not None else None
+        coroutine = task.get_coro() if task is not None else None
+        frame = sys._current_frames().get(self._loop_thread_id)
+        details = {
+            "task": task_name,
+            "coroutine": getattr(coroutine, "__qualname__", None),
+            "session_id": (
+                task_name.removeprefix(SESSION_TASK_PREFIX)
+                if task_name and task_name.startswith(SESSION_TASK_PREFIX)
+                else None
+            ),
+        }
+        metrics.increment_event_loop_slow_callbacks()
+        LOGGER.warning(
+            "Event loop blocked, %.3fs overdue so far",
+            overdue,
+            extra={
+                **details,
+                "stack": collapse_stack(frame) if frame is not None else None,
+            },
+        )
+        return details
+
+    def report_resumed(self, blocked_for: float, details: dict) -> None:
+        """Log the full length of a reported stall: the time between the
+        heartbeats around it, so at most one interval more than the step."""
+        LOGGER.warning(
+            "Event loop was blocked for %.3fs",
+            blocked_for,
+            extra={**details, "blocked_seconds": blocked_for},
+        )
+
+    def _current_task(self) -> asyncio.Task | None:
+        # Read from another thread: a dict lookup, no loop interaction. The
+        # mapping is an implementation detail, so degrade to "unknown".
+        current_tasks = getattr(asyncio.tasks, "_current_tasks", None)
+        return current_tasks.get(self._loop) if current_tasks is not None else None
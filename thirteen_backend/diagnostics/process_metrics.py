@@ -0,0 +1,43 @@
+"""Per-worker process metrics for prometheus_client multiprocess mode.
+
+With ``PROMETHEUS_MULTIPROC_DIR`` set, ``/metrics`` aggregates the files the
+workers write and the default ``process_*`` collector is gone. This task
+refreshes ``worker_process_cpu_seconds`` and
+``worker_process_resident_memory_bytes`` every
+``PROCESS_METRICS_INTERVAL_SECONDS`` in each worker instead.
+"""
+
+import asyncio
+
+from thirteen_backend import config, metrics
+from thirteen_backend.logger import LOGGER
+
+
+class ProcessMetricsReporter:
+    def __init__(
+        self, *, interval_seconds: float = config.PROCESS_METRICS_INTERVAL_SECONDS
+    ) -> None:
+        self._interval = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="process-metrics")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                metrics.update_process_metrics()
+            except Exception as exc:  # retry on the next tick
+                LOGGER.exception("Updating process metrics failed: %s", exc)
+            await asyncio.sleep(self._interval)
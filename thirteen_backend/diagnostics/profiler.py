@@ -0,0 +1,132 @@
+"""In-process sampling profiler for live workers.
+
+While a profile runs, a background thread snapshots the stack of every other
+thread (``sys._current_frames()``) at a fixed interval and counts identical
+stacks; an asyncio task measures how late the event loop wakes up. Nothing
+is installed outside a run – no tracing hooks, no signal handlers – so an
+idle profiler costs nothing.
+
+The result is in the *collapsed stack* format (``outer;inner;leaf count``)
+understood by flamegraph.pl, speedscope and inferno.
+"""
+
+import asyncio
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Any
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+@dataclass(slots=True)
+class Profile:
+    duration_seconds: float
+    interval_seconds: float
+    samples: int = 0
+    stacks: Counter[str] = field(default_factory=Counter)
+    loop_lag_seconds: list[float] = field(default_factory=list)
+
+    def collapsed(self) -> str:
+        """One ``frame;frame;frame count`` line per distinct stack."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def loop_lag_summary(self) -> dict[str, float]:
+        lags = sorted(self.loop_lag_seconds)
+        if not lags:
+            return {"samples": 0}
+        return {
+            "samples": len(lags),
+            "mean_ms": statistics.fmean(lags) * 1000,
+            "p99_ms": lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000,
+            "max_ms": lags[-1] * 1000,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "duration_seconds": self.duration_seconds,
+            "interval_seconds": self.interval_seconds,
+            "samples": self.samples,
+            "stacks": dict(self.stacks.most_common()),
+            "loop_lag": self.loop_lag_summary(),
+        }
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    """Render *frame* and its callers as ``module:function;...``, outermost
+    first."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", code.co_filename)
+        names.append(f"{module}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class SamplingProfiler:
+    """Runs one profile at a time for this worker process."""
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    async def profile(self, *, duration: float, interval: float) -> Profile:
+        """Sample all threads for *duration* seconds every *interval* seconds.
+
+        Raises
+        ------
+        ProfilerBusyError
+            If another profile is already running in this worker.
+        """
+        if self._lock.locked():
+            raise ProfilerBusyError("A profile is already running")
+        async with self._lock:
+            result = Profile(duration_seconds=duration, interval_seconds=interval)
+            stop = threading.Event()
+            sampler = threading.Thread(
+                target=self._sample,
+                args=(result, interval, stop),
+                name="sampling-profiler",
+                daemon=True,
+            )
+            sampler.start()
+            try:
+                await self._measure_loop_lag(result, duration, interval)
+            finally:
+                stop.set()
+                await asyncio.to_thread(sampler.join)
+            return result
+
+    @staticmethod
+    def _sample(result: Profile, interval: float, stop: threading.Event) -> None:
+        own_id = threading.get_ident()
+        while not stop.wait(interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    result.stacks[collapse_stack(frame)] += 1
+            result.samples += 1
+
+    @staticmethod
+    async def _measure_loop_lag(
+        result: Profile, duration: float, interval: float
+    ) -> None:
+        deadline = time.monotonic() + duration
+        while (now := time.monotonic()) < deadline:
+            await asyncio.sleep(interval)
+            result.loop_lag_seconds.append(max(0.0, time.monotonic() - now - interval))
+
+
+# Singleton instance – importable everywhere
+sampling_profiler = SamplingProfiler()
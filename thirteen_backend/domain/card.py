@@ -51,8 +51,17 @@ class Card:
             return f"10{self.suit}"
         return f"{self.rank[0]}{self.suit}"
 
+    @classmethod
+    def from_image_code(cls, code: str) -> "Card":
+        """Inverse of :attr:`image_code` (``"10D"`` → 10 of Diamonds)."""
+        return cls(suit=code[-1:], rank=code[:-1])
+
     # For JSON serialisation
     def to_dict(self):
+        """Serialised form; a copy of the precomputed dict, safe to mutate."""
+        return dict(_CARD_DICTS[(self.suit, self.rank)])
+
+    def _build_dict(self) -> dict:
         return {
             "rank": self.rank,
             "rank_string": self.rank_name,
@@ -62,3 +71,19 @@ class Card:
             "comparable_value": self.comparable_value,
             "card_url": self.image_code,
         }
+
+
+# One shared, already validated instance per (suit, rank). Cards are
+# immutable, so dealing and decoding state the server wrote itself reuse
+# these instead of constructing and re-validating a new card every time.
+INTERNED_CARDS: dict[tuple[str, str], Card] = {
+    (suit, rank): Card(suit=suit, rank=rank)
+    for suit in CARD_SUITS
+    for rank in CARD_VALUES
+}
+
+# ``to_dict`` runs for every card on every state sync; its output depends
+# on nothing but the card, so it is computed once and only copied per call.
+_CARD_DICTS: dict[tuple[str, str], dict] = {
+    key: card._build_dict() for key, card in INTERNED_CARDS.items()
+}
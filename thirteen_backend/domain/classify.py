@@ -2,6 +2,10 @@ from thirteen_backend.domain.card import Card
 from thirteen_backend.domain.constants import RANK_ORDER, SUIT_ORDER
 from thirteen_backend.types import PlayType
 
+# Zero-based lookup tables – dict access instead of ``list.index`` scans.
+_RANK_VALUE: dict[str, int] = {rank: idx for idx, rank in enumerate(RANK_ORDER)}
+_SUIT_VALUE: dict[str, int] = {suit: idx for idx, suit in enumerate(SUIT_ORDER)}
+
 
 def _card_strength(card: Card) -> int:
     """
@@ -26,8 +30,8 @@ def _card_strength(card: Card) -> int:
     engine compare and sort cards with ordinary integer operators – simple
     and fast.
     """
-    rank_val = RANK_ORDER.index(card.rank)  # 0-based rank (3 → 0 … 2 → 12)
-    suit_val = SUIT_ORDER.index(card.suit)  # 0-based suit (♦ → 0 … ♠ → 3)
+    rank_val = _RANK_VALUE[card.rank]  # 0-based rank (3 → 0 … 2 → 12)
+    suit_val = _SUIT_VALUE[card.suit]  # 0-based suit (♦ → 0 … ♠ → 3)
     return rank_val * 4 + suit_val
 
 
@@ -59,9 +63,8 @@ def _classify_sequence(cards: list[Card]) -> tuple[PlayType, int] | None:
     if len(cards) < 3:
         return None
 
-    by_rank = sorted(cards, key=lambda c: RANK_ORDER.index(c.rank))
-    ranks = [c.rank for c in by_rank]
-    idxs = [RANK_ORDER.index(r) for r in ranks]
+    by_rank = sorted(cards, key=lambda c: _RANK_VALUE[c.rank])
+    idxs = [_RANK_VALUE[c.rank] for c in by_rank]
     if all(b - a == 1 for a, b in zip(idxs, idxs[1:])):
         return PlayType.SEQUENCE, sum(_card_strength(c) for c in by_rank)
     return None
@@ -78,8 +81,8 @@ def _classify_double_sequence(cards: list[Card]) -> tuple[PlayType, int] | None:
     if any(len(v) != 2 for v in by_rank.values()):
         return None
 
-    sorted_ranks = sorted(by_rank.keys(), key=RANK_ORDER.index)
-    idxs = [RANK_ORDER.index(r) for r in sorted_ranks]
+    sorted_ranks = sorted(by_rank.keys(), key=_RANK_VALUE.__getitem__)
+    idxs = [_RANK_VALUE[r] for r in sorted_ranks]
     if all(b - a == 1 for a, b in zip(idxs, idxs[1:])):
         flat_cards = [c for pair in sorted_ranks for c in by_rank[pair]]
         return PlayType.DOUBLE_SEQUENCE, sum(_card_strength(c) for c in flat_cards)
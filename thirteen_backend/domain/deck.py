@@ -1,7 +1,7 @@
 import random
 from dataclasses import dataclass
 
-from thirteen_backend.domain.card import Card
+from thirteen_backend.domain.card import INTERNED_CARDS, Card
 from thirteen_backend.domain.constants import CARD_SUITS, CARD_VALUES
 from thirteen_backend.domain.player import Bot, Human
 
@@ -16,8 +16,10 @@ class DeckConfig:
 class Deck:
     """Utility to create and shuffle one or multiple 52-card decks."""
 
-    def __init__(self, cfg: DeckConfig):
+    def __init__(self, cfg: DeckConfig, rng: random.Random | None = None):
         self.cfg = cfg
+        # Falls back to the module-level generator when no seeded *rng* is given
+        self._rng = rng or random
         self.cards: list[Card] = self._generate_cards()  # unshuffled
         self.shuffle(cfg.times_shuffled)
 
@@ -26,12 +28,12 @@ class Deck:
         for _ in range(self.cfg.deck_count):
             for suit in CARD_SUITS:
                 for rank in CARD_VALUES:
-                    cards.append(Card(suit=suit, rank=rank))
+                    cards.append(INTERNED_CARDS[(suit, rank)])
         return cards
 
     def shuffle(self, times: int = 1) -> None:
         for _ in range(max(1, times)):
-            random.shuffle(self.cards)
+            self._rng.shuffle(self.cards)
 
     def deal(self, players: list[Human | Bot]) -> None:
         """Evenly distribute cards to players."""
@@ -1,20 +1,66 @@
+import random
 import uuid
+from dataclasses import dataclass
 
-from thirteen_backend.domain.card import Card
+from thirteen_backend.domain.card import INTERNED_CARDS, Card
 from thirteen_backend.domain.deck import Deck, DeckConfig
 from thirteen_backend.domain.game_state import GameState
 from thirteen_backend.domain.player import Bot, Human
 from thirteen_backend.domain.rules import Rules
 from thirteen_backend.logger import LOGGER
 from thirteen_backend.types import Play, PlayType
+from thirteen_backend.utils.log_utils import lazy
+
+_BOMB_TYPES = (PlayType.QUARTET, PlayType.DOUBLE_SEQUENCE)
+
+
+@dataclass(slots=True)
+class _UndoRecord:
+    """Everything required to roll back a single play or pass.
+
+    Only scalars and *references* are captured. Lists that the engine only
+    ever appends to are restored by truncating them to their recorded length
+    and lists that get re-bound (new lead, new hand) are restored by
+    re-binding the original object, so no ``Card`` is ever copied.
+    """
+
+    player_idx: int
+    hand_cards: tuple[Card, ...]  # acting player's hand before the move
+    bombs_played: int  # acting player's bomb count before the move
+    hands: tuple[list[Card], ...]  # hand list object of every seat
+    placement_lens: tuple[int, ...]
+    turn_order: list[int]
+    turn_order_items: tuple[int, ...]
+    turn_number: int
+    hand_number: int
+    current_leader: int | None
+    current_play_type: PlayType
+    last_play: Play | None
+    play_pile: list[Card]
+    play_pile_len: int
+    passed_players: list[int]
+    passed_players_len: int
+    placements_this_hand: list[int]
+    placements_this_hand_len: int
+    hand_start_turn: int
+    bombs_this_hand: list[int]
+    bombs_this_hand_items: tuple[int, ...]
+    last_hand_summary: dict | None
+    deck: Deck | None
 
 
 class Game:
-    """Initialises a game: players, deck, first-turn info."""
+    """Initialises a game: players, deck, first-turn info.
 
-    def __init__(self, cfg: DeckConfig | None = None):
+    Every deal is shuffled with a generator derived from *seed* and the hand
+    number, so the seed plus the ordered list of moves fully determines the
+    game (see :mod:`thirteen_backend.domain.replay`).
+    """
+
+    def __init__(self, cfg: DeckConfig | None = None, seed: int | None = None):
         self.id = str(uuid.uuid4())
         self.cfg = cfg or DeckConfig()
+        self.seed = seed if seed is not None else random.getrandbits(63)
         self.players: list[Human | Bot] = [
             (
                 Human(player_index=idx, is_bot=False)
@@ -23,7 +69,7 @@ class Game:
             )
             for idx in range(self.cfg.players_count)
         ]
-        self.deck = Deck(self.cfg)
+        self.deck = Deck(self.cfg, rng=self._hand_rng(hand_number=1))
         self._deal_cards()
         self.current_turn_order: list[int] = self._determine_initial_turn_order()
         self.state = GameState(
@@ -34,6 +80,12 @@ class Game:
             game_id=self.id,
         )
         self.rules = Rules(engine=self)
+        # Result of the hand finished by the latest move, if it finished one
+        self.last_hand_summary: dict | None = None
+        self._undo_stack: list[_UndoRecord] = []
+
+    def _hand_rng(self, hand_number: int) -> random.Random:
+        return random.Random(f"{self.seed}:{hand_number}")
 
     def _deal_cards(self) -> None:
         self.deck.deal(self.players)
@@ -65,7 +117,9 @@ class Game:
                 ) from exc
 
     def apply_pass(self, player_idx: int) -> None:
-        LOGGER.info("Applying pass for player %s", player_idx)
+        self.last_hand_summary = None
+        if not self.state.quiet:
+            LOGGER.info("Applying pass for player %s", player_idx)
         if player_idx not in self.state.passed_players:
             self.state.add_passed_player(player_idx)
         if self.state.has_all_passed():
@@ -74,8 +128,22 @@ class Game:
         self._handle_player_gone_out(player_idx=player_idx)
 
     def apply_play(self, player_idx: int, play: Play) -> None:
-        LOGGER.info("Applying play for player %s: %s", player_idx, play["cards"])
+        if not self.state.quiet:
+            LOGGER.info(
+                "Applying play for player %s: %s",
+                player_idx,
+                lazy(lambda: " ".join(c.image_code for c in play["cards"])),
+            )
+        self.last_hand_summary = None
         self._pop_cards_from_hand(player_idx=player_idx, cards=play["cards"])
+        # A bomb beats a pile of another type; leading one is a normal play
+        pile_type = self.state.current_play_type
+        if play["play_type"] in _BOMB_TYPES and pile_type not in (
+            PlayType.OPEN,
+            play["play_type"],
+        ):
+            self.players[player_idx].bombs_played += 1
+            self.state.add_bomb(player_idx)
         if self.state.current_leader is None:
             self.state.set_current_leader(player_idx)
         if self.state.current_play_type == PlayType.OPEN:
@@ -86,6 +154,101 @@ class Game:
         self.state.increment_turn_number()
         self._handle_player_gone_out(player_idx=player_idx)
 
+    # ------------------------------------------------------------------
+    # Undoable moves (search / simulation)
+    # ------------------------------------------------------------------
+
+    @property
+    def undo_depth(self) -> int:
+        """Number of moves that can currently be rolled back."""
+        return len(self._undo_stack)
+
+    def push_play(self, player_idx: int, play: Play) -> None:
+        """Same as :meth:`apply_play` but the move can be reverted with :meth:`undo`."""
+        record = self._make_undo_record(player_idx=player_idx)
+        try:
+            self.apply_play(player_idx=player_idx, play=play)
+        except Exception:
+            self._restore_undo_record(record)
+            raise
+        self._undo_stack.append(record)
+
+    def push_pass(self, player_idx: int) -> None:
+        """Same as :meth:`apply_pass` but the move can be reverted with :meth:`undo`."""
+        record = self._make_undo_record(player_idx=player_idx)
+        try:
+            self.apply_pass(player_idx=player_idx)
+        except Exception:
+            self._restore_undo_record(record)
+            raise
+        self._undo_stack.append(record)
+
+    def undo(self) -> None:
+        """Revert the most recent :meth:`push_play` / :meth:`push_pass`."""
+        if not self._undo_stack:
+            raise IndexError("Nothing to undo")
+        self._restore_undo_record(self._undo_stack.pop())
+
+    def _make_undo_record(self, player_idx: int) -> _UndoRecord:
+        state = self.state
+        return _UndoRecord(
+            player_idx=player_idx,
+            hand_cards=tuple(self.players[player_idx].hand),
+            bombs_played=self.players[player_idx].bombs_played,
+            hands=tuple(p.hand for p in self.players),
+            placement_lens=tuple(len(p.placements) for p in self.players),
+            turn_order=state.current_turn_order,
+            turn_order_items=tuple(state.current_turn_order),
+            turn_number=state.turn_number,
+            hand_number=state.hand_number,
+            current_leader=state.current_leader,
+            current_play_type=state.current_play_type,
+            last_play=state.last_play,
+            play_pile=state.current_play_pile,
+            play_pile_len=len(state.current_play_pile),
+            passed_players=state.passed_players,
+            passed_players_len=len(state.passed_players),
+            placements_this_hand=state.placements_this_hand,
+            placements_this_hand_len=len(state.placements_this_hand),
+            hand_start_turn=state.hand_start_turn,
+            bombs_this_hand=state.bombs_this_hand,
+            bombs_this_hand_items=tuple(state.bombs_this_hand),
+            last_hand_summary=self.last_hand_summary,
+            deck=self.deck,
+        )
+
+    def _restore_undo_record(self, record: _UndoRecord) -> None:
+        state = self.state
+        for player, hand, placements_len in zip(
+            self.players, record.hands, record.placement_lens
+        ):
+            player.hand = hand
+            del player.placements[placements_len:]
+        record.hands[record.player_idx][:] = record.hand_cards
+        self.players[record.player_idx].bombs_played = record.bombs_played
+
+        record.turn_order[:] = record.turn_order_items
+        self.current_turn_order = record.turn_order
+        state.current_turn_order = record.turn_order
+
+        del record.play_pile[record.play_pile_len :]
+        del record.passed_players[record.passed_players_len :]
+        del record.placements_this_hand[record.placements_this_hand_len :]
+        state.current_play_pile = record.play_pile
+        state.passed_players = record.passed_players
+        state.placements_this_hand = record.placements_this_hand
+        record.bombs_this_hand[:] = record.bombs_this_hand_items
+        state.bombs_this_hand = record.bombs_this_hand
+        state.hand_start_turn = record.hand_start_turn
+        self.last_hand_summary = record.last_hand_summary
+
+        state.turn_number = record.turn_number
+        state.hand_number = record.hand_number
+        state.current_leader = record.current_leader
+        state.current_play_type = record.current_play_type
+        state.last_play = record.last_play
+        self.deck = record.deck
+
     # ------------------------------------------------------------------
     # Serialisation helpers
     # ------------------------------------------------------------------
@@ -98,9 +261,15 @@ class Game:
         }
 
     def to_full_dict(self) -> dict:
-        """Return internal serialisation (includes bot hands)."""
+        """Return internal serialisation (includes bot hands and the seed)."""
         return {
             "id": self.id,
+            "seed": self.seed,
+            "cfg": {
+                "times_shuffled": self.cfg.times_shuffled,
+                "deck_count": self.cfg.deck_count,
+                "players_count": self.cfg.players_count,
+            },
             "state": self.state.to_full_dict(),
         }
 
@@ -123,7 +292,8 @@ class Game:
         ):
             return  # nothing to do
 
-        LOGGER.info("Handling player %s going out", player_idx)
+        if not self.state.quiet:
+            LOGGER.info("Handling player %s going out", player_idx)
         self.state.add_placement(player_idx)  # 1
         rank = len(self.state.placements_this_hand)
         self.players[player_idx].placements.append(rank)  # 2
@@ -139,22 +309,29 @@ class Game:
             self.players[last_idx].placements.append(
                 len(self.state.placements_this_hand)
             )
-            LOGGER.info(
-                "This game has ended - there is only one player with cards left",
-                extra={
-                    "game_id": self.id,
-                    "placements": self.state.placements_this_hand,
-                    "game_state": self.state.to_full_dict(),
-                },
-            )
+            if not self.state.quiet:
+                LOGGER.info(
+                    "This game has ended - there is only one player with cards left",
+                    extra={
+                        "game_id": self.id,
+                        "placements": self.state.placements_this_hand,
+                        "game_state": lazy(self.state.to_log_summary),
+                    },
+                )
+            self.last_hand_summary = self.state.to_hand_summary()
             self._start_new_hand()
         # else:
         # pass  # TODO: handle player going out in the middle of a hand
 
     def _start_new_hand(self) -> None:
-        LOGGER.info("Starting a new hand", extra={"game_id": self.id})
+        if not self.state.quiet:
+            LOGGER.info("Starting a new hand", extra={"game_id": self.id})
         self.state.handle_new_hand()
-        self.deck = Deck(self.cfg)
+        self.deck = Deck(self.cfg, rng=self._hand_rng(self.state.hand_number))
+        # Fresh hand lists: the loser's leftover cards must not carry over,
+        # and the previous lists stay intact for ``undo``.
+        for p in self.players:
+            p.hand = []
         self._deal_cards()
         self.current_turn_order = self._determine_initial_turn_order()
         self.state.current_turn_order = self.current_turn_order
@@ -165,7 +342,7 @@ class Game:
     # ------------------------------------------------------------------
 
     @classmethod
-    def from_state_dict(cls, data: dict) -> "Game":
+    def from_state_dict(cls, data: dict, *, trusted: bool = False) -> "Game":
         """Rebuild a *Game* instance from the cached state dictionary.
 
         This helper bypasses the normal constructor and instead recreates
@@ -174,35 +351,42 @@ class Game:
         ``players``, ``state`` and ``current_turn_order``) are reinstated.
         The deck itself is **not** reconstructed because it is not needed
         once the initial hands have been dealt and play has begun.
+
+        With ``trusted=True`` *data* must be a freshly decoded state the
+        server wrote itself: cards are looked up in the interned set instead
+        of being constructed and validated, and its lists are adopted
+        without copying.
         """
         # ------------------------------------------------------------------
         # Re-build the domain objects encoded in *data*
         # ------------------------------------------------------------------
+        if trusted:
+            interned = INTERNED_CARDS
+
+            def to_cards(raw: list[dict]) -> list[Card]:
+                return [interned[(c["suit"], c["rank"])] for c in raw]
+
+        else:
+
+            def to_cards(raw: list[dict]) -> list[Card]:
+                return [Card(suit=c["suit"], rank=c["rank"]) for c in raw]
+
         state = data["state"]
         players: list[Human | Bot] = []
         for player_dict in state["players_state"]:
-            hand: list[Card] = [
-                Card(suit=c["suit"], rank=c["rank"])
-                for c in player_dict.get("hand", [])
-            ]
-            if not player_dict["is_bot"]:
-                players.append(
-                    Human(
-                        player_index=player_dict["player_index"],
-                        is_bot=player_dict["is_bot"],
-                        id=player_dict["id"],
-                        hand=hand,
-                    )
-                )
-            else:
-                players.append(
-                    Bot(
-                        player_index=player_dict["player_index"],
-                        is_bot=player_dict["is_bot"],
-                        id=player_dict["id"],
-                        hand=hand,
-                    )
+            placements = player_dict.get("placements", [])
+            player_cls = Bot if player_dict["is_bot"] else Human
+            players.append(
+                player_cls(
+                    player_index=player_dict["player_index"],
+                    is_bot=player_dict["is_bot"],
+                    id=player_dict["id"],
+                    hand=to_cards(player_dict.get("hand", [])),
+                    score=player_dict.get("score", 0),
+                    placements=placements if trusted else list(placements),
+                    bombs_played=player_dict.get("bombs_played", 0),
                 )
+            )
 
         game_state = GameState(
             players_state=players,
@@ -210,18 +394,15 @@ class Game:
             turn_number=state["turn_number"],
             current_leader=state["current_leader"],
             hand_number=state["hand_number"],
-            current_play_pile=[
-                Card(suit=c["suit"], rank=c["rank"]) for c in state["current_play_pile"]
-            ],
+            current_play_pile=to_cards(state["current_play_pile"]),
             current_play_type=state["current_play_type"],
             passed_players=state["passed_players"],
             placements_this_hand=state["placements_this_hand"],
+            hand_start_turn=state.get("hand_start_turn", 1),
+            bombs_this_hand=state.get("bombs_this_hand", []),
             last_play=(
                 {
-                    "cards": [
-                        Card(suit=c["suit"], rank=c["rank"])
-                        for c in state["last_play"]["cards"]
-                    ],
+                    "cards": to_cards(state["last_play"]["cards"]),
                     "play_type": state["last_play"]["play_type"],
                 }
                 if state.get("last_play")
@@ -235,12 +416,17 @@ class Game:
         # ------------------------------------------------------------------
         game = cls.__new__(cls)
         game.id = data["id"]
-        game.cfg = DeckConfig()
+        # States cached before seeds were recorded keep a fresh one; only
+        # deals from now on derive from it.
+        game.seed = data.get("seed", random.getrandbits(63))
+        game.cfg = DeckConfig(**data["cfg"]) if "cfg" in data else DeckConfig()
         game.players = players
         game.deck = None  # deck not required post-deal
         game.current_turn_order = state["current_turn_order"]
         game.state = game_state
         game.rules = Rules(engine=game)
+        game.last_hand_summary = None
+        game._undo_stack = []
         return game
 
 
@@ -4,6 +4,7 @@ from thirteen_backend.domain.card import Card
 from thirteen_backend.domain.player import Bot, Human
 from thirteen_backend.logger import LOGGER
 from thirteen_backend.types import Play, PlayType
+from thirteen_backend.utils.log_utils import lazy
 
 
 @dataclass(slots=True)
@@ -23,6 +24,10 @@ class GameState:
         default_factory=list
     )  # seat idx of players who have finished this hand
     last_play: Play | None = None
+    hand_start_turn: int = 1  # turn_number of the first move of this hand
+    bombs_this_hand: list[int] = field(default_factory=list)  # per seat
+    # Suppresses per-move logging, e.g. while replaying an event log
+    quiet: bool = field(default=False, repr=False, compare=False)
 
     def has_all_passed(self) -> bool:
         return len(self.passed_players) == len(self.players_state) - 1
@@ -32,6 +37,13 @@ class GameState:
             if idx not in self.passed_players:
                 return idx
 
+    def get_current_seat(self) -> int:
+        """Seat index of the player whose turn it is."""
+        # -1 because turn_number is 1-indexed
+        return self.current_turn_order[
+            (self.turn_number - 1) % len(self.current_turn_order)
+        ]
+
     def get_player_idx_by_id(self, player_id: str) -> int:
         for p in self.players_state:
             if p.id == player_id:
@@ -62,6 +74,13 @@ class GameState:
     def add_passed_player(self, player_idx: int) -> None:
         self.passed_players.append(player_idx)
 
+    def add_bomb(self, player_idx: int) -> None:
+        if len(self.bombs_this_hand) <= player_idx:
+            self.bombs_this_hand.extend(
+                [0] * (player_idx + 1 - len(self.bombs_this_hand))
+            )
+        self.bombs_this_hand[player_idx] += 1
+
     def add_placement(self, player_idx: int) -> None:
         self.placements_this_hand.append(player_idx)
 
@@ -84,33 +103,37 @@ class GameState:
         self.last_play = None
 
     def handle_new_lead(self, player_idx: int) -> None:
-        LOGGER.info(
-            "Handling new lead for player %s",
-            player_idx,
-            extra={
-                "passed_players": self.passed_players,
-                "current_play_type": self.current_play_type,
-                "current_leader": self.current_leader,
-                "current_turn_order": self.current_turn_order,
-            },
-        )
+        if not self.quiet:
+            LOGGER.info(
+                "Handling new lead for player %s",
+                player_idx,
+                extra={
+                    "passed_players": self.passed_players,
+                    "current_play_type": self.current_play_type,
+                    "current_leader": self.current_leader,
+                    "current_turn_order": self.current_turn_order,
+                },
+            )
         self.reset_passed_players()
         self.reset_current_play_pile()
         self.reset_current_play_type()
         self.set_current_leader(player_idx)
 
     def handle_new_hand(self) -> None:
-        LOGGER.info(
-            "Game has ended - starting new hand",
-            extra={
-                "game_id": self.game_id,
-                "hand_number": self.hand_number,
-                "placements": self.placements_this_hand,
-                "turn_number": self.turn_number,
-                "game_state": self.to_public_dict(),
-            },
-        )
+        if not self.quiet:
+            LOGGER.info(
+                "Game has ended - starting new hand",
+                extra={
+                    "game_id": self.game_id,
+                    "hand_number": self.hand_number,
+                    "placements": self.placements_this_hand,
+                    "turn_number": self.turn_number,
+                    "game_state": lazy(self.to_log_summary),
+                },
+            )
         self.increment_hand_number()
+        self.hand_start_turn = self.turn_number
+        self.bombs_this_hand = []
         self.reset_passed_players()
         self.reset_placements()
         self.reset_current_play_pile()
@@ -135,6 +158,8 @@ class GameState:
             "current_play_type": self.current_play_type,
             "passed_players": self.passed_players,
             "placements_this_hand": self.placements_this_hand,
+            "hand_start_turn": self.hand_start_turn,
+            "bombs_this_hand": self.bombs_this_hand,
             "num_passed_players": len(self.passed_players),
             "last_play": (
                 {
@@ -146,6 +171,42 @@ class GameState:
             ),
         }
 
+    def to_hand_summary(self) -> dict:
+        """Return the result of the hand that just finished (call before
+        :meth:`handle_new_hand` resets it)."""
+        return {
+            "hand_number": self.hand_number,
+            "placements": {
+                str(seat): place
+                for place, seat in enumerate(self.placements_this_hand, start=1)
+            },
+            "turns": self.turn_number - self.hand_start_turn,
+            "bombs": {
+                str(seat): count
+                for seat, count in enumerate(self.bombs_this_hand)
+                if count
+            },
+        }
+
+    def to_log_summary(self) -> dict:
+        """Return a compact, card-light view of the state for log records."""
+        return {
+            "hand_number": self.hand_number,
+            "turn_number": self.turn_number,
+            "current_leader": self.current_leader,
+            "current_turn_order": list(self.current_turn_order),
+            "current_play_type": self.current_play_type,
+            "pile_size": len(self.current_play_pile),
+            "last_play": (
+                [c.image_code for c in self.last_play["cards"]]
+                if self.last_play
+                else None
+            ),
+            "passed_players": list(self.passed_players),
+            "placements_this_hand": list(self.placements_this_hand),
+            "hand_counts": [len(p.hand) for p in self.players_state],
+        }
+
     def to_full_dict(self) -> dict:
         """Return **internal** representation – includes bot hands."""
         return {
@@ -160,6 +221,8 @@ class GameState:
             "num_passed_players": len(self.passed_players),
             "passed_players": self.passed_players,
             "placements_this_hand": self.placements_this_hand,
+            "hand_start_turn": self.hand_start_turn,
+            "bombs_this_hand": self.bombs_this_hand,
             "last_play": (
                 {
                     "cards": [c.to_dict() for c in self.last_play["cards"]],
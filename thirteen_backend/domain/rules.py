@@ -7,12 +7,30 @@ from thirteen_backend.domain.card import Card
 from thirteen_backend.domain.classify import classify
 from thirteen_backend.domain.constants import RANK_ORDER, SUIT_ORDER
 from thirteen_backend.logger import LOGGER
+from thirteen_backend.tracing import TRACER
 
 if TYPE_CHECKING:
     from thirteen_backend.domain.game import Game
 
 from thirteen_backend.types import Play, PlayType
 
+# Play types that may be laid on a pile of the given type. Quartets beat
+# anything, double sequences additionally bomb singles (see README "Bombs").
+_ALLOWED_RESPONSES: dict[PlayType, frozenset[PlayType]] = {
+    PlayType.SINGLE: frozenset(
+        {PlayType.SINGLE, PlayType.DOUBLE_SEQUENCE, PlayType.QUARTET}
+    ),
+    PlayType.PAIR: frozenset({PlayType.PAIR, PlayType.QUARTET}),
+    PlayType.TRIPLET: frozenset({PlayType.TRIPLET, PlayType.QUARTET}),
+    PlayType.SEQUENCE: frozenset({PlayType.SEQUENCE, PlayType.QUARTET}),
+    PlayType.DOUBLE_SEQUENCE: frozenset({PlayType.DOUBLE_SEQUENCE, PlayType.QUARTET}),
+    PlayType.QUARTET: frozenset({PlayType.QUARTET}),
+}
+
+
+class InvalidPlayError(ValueError):
+    """Raised when a submitted play is not legal in the current game state."""
+
 
 class Rules:
     def __init__(self, engine: Game):
@@ -33,9 +51,6 @@ class Rules:
         hand = self.engine.state.players_state[player_idx].hand
         current_play_type = self.engine.state.current_play_type
         last_play = self.engine.state.last_play
-        print(f"hand: {hand}")
-        print(f"current_play_type: {current_play_type}")
-        print(f"last_play: {last_play}")
 
         if not self._can_play(
             hand=hand,
@@ -44,12 +59,98 @@ class Rules:
         ):
             return None
 
-        return self._make_valid_plays(
+        plays = self._make_valid_plays(
             hand=hand,
             current_play_type=current_play_type,
             turn_number=self.engine.state.turn_number,
             last_play=last_play,
         )
+        if TRACER.enabled:
+            TRACER.trace(
+                "rules.valid_plays",
+                session_id=self.engine.state.game_id,
+                player_idx=player_idx,
+                hand=[c.image_code for c in hand],
+                current_play_type=current_play_type,
+                last_play=(
+                    [c.image_code for c in last_play["cards"]] if last_play else None
+                ),
+                valid_play_count=len(plays),
+            )
+        return plays
+
+    def validate_play(self, player_idx: int, cards: list[Card]) -> Play:
+        """Check a *submitted* play and return it as a classified ``Play``.
+
+        Unlike :meth:`get_valid_plays` this never enumerates the hand: the
+        cards are classified once and compared against the pile by strength,
+        so the cost is linear in the number of cards involved.
+
+        The accepted set is a deliberate superset of :meth:`get_valid_plays`.
+        Sequences and double sequences may mix suits freely (see README
+        "Valid Card Plays"), but the hint list only offers the weakest-suit
+        card of each rank to keep it small. A player may still submit any
+        suit combination, e.g. a higher top card to beat the pile.
+
+        Raises
+        ------
+        InvalidPlayError
+            If the play is malformed, not held by the player or cannot be laid
+            on the current pile.
+        """
+        state = self.engine.state
+        if player_idx in state.passed_players:
+            raise InvalidPlayError("Player has already passed on this pile")
+
+        if not cards:
+            raise InvalidPlayError("A play must contain at least one card")
+        if len(set(cards)) != len(cards):
+            raise InvalidPlayError("A card may only be played once")
+
+        hand = state.players_state[player_idx].hand
+        held = set(hand)
+        if any(c not in held for c in cards):
+            raise InvalidPlayError("Played cards are not in the player's hand")
+
+        cls = classify(cards)
+        if cls is None:
+            raise InvalidPlayError("Cards do not form a valid combination")
+        play_type, strength = cls
+
+        current_play_type = state.current_play_type
+        last_play = state.last_play
+
+        if current_play_type == PlayType.OPEN:
+            if state.turn_number == 1 and not any(
+                c.rank == "3" and c.suit == "D" for c in cards
+            ):
+                raise InvalidPlayError("The opening play must include the 3♦")
+            return Play(cards=cards, play_type=play_type)
+
+        if not self._can_play(
+            hand=hand,
+            current_play_type=current_play_type,
+            last_play=last_play,
+        ):
+            raise InvalidPlayError("No play is possible on the current pile")
+
+        if play_type not in _ALLOWED_RESPONSES.get(current_play_type, ()):
+            raise InvalidPlayError(
+                f"A {play_type} cannot be played on a {current_play_type} pile"
+            )
+        if (
+            current_play_type == PlayType.SEQUENCE
+            and play_type == PlayType.SEQUENCE
+            and last_play is not None
+            and len(cards) != len(last_play["cards"])
+        ):
+            raise InvalidPlayError("Sequences must match the length of the pile")
+
+        prev_cls = classify(last_play["cards"]) if last_play else None
+        if prev_cls is not None and strength <= prev_cls[1]:
+            raise InvalidPlayError("Play does not beat the current pile")
+
+        return Play(cards=cards, play_type=play_type)
 
     def _make_valid_plays(
         self,
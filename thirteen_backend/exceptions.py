@@ -8,3 +8,31 @@ def game_state_not_found(game_id: str) -> HTTPException:
         status_code=status.HTTP_404_NOT_FOUND,
         detail=f"Game state not found for session {game_id}",
     )
+
+
+def websocket_session_not_found(session_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"No WebSocket connections for session {session_id}",
+    )
+
+
+def admin_forbidden() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Admin token missing or invalid",
+    )
+
+
+def profiler_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="A profile is already running on this worker",
+    )
+
+
+def invalid_profile_request(max_seconds: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"seconds must be in (0, {max_seconds}] and interval_ms in [1, 1000]",
+    )
@@ -1,4 +1,5 @@
 import logging
+import logging.config
 import os
 
 from thirteen_backend.config import ENV
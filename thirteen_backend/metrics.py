@@ -1,4 +1,20 @@
-from prometheus_client import Counter, Gauge, Histogram
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    ProcessCollector,
+    make_asgi_app,
+    multiprocess,
+)
+
+from thirteen_backend import config
+from thirteen_backend.models.game_event_model import GameEventType
 
 REQUEST_COUNT = Counter(
     "http_request_total", "Total HTTP Requests", ["method", "path", "status"]
@@ -13,56 +29,204 @@ REQUEST_DURATION = Histogram(
 
 GAME_COUNT = Counter("game_count", "Total Games")
 
-CPU_USAGE = Gauge("cpu_usage", "CPU Usage", ["game_id"])
-
-MEMORY_USAGE = Gauge("memory_usage", "Memory Usage", ["game_id"])
-
+# WebSocket metrics are aggregated across sessions – a per-session label would
+# add series that are never removed. Per-session numbers are served on demand
+# by ``GET /ws/{session_id}/stats`` instead.
 WEBSOCKET_CONNECTIONS = Gauge(
     "websocket_connections",
     "Number of active WebSocket connections",
-    ["session_id"],
+    multiprocess_mode="livesum",
 )
 
 WEBSOCKET_MESSAGE_COUNT = Counter(
     "websocket_message_total",
-    "Total WebSocket messages sent",
-    ["session_id", "direction"],
+    "Total WebSocket messages sent and received",
+    ["direction", "message_type"],
 )
 
+# Message types that get their own label value; anything else is "other"
+WEBSOCKET_MESSAGE_TYPES = frozenset({*GameEventType, "READY", "PING", "RESYNC"})
+
 GAME_EVENT_COUNT = Counter(
     "game_event_total",
     "Total game events processed",
     ["event_type"],
 )
 
+# Move pipeline latency. Buckets span sub-millisecond engine work up to slow
+# Redis round trips; observations carry the session id as an exemplar.
+MOVE_LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+)
+
+MOVE_STAGE_DURATION = Histogram(
+    "move_stage_duration_seconds",
+    "Time spent in one stage of the move pipeline",
+    ["stage"],
+    buckets=MOVE_LATENCY_BUCKETS,
+)
+
+MOVE_DURATION = Histogram(
+    "move_duration_seconds",
+    "Time to process one move, from loading state to broadcast",
+    ["actor"],
+    buckets=MOVE_LATENCY_BUCKETS,
+)
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Delay between a scheduled event-loop wakeup and when it ran",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+EVENT_LOOP_SLOW_CALLBACKS = Counter(
+    "event_loop_slow_callbacks_total",
+    "Times a single event-loop step ran longer than the slow callback threshold",
+)
+
+EVENT_FLUSH_COUNT = Counter(
+    "game_event_flushed_total",
+    "Total buffered game events written to Postgres",
+)
+
+EVENT_FLUSH_LAG = Histogram(
+    "game_event_flush_lag_seconds",
+    "Age of a game event when it is written to Postgres",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+)
+
+EVENT_DEFER_DROPPED = Counter(
+    "game_event_deferred_dropped_total",
+    "Deferred events dropped because their session row never reached Postgres",
+    ["group"],
+)
+
+EVENT_STREAMS_ACTIVE = Gauge(
+    "game_event_streams_active",
+    "Session event streams currently registered in Redis",
+    # Every worker sees the same Redis registry – report the latest reading
+    multiprocess_mode="livemostrecent",
+)
+
+# Multiprocess mode only exposes what workers write to the shared directory,
+# not the default process_* collector – workers publish these instead.
+WORKER_CPU_SECONDS = Gauge(
+    "worker_process_cpu_seconds",
+    "CPU time (user + system) used by a worker process",
+    # One series per live worker, so rate() survives worker restarts
+    multiprocess_mode="liveall",
+)
+
+WORKER_RESIDENT_MEMORY = Gauge(
+    "worker_process_resident_memory_bytes",
+    "Resident memory of the live worker processes",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured number of persistent connections in the SQLAlchemy pool",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Database connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Database connections open beyond the pool size",
+    multiprocess_mode="livesum",
+)
+
+DB_CONNECTIONS_OPENED = Counter(
+    "db_connections_opened_total",
+    "New database connections opened by the pool",
+)
+
+
+# ---------------------------------------------------------------------------
+# Exposition
+# ---------------------------------------------------------------------------
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Return the registry ``/metrics`` should expose.
+
+    Under gunicorn every worker has its own in-memory metrics, so with
+    ``PROMETHEUS_MULTIPROC_DIR`` set the values are written to per-process
+    files in that directory (see ``gunicorn.conf.py``) and a fresh registry
+    aggregates them on each scrape.
+    """
+    if not config.PROMETHEUS_MULTIPROC_DIR:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=config.PROMETHEUS_MULTIPROC_DIR)
+    return registry
+
+
+_PROCESS_COLLECTOR = ProcessCollector(registry=None)
+
+
+def update_process_metrics() -> None:
+    """Copy this process's CPU and RSS readings into the worker gauges
+    (no-op where ``/proc`` is unavailable)."""
+    samples = {
+        sample.name: sample.value
+        for metric in _PROCESS_COLLECTOR.collect()
+        for sample in metric.samples
+    }
+    if "process_cpu_seconds_total" in samples:
+        WORKER_CPU_SECONDS.set(samples["process_cpu_seconds_total"])
+    if "process_resident_memory_bytes" in samples:
+        WORKER_RESIDENT_MEMORY.set(samples["process_resident_memory_bytes"])
+
+
+def make_metrics_app():
+    return make_asgi_app(registry=metrics_registry())
+
 
 # ---------------------------------------------------------------------------
 # WebSocket helpers
 # ---------------------------------------------------------------------------
 
 
-def increment_ws_connections(session_id: str) -> None:
-    """Increase the active WebSocket connection count for *session_id*."""
-    WEBSOCKET_CONNECTIONS.labels(session_id=session_id).inc()
+def increment_ws_connections() -> None:
+    WEBSOCKET_CONNECTIONS.inc()
 
 
-def decrement_ws_connections(session_id: str) -> None:
-    """Decrease the active WebSocket connection count for *session_id*."""
-    WEBSOCKET_CONNECTIONS.labels(session_id=session_id).dec()
+def decrement_ws_connections() -> None:
+    WEBSOCKET_CONNECTIONS.dec()
 
 
-def increment_ws_messages(session_id: str, direction: str) -> None:
+def increment_ws_messages(direction: str, message_type: Any) -> None:
     """Increment the WebSocket message counter.
 
     Parameters
     ----------
-    session_id:
-        The game/session identifier.
     direction:
-        Either ``broadcast`` or ``direct`` depending on how the message was
-        delivered.
+        ``broadcast`` or ``direct`` for messages sent, ``inbound`` for
+        messages received from a client.
+    message_type:
+        The message's ``type``; unknown or missing types are counted as
+        ``other`` so client input cannot create new series.
     """
-    WEBSOCKET_MESSAGE_COUNT.labels(session_id=session_id, direction=direction).inc()
+    if not isinstance(message_type, str) or message_type not in WEBSOCKET_MESSAGE_TYPES:
+        message_type = "other"
+    WEBSOCKET_MESSAGE_COUNT.labels(direction=direction, message_type=message_type).inc()
 
 
 def track_request(method: str, path: str, status: int) -> None:
@@ -82,3 +246,80 @@ def increment_game_count() -> None:
 def increment_game_event(event_type: str) -> None:
     """Increment the counter for the supplied *event_type*."""
     GAME_EVENT_COUNT.labels(event_type=event_type).inc()
+
+
+# ---------------------------------------------------------------------------
+# Move pipeline helpers
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def time_move_stage(stage: str, session_id: str) -> Iterator[None]:
+    """Observe the duration of the enclosed block as move stage *stage*.
+
+    Stages: ``load``, ``decide``, ``apply``, ``persist``, ``hints`` and
+    ``broadcast``.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        MOVE_STAGE_DURATION.labels(stage=stage).observe(
+            time.perf_counter() - start, exemplar={"session_id": str(session_id)}
+        )
+
+
+def track_move_duration(actor: str, session_id: str, duration: float) -> None:
+    """Record the total duration of one accepted ``human`` or ``bot`` move."""
+    MOVE_DURATION.labels(actor=actor).observe(
+        duration, exemplar={"session_id": str(session_id)}
+    )
+
+
+# ---------------------------------------------------------------------------
+# Event loop helpers
+# ---------------------------------------------------------------------------
+
+
+def observe_event_loop_lag(lag: float) -> None:
+    EVENT_LOOP_LAG.observe(lag)
+
+
+def increment_event_loop_slow_callbacks() -> None:
+    EVENT_LOOP_SLOW_CALLBACKS.inc()
+
+
+# ---------------------------------------------------------------------------
+# Event flusher helpers
+# ---------------------------------------------------------------------------
+
+
+def track_events_flushed(count: int, lags: list[float]) -> None:
+    """Record *count* flushed events and their age (seconds) at flush time."""
+    EVENT_FLUSH_COUNT.inc(count)
+    for lag in lags:
+        EVENT_FLUSH_LAG.observe(lag)
+
+
+def increment_deferred_events_dropped(group: str, count: int) -> None:
+    EVENT_DEFER_DROPPED.labels(group=group).inc(count)
+
+
+def set_active_event_streams(count: int) -> None:
+    EVENT_STREAMS_ACTIVE.set(count)
+
+
+# ---------------------------------------------------------------------------
+# Database pool helpers
+# ---------------------------------------------------------------------------
+
+
+def set_db_pool_usage(size: int, checked_out: int, overflow: int) -> None:
+    """Publish the connection pool utilisation (updated on checkout/checkin)."""
+    DB_POOL_SIZE.set(size)
+    DB_POOL_CHECKED_OUT.set(checked_out)
+    DB_POOL_OVERFLOW.set(overflow)
+
+
+def increment_db_connections_opened() -> None:
+    DB_CONNECTIONS_OPENED.inc()
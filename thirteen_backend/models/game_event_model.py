@@ -3,7 +3,7 @@ from enum import StrEnum
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -20,17 +20,30 @@ class GameEventType(StrEnum):
     FINISH = "FINISH"
     INIT = "INIT"
     STATE_SYNC = "STATE_SYNC"
+    STATE_DELTA = "STATE_DELTA"
+    ERROR = "ERROR"
 
 
 class GameEvent(Base):
+    """One entry of a session's event log.
+
+    The table is range-partitioned by month on ``ts`` (see
+    :mod:`thirteen_backend.repositories.game_event_partition_repository`), so every
+    unique key – including the primary key – has to include ``ts``.
+    """
+
     __tablename__ = "game_events"
+    __table_args__ = (
+        UniqueConstraint("game_id", "seq", "ts", name="uq_game_events_game_id_seq_ts"),
+        {"postgresql_partition_by": "RANGE (ts)"},
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     seq: Mapped[int] = mapped_column(Integer, nullable=False)
     turn: Mapped[int] = mapped_column(Integer, nullable=False)
     type: Mapped[GameEventType] = mapped_column(String(20), nullable=False)
     payload: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
-    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
 
     # relationships
     game_id: Mapped[UUID] = mapped_column(ForeignKey("game_sessions.id"))
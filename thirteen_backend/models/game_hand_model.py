@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from thirteen_backend.models import Base
+
+
+class GameHand(Base):
+    """Compact result of one completed hand of a game session."""
+
+    __tablename__ = "game_hands"
+    __table_args__ = (
+        UniqueConstraint(
+            "game_id", "hand_number", name="uq_game_hands_game_id_hand_number"
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    hand_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    # seat (as string) → finishing place, e.g. {"2": 1, "0": 2, ...}
+    placements: Mapped[dict[str, int]] = mapped_column(JSONB, nullable=False)
+    turns: Mapped[int] = mapped_column(Integer, nullable=False)
+    # seat (as string) → bombs played this hand; seats without bombs omitted
+    bombs: Mapped[dict[str, int]] = mapped_column(JSONB, nullable=False)
+    ended_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    # relationships
+    game_id: Mapped[UUID] = mapped_column(ForeignKey("game_sessions.id"))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": str(self.id),
+            "game_id": str(self.game_id),
+            "hand_number": self.hand_number,
+            "placements": self.placements,
+            "turns": self.turns,
+            "bombs": self.bombs,
+            "ended_at": self.ended_at.isoformat(),
+        }
@@ -0,0 +1,156 @@
+"""Monthly range partitions of the ``game_events`` table.
+
+Each partition holds the events of one calendar month (UTC) and is named
+``game_events_pYYYYMM``. Partitions are created ahead of time and whole
+months past the retention window are detached and dropped, which costs a
+catalog update instead of a mass ``DELETE`` followed by vacuum. Events for a
+month without a partition land in ``game_events_default`` instead of failing
+to insert.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+PARENT_TABLE = "game_events"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+_PREFIX = f"{PARENT_TABLE}_p"
+_COLUMNS = "id, seq, turn, type, payload, ts, game_id"
+# Serialises maintenance across workers (arbitrary, app-wide constant)
+_ADVISORY_LOCK_KEY = 0x6E5E_0040
+
+
+def month_start(ts: datetime) -> datetime:
+    """Return the first instant (UTC) of the month containing *ts*."""
+    ts = ts.astimezone(timezone.utc)
+    return datetime(ts.year, ts.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{_PREFIX}{month:%Y%m}"
+
+
+def partition_month(name: str) -> datetime | None:
+    """Inverse of :func:`partition_name`; ``None`` for foreign tables."""
+    if not name.startswith(_PREFIX):
+        return None
+    try:
+        return datetime.strptime(name[len(_PREFIX) :], "%Y%m").replace(
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+def expired_partitions(names: list[str], cutoff: datetime) -> list[str]:
+    """Return the partitions in *names* whose whole month is before *cutoff*."""
+    return sorted(
+        name
+        for name in names
+        if (month := partition_month(name)) is not None
+        and add_months(month, 1) <= cutoff
+    )
+
+
+async def lock_partition_maintenance(*, db_session: AsyncSession) -> None:
+    """Take a transaction-scoped lock so only one worker runs maintenance."""
+    await db_session.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY}
+    )
+
+
+async def create_game_event_partitions(
+    *, db_session: AsyncSession, start: datetime, months: int
+) -> list[str]:
+    """Create the partitions of *months* consecutive months from the month of
+    *start*, skipping those that exist. The caller owns the transaction.
+
+    PostgreSQL refuses to add a partition for a range the default partition
+    holds rows of, so each new month is built as a plain table, takes over
+    its rows from the default partition and is then attached.
+    """
+    existing = set(await list_game_event_partitions(db_session=db_session))
+    names = []
+    month = month_start(start)
+    for _ in range(months):
+        upper = add_months(month, 1)
+        name = partition_name(month)
+        if name not in existing:
+            await _attach_month_partition(
+                db_session=db_session, name=name, lower=month, upper=upper
+            )
+        names.append(name)
+        month = upper
+    return names
+
+
+async def _attach_month_partition(
+    *, db_session: AsyncSession, name: str, lower: datetime, upper: datetime
+) -> None:
+    await db_session.execute(
+        text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    await db_session.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE ts >= :lower AND ts < :upper RETURNING {_COLUMNS}) "
+            f"INSERT INTO {name} ({_COLUMNS}) SELECT {_COLUMNS} FROM moved"
+        ),
+        {"lower": lower, "upper": upper},
+    )
+    await db_session.execute(
+        text(
+            f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+    )
+
+
+async def list_game_event_partitions(*, db_session: AsyncSession) -> list[str]:
+    result = await db_session.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return [row[0] for row in result]
+
+
+async def drop_game_event_partitions_before(
+    *, db_session: AsyncSession, cutoff: datetime
+) -> list[str]:
+    """Detach and drop every partition that ends on or before *cutoff*.
+
+    Returns the dropped partition names. The caller owns the transaction.
+    """
+    names = expired_partitions(
+        await list_game_event_partitions(db_session=db_session), cutoff
+    )
+    for name in names:
+        await db_session.execute(
+            text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}")
+        )
+        await db_session.execute(text(f"DROP TABLE {name}"))
+    return names
+
+
+async def delete_default_partition_rows_before(
+    *, db_session: AsyncSession, cutoff: datetime
+) -> None:
+    """Delete the rows of the default partition older than *cutoff*, which
+    no partition drop would ever remove. The caller owns the transaction."""
+    await db_session.execute(
+        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE ts < :cutoff"),
+        {"cutoff": cutoff},
+    )
@@ -1,6 +1,9 @@
 from datetime import datetime, timezone
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid4
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from thirteen_backend.models.game_event_model import GameEvent, GameEventType
 
@@ -45,3 +48,45 @@ async def create_game_event(
     )
 
     return event
+
+
+def game_event_row_from_dict(data: dict[str, Any]) -> dict[str, Any]:
+    """Convert a buffered ``GameEvent.to_dict()`` payload back to column values."""
+    return {
+        "id": UUID(data["id"]),
+        "seq": data["seq"],
+        "turn": data["turn"],
+        "type": data["type"],
+        "payload": data["payload"],
+        "ts": datetime.fromisoformat(data["ts"]),
+        "game_id": UUID(data["game_id"]),
+    }
+
+
+async def bulk_insert_game_events(
+    *,
+    db_session: AsyncSession,
+    rows: list[dict[str, Any]],
+) -> None:
+    """Insert many ``game_events`` rows with a single multi-row ``INSERT``.
+
+    Rows that already exist for the same ``(game_id, seq, ts)`` are skipped,
+    which makes re-delivering a batch (at-least-once flushing) harmless: a
+    redelivered event carries its original ``ts``. ``ts`` is part of the key
+    because ``game_events`` is partitioned on it.
+
+    Parameters
+    ----------
+    db_session:
+        Active database session; the caller owns the transaction.
+    rows:
+        Column mappings as produced by :func:`game_event_row_from_dict`.
+    """
+    if not rows:
+        return
+    stmt = (
+        insert(GameEvent)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["game_id", "seq", "ts"])
+    )
+    await db_session.execute(stmt)
@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from thirteen_backend.models.game_hand_model import GameHand
+from thirteen_backend.models.game_session_model import GameSession
+
+
+def game_hand_row_from_event(event: dict[str, Any]) -> dict[str, Any]:
+    """Build a ``game_hands`` row from a buffered event carrying a
+    ``hand_summary`` (see :mod:`thirteen_backend.services.event_log`)."""
+    summary = event["payload"]["hand_summary"]
+    return {
+        "game_id": UUID(event["game_id"]),
+        "hand_number": summary["hand_number"],
+        "placements": summary["placements"],
+        "turns": summary["turns"],
+        "bombs": summary["bombs"],
+        "ended_at": datetime.fromisoformat(event["ts"]),
+    }
+
+
+async def bulk_insert_game_hands(
+    *,
+    db_session: AsyncSession,
+    rows: list[dict[str, Any]],
+) -> None:
+    """Insert many ``game_hands`` rows with a single multi-row ``INSERT``.
+
+    Hands already stored for the same ``(game_id, hand_number)`` are skipped.
+    The caller owns the transaction.
+    """
+    if not rows:
+        return
+    stmt = (
+        insert(GameHand)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["game_id", "hand_number"])
+    )
+    await db_session.execute(stmt)
+
+
+async def refresh_session_placements(
+    *,
+    db_session: AsyncSession,
+    game_ids: set[UUID],
+) -> None:
+    """Recompute ``game_sessions.placements`` from the stored hands.
+
+    The column becomes the list of per-hand placements ordered by hand
+    number. It is derived rather than appended to, so it stays correct when
+    hands are redelivered. The caller owns the transaction.
+    """
+    if not game_ids:
+        return
+    hands = (
+        select(
+            func.jsonb_agg(
+                aggregate_order_by(GameHand.placements, GameHand.hand_number)
+            )
+        )
+        .where(GameHand.game_id == GameSession.id)
+        .scalar_subquery()
+    )
+    await db_session.execute(
+        update(GameSession).where(GameSession.id.in_(game_ids)).values(placements=hands)
+    )
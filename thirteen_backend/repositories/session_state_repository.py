@@ -1,6 +1,12 @@
 import json
+import time
+from typing import Any, AsyncIterator
 
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import ResponseError
+
+from thirteen_backend import config
 
 # Domain models
 from thirteen_backend.domain.game import Game
@@ -27,8 +33,8 @@ def _make_session_state_key(game_id: str) -> str:
 
 def _make_session_event_key(game_id: str) -> str:
     """
-    Construct the Redis key representing the *list* that buffers game events
-    for the specified session.
+    Construct the Redis key of the *stream* that buffers game events for the
+    specified session.
 
     Parameters
     ----------
@@ -38,9 +44,47 @@ def _make_session_event_key(game_id: str) -> str:
     Returns
     -------
     str
-        Namespaced Redis key in the form ``session:{game_id}:events``.
+        Namespaced Redis key in the form ``session:{game_id}:event-stream``.
+    """
+    return f"session:{game_id}:event-stream"
+
+
+def _make_event_streams_key() -> str:
+    """
+    Construct the Redis key of the *sorted set* registering every session
+    event stream, scored by the time of its latest event, so stream
+    consumers can discover which streams to read.
+
+    Returns
+    -------
+    str
+        The key ``sessions:active-event-streams``.
     """
-    return f"session:{game_id}:events"
+    return "sessions:active-event-streams"
+
+
+def _make_session_outbox_key() -> str:
+    """
+    Construct the Redis key of the *stream* used as a durable outbox for
+    session rows that still have to be written to Postgres.
+
+    Returns
+    -------
+    str
+        The key ``outbox:session-rows``.
+    """
+    return "outbox:session-rows"
+
+
+def _make_event_stream_id(seq: int) -> str:
+    """
+    Return the explicit stream entry id used for the event with *seq*.
+
+    The sequence number is used as the id's first part (the second part is
+    fixed at ``1`` because ``0-0`` is not a valid id), so entries are ordered
+    by sequence and ``XRANGE`` can address them by ``seq`` directly.
+    """
+    return f"{seq}-1"
 
 
 def _make_session_sequencer_key(game_id: str) -> str:
@@ -102,23 +146,295 @@ async def set_session_state(
 async def push_session_event(
     *, redis_client: Redis, game_id: str, event: GameEvent
 ) -> None:
-    """Append a new game *event* to the Redis list that buffers session events.
+    """Append a new game *event* to the session's Redis event stream.
+
+    The entry id is derived from ``event.seq`` (see
+    :func:`_make_event_stream_id`) and the stream is capped with an
+    approximate ``MAXLEN`` so memory stays bounded. The stream is registered
+    in the stream registry with the current time, so that consumer groups
+    (e.g. the DB flusher) find it while it is active.
+    All commands run in a single ``MULTI``.
 
     Parameters
     ----------
-    pipe:
-        Async Redis pipeline used to stage the ``LPUSH`` command.
+    redis_client:
+        Async Redis client.
     game_id:
         Unique identifier of the game session.
     event:
         The :class:`~thirteen_backend.models.game_event_model.GameEvent` to
-        serialize and push onto the list.
+        serialize and append to the stream.
     """
+    async with redis_client.pipeline(transaction=True) as pipe:
+        _stage_session_event(pipe=pipe, game_id=game_id, event=event)
+        await pipe.execute()
+
+
+def _stage_session_event(*, pipe: Pipeline, game_id: str, event: GameEvent) -> None:
+    """Queue the commands of :func:`push_session_event` on *pipe*."""
     event_key = _make_session_event_key(game_id)
-    await redis_client.lpush(
+    pipe.xadd(
         event_key,
-        json.dumps(event.to_dict()),
+        {"event": json.dumps(event.to_dict())},
+        id=_make_event_stream_id(event.seq),
+        maxlen=config.EVENT_STREAM_MAXLEN,
+        approximate=True,
+    )
+    pipe.expire(event_key, 60 * 60 * 24)
+    pipe.zadd(_make_event_streams_key(), {event_key: time.time()})
+
+
+async def initialize_session(
+    *,
+    redis_client: Redis,
+    game_id: str,
+    game_state: Game,
+    init_event: GameEvent,
+    sequencer: int = 0,
+    outbox_rows: dict[str, Any] | None = None,
+) -> bool:
+    """Set up all Redis keys of a new session in a single round trip.
+
+    Stores the state, initialises the sequencer and pushes the *init_event*
+    inside one ``MULTI``, so a session is never left half-initialised. When
+    *outbox_rows* is given it is appended to the session outbox in the same
+    transaction, for the background writer to store in Postgres.
+
+    Returns
+    -------
+    bool
+        ``True`` if Redis acknowledged both ``SETEX`` commands.
+    """
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.setex(
+            name=_make_session_state_key(game_id),
+            time=60 * 60 * 24,
+            value=json.dumps(game_state.to_full_dict()),
+        )
+        pipe.setex(
+            name=_make_session_sequencer_key(game_id),
+            time=60 * 60 * 24,
+            value=sequencer,
+        )
+        _stage_session_event(pipe=pipe, game_id=game_id, event=init_event)
+        if outbox_rows is not None:
+            pipe.xadd(_make_session_outbox_key(), {"event": json.dumps(outbox_rows)})
+        state_ok, seq_ok, *_ = await pipe.execute()
+    return bool(state_ok and seq_ok)
+
+
+async def delete_session(*, redis_client: Redis, game_id: str) -> None:
+    """Remove every Redis key of a session – state, sequencer and event
+    stream – and unregister its stream, in a single ``MULTI``."""
+    event_key = _make_session_event_key(game_id)
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(
+            _make_session_state_key(game_id),
+            _make_session_sequencer_key(game_id),
+            event_key,
+        )
+        pipe.zrem(_make_event_streams_key(), event_key)
+        await pipe.execute()
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _decode_stream_entries(
+    entries: list[tuple[bytes | str, dict]],
+) -> list[tuple[str, dict[str, Any]]]:
+    decoded: list[tuple[str, dict[str, Any]]] = []
+    for entry_id, fields in entries:
+        raw = fields.get(b"event", fields.get("event"))
+        decoded.append((_decode(entry_id), json.loads(raw)))
+    return decoded
+
+
+async def iter_event_streams(
+    *, redis_client: Redis, since: float = 0, chunk_size: int = 100
+) -> AsyncIterator[list[str]]:
+    """Yield, in chunks of ``chunk_size``, the registered event stream keys
+    that received an event at or after *since* (a UNIX timestamp).
+
+    Chunks are paged by offset, so a stream that gets a new event meanwhile
+    may be missed by one scan – it is found by the next one.
+    """
+    offset = 0
+    while True:
+        keys = await redis_client.zrangebyscore(
+            _make_event_streams_key(), since, "+inf", start=offset, num=chunk_size
+        )
+        if keys:
+            yield [_decode(k) for k in keys]
+        if len(keys) < chunk_size:
+            return
+        offset += chunk_size
+
+
+async def iter_session_outbox(
+    *, redis_client: Redis, since: float = 0
+) -> AsyncIterator[list[str]]:
+    """Counterpart of :func:`iter_event_streams` for the session outbox."""
+    yield [_make_session_outbox_key()]
+
+
+async def count_event_streams(*, redis_client: Redis) -> int:
+    """Return how many session event streams are currently registered."""
+    return await redis_client.zcard(_make_event_streams_key())
+
+
+async def unregister_idle_event_streams(*, redis_client: Redis, before: float) -> int:
+    """Unregister the streams whose latest event is older than *before* (a
+    UNIX timestamp); a new event registers a stream again. Returns how many
+    were removed."""
+    return await redis_client.zremrangebyscore(
+        _make_event_streams_key(), "-inf", f"({before}"
+    )
+
+
+async def ensure_event_stream_group(
+    *,
+    redis_client: Redis,
+    group: str,
+    stream_keys: list[str],
+    mkstream: bool = False,
+) -> list[str]:
+    """Make sure consumer *group* exists on every stream in *stream_keys*.
+
+    Groups are created from id ``0`` so they see the full stream. Unless
+    *mkstream* is set, streams that no longer exist (expired sessions) are
+    unregistered and left out of the returned list of usable keys.
+    """
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key in stream_keys:
+            pipe.xgroup_create(key, group, id="0", mkstream=mkstream)
+        results = await pipe.execute(raise_on_error=False)
+
+    usable: list[str] = []
+    missing: list[str] = []
+    for key, result in zip(stream_keys, results):
+        if not isinstance(result, ResponseError) or "BUSYGROUP" in str(result):
+            usable.append(key)
+        else:  # "The XGROUP subcommand requires the key to exist"
+            missing.append(key)
+    if missing:
+        await redis_client.zrem(_make_event_streams_key(), *missing)
+    return usable
+
+
+async def read_event_stream_group(
+    *,
+    redis_client: Redis,
+    group: str,
+    consumer: str,
+    stream_keys: list[str],
+    count: int,
+) -> dict[str, list[tuple[str, dict[str, Any]]]]:
+    """Read up to *count* new entries per stream on behalf of *consumer*.
+
+    Returns a mapping of stream key to ``(entry_id, event)`` pairs. Entries
+    stay pending for the group until :func:`ack_event_stream` is called.
+    """
+    response = await redis_client.xreadgroup(
+        group, consumer, {key: ">" for key in stream_keys}, count=count
+    )
+    return {
+        _decode(key): _decode_stream_entries(entries)
+        for key, entries in response or []
+        if entries
+    }
+
+
+async def claim_stale_event_stream_entries(
+    *,
+    redis_client: Redis,
+    group: str,
+    consumer: str,
+    stream_keys: list[str],
+    min_idle_ms: int,
+    count: int,
+) -> dict[str, list[tuple[str, dict[str, Any]]]]:
+    """Take over entries another consumer read but never acknowledged
+    (e.g. because its worker crashed) once they are *min_idle_ms* old.
+
+    Up to *count* entries are claimed per stream, all streams in one round
+    trip. Returns a mapping of stream key to ``(entry_id, event)`` pairs.
+    """
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key in stream_keys:
+            pipe.xautoclaim(
+                key, group, consumer, min_idle_ms, start_id="0-0", count=count
+            )
+        results = await pipe.execute()
+    claimed: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+    for key, (_next_id, entries, *_deleted) in zip(stream_keys, results):
+        entries = [e for e in entries if e and e[1]]
+        if entries:
+            claimed[key] = _decode_stream_entries(entries)
+    return claimed
+
+
+async def ack_event_stream(
+    *,
+    redis_client: Redis,
+    group: str,
+    entry_ids: dict[str, list[str]],
+    delete: bool = False,
+) -> None:
+    """Acknowledge processed entries (stream key → entry ids) for *group*.
+
+    With *delete* the entries are also removed from their streams in the
+    same round trip – only safe when *group* is the streams' sole reader.
+    """
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for key, ids in entry_ids.items():
+            if ids:
+                pipe.xack(key, group, *ids)
+                if delete:
+                    pipe.xdel(key, *ids)
+        await pipe.execute()
+
+
+async def read_session_events_since(
+    *,
+    redis_client: Redis,
+    game_id: str,
+    last_seq: int,
+    count: int,
+) -> list[dict[str, Any]]:
+    """Return up to *count* buffered events of a session, starting **at**
+    ``last_seq`` (inclusive) in sequence order.
+
+    The event at ``last_seq`` itself is included so callers can tell whether
+    the stream still covers the requested range – if it was trimmed away the
+    first returned event has a larger ``seq``.
+    """
+    entries = await redis_client.xrange(
+        _make_session_event_key(game_id),
+        min=_make_event_stream_id(last_seq),
+        max="+",
+        count=count,
+    )
+    return [event for _, event in _decode_stream_entries(entries)]
+
+
+async def read_session_events_until(
+    *,
+    redis_client: Redis,
+    game_id: str,
+    seq: int,
+    count: int,
+) -> list[dict[str, Any]]:
+    """Return the (up to) *count* buffered events ending **at** ``seq``
+    (inclusive), oldest first."""
+    entries = await redis_client.xrevrange(
+        _make_session_event_key(game_id),
+        max=_make_event_stream_id(seq),
+        min="-",
+        count=count,
     )
+    return [event for _, event in reversed(_decode_stream_entries(entries))]
 
 
 async def increment_session_sequencer(
@@ -206,7 +522,7 @@ async def get_session_state(
 
     # The state is stored as a JSON string – decode and rebuild the Game.
     state_dict: dict = json.loads(raw_state)
-    return Game.from_state_dict(state_dict)
+    return Game.from_state_dict(state_dict, trusted=True)
 
 
 async def get_session_sequencer(
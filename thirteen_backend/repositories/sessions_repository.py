@@ -1,6 +1,14 @@
+import asyncio
 from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
 
-from thirteen_backend import metrics
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from thirteen_backend import config, metrics
 from thirteen_backend.context import APIRequestContext
 from thirteen_backend.domain.game import Game
 from thirteen_backend.errors import Error, ErrorCode
@@ -14,8 +22,12 @@ from thirteen_backend.repositories import (
     session_state_repository,
 )
 from thirteen_backend.services.bot.bot_handlers import play_bots_until_human
+from thirteen_backend.services.event_log import make_event_payload
 from thirteen_backend.types import GameConfig
 
+# PostgreSQL SQLSTATE of ``foreign_key_violation``
+FOREIGN_KEY_VIOLATION = "23503"
+
 
 async def create_game_session(
     *, context: APIRequestContext, cfg: GameConfig
@@ -28,15 +40,22 @@ async def create_game_session(
     object using the provided ``cfg`` – this yields the initial game state
     as well as four :class:`~thirteen_backend.domain.player.Player` domain
     objects (one human and three bots).
-    2. Persist a corresponding :class:`~thirteen_backend.models.game_session_model.GameSession`
-    row to the database marking the session *in-progress*.
-    3. Persist each player to the ``player`` table and link them to the game
-    via the ``game_player`` join table.
-    4. Cache the initial game state and initialise the per-session sequence
-    counter in Redis (both behind a single pipeline).
-    5. Emit an ``INIT`` :class:`~thirteen_backend.models.game_event_model.GameEvent`
-    (sequence ``0``) and push it onto the Redis event buffer.
-    6. Commit the SQL transaction and execute the Redis pipeline.
+    2. Build the ``INIT`` :class:`~thirteen_backend.models.game_event_model.GameEvent`
+    (sequence ``0``).
+    3. Concurrently:
+
+       * insert the :class:`~thirteen_backend.models.game_session_model.GameSession`
+         row (marked *in-progress*), every player and every ``game_players``
+         seat – one multi-row ``INSERT`` per table – and commit;
+       * cache the initial game state, initialise the per-session sequence
+         counter and push the ``INIT`` event in a single Redis ``MULTI``.
+
+    4. If Redis rejected the state the session row is marked *cancelled*;
+       if the insert failed the Redis keys are deleted again.
+
+    With ``SESSION_WRITE_MODE=outbox`` step 3 only touches Redis: the SQL
+    rows are appended to a durable outbox stream in the same ``MULTI`` and
+    written by :class:`~thirteen_backend.services.session_outbox_writer.SessionOutboxWriter`.
 
     Parameters
     ----------
@@ -55,84 +74,86 @@ async def create_game_session(
     init_game_state = Game(cfg=cfg)
     session_id = init_game_state.id
     init_sequence = 0
-    human_player_id: str = ""
+    human_player_id = next(p.id for p in init_game_state.players if not p.is_bot)
     ts = datetime.now(timezone.utc)
 
-    game_session = GameSession(
-        id=session_id,
-        status=GameStatus.IN_PROGRESS,
-        created_at=ts,
-        started_at=ts,
-        ended_at=None,
-        placements=None,
+    init_game_event = await game_event_repository.create_game_event(
+        game_id=session_id,
+        sequence=init_sequence,
+        turn=0,
+        event_type=GameEventType.INIT,
+        payload=make_event_payload(
+            engine=init_game_state, seq=init_sequence, action=None, checkpoint=True
+        ),
+        ts=ts,
     )
 
-    context.db_session.add(game_session)
+    session_rows = make_session_rows(game=init_game_state, ts=ts)
 
-    for player in init_game_state.players:
-        if player.is_bot:
-            name = f"BOT_{player.player_index}"
-        else:
-            name = "Human"
-            human_player_id = player.id
-
-        player_model = Player(
-            id=player.id,
-            name=name,
-            is_bot=player.is_bot,
+    if config.SESSION_WRITE_MODE == "outbox":
+        # Postgres is written by the background outbox writer; the session
+        # is playable as soon as Redis has it.
+        session_set_success = await session_state_repository.initialize_session(
+            redis_client=context.redis_client,
+            game_id=session_id,
+            game_state=init_game_state,
+            init_event=init_game_event,
+            sequencer=init_sequence,
+            outbox_rows=session_rows,
         )
-        game_player = GamePlayer(
-            game_id=game_session.id,
-            player_id=player_model.id,
-            seat_number=player.player_index,
+    else:
+        # The SQL rows and the Redis keys are independent – write both at once.
+        session_set_success, insert_error = await asyncio.gather(
+            session_state_repository.initialize_session(
+                redis_client=context.redis_client,
+                game_id=session_id,
+                game_state=init_game_state,
+                init_event=init_game_event,
+                sequencer=init_sequence,
+            ),
+            _insert_and_commit(db_session=context.db_session, rows=[session_rows]),
+            return_exceptions=True,
         )
-        context.db_session.add(player_model)
-        context.db_session.add(game_player)
-
-    await context.db_session.flush()
-
-    session_set_success = await session_state_repository.set_session_state(
-        redis_client=context.redis_client,
-        game_id=str(game_session.id),
-        game_state=init_game_state,
-    )
+        if isinstance(insert_error, BaseException):
+            # Without its row the session's events could never be stored –
+            # do not leave it playable in Redis.
+            LOGGER.error(
+                "Failed to insert session rows",
+                extra={"session_id": session_id},
+            )
+            await context.db_session.rollback()
+            await session_state_repository.delete_session(
+                redis_client=context.redis_client, game_id=session_id
+            )
+            raise insert_error
+        if isinstance(session_set_success, BaseException):
+            LOGGER.error(
+                "Redis rejected the new session",
+                exc_info=session_set_success,
+                extra={"session_id": session_id},
+            )
+            session_set_success = False
 
     if not session_set_success:
         LOGGER.error(
             "Failed to set session state",
             extra={"session_id": session_id},
         )
+        if config.SESSION_WRITE_MODE != "outbox":
+            await context.db_session.execute(
+                update(GameSession)
+                .where(GameSession.id == session_id)
+                .values(status=GameStatus.CANCELLED, ended_at=ts)
+            )
+            await context.db_session.commit()
         return Error(
             user_feedback="Failed to set session state",
             error_code=ErrorCode.INTERNAL_SERVER_ERROR,
         )
 
-    await session_state_repository.initialize_session_sequencer(
-        redis_client=context.redis_client,
-        game_id=str(game_session.id),
-        sequencer=init_sequence,
-    )
-
-    init_game_event = await game_event_repository.create_game_event(
-        game_id=game_session.id,
-        sequence=0,
-        turn=0,
-        event_type=GameEventType.INIT,
-        payload=init_game_state.to_full_dict(),
-        ts=ts,
-    )
-
     # Metrics – count INIT events
     metrics.increment_game_event(event_type=init_game_event.type)
 
-    await session_state_repository.push_session_event(
-        redis_client=context.redis_client,
-        game_id=str(game_session.id),
-        event=init_game_event,
-    )
-
-    await context.db_session.commit()
-
     if init_game_state.players[init_game_state.state.current_leader].is_bot:
 
         await play_bots_until_human(
@@ -144,3 +165,101 @@ async def create_game_session(
     metrics.increment_game_count()
 
     return {"session_id": session_id, "player_id": human_player_id}
+
+
+def make_session_rows(*, game: Game, ts: datetime) -> dict[str, Any]:
+    """Return the JSON-serialisable rows describing a new session: the
+    ``game_sessions`` row plus its ``players`` and ``game_players`` rows."""
+    return {
+        "game_session": {
+            "id": game.id,
+            "status": GameStatus.IN_PROGRESS,
+            "created_at": ts.isoformat(),
+            "started_at": ts.isoformat(),
+        },
+        "players": [
+            {
+                "id": player.id,
+                "name": f"BOT_{player.player_index}" if player.is_bot else "Human",
+                "is_bot": player.is_bot,
+            }
+            for player in game.players
+        ],
+        "game_players": [
+            {
+                "id": str(uuid4()),
+                "game_id": game.id,
+                "player_id": player.id,
+                "seat_number": player.player_index,
+            }
+            for player in game.players
+        ],
+    }
+
+
+async def insert_session_rows(
+    *, db_session: AsyncSession, rows: list[dict[str, Any]]
+) -> None:
+    """Insert the rows of one or more sessions (see :func:`make_session_rows`)
+    with a single multi-row ``INSERT`` per table.
+
+    Rows that already exist are skipped, so replaying an outbox entry is
+    harmless. The caller owns the transaction.
+    """
+    if not rows:
+        return
+    await db_session.execute(
+        insert(GameSession)
+        .values(
+            [
+                {
+                    **r["game_session"],
+                    "created_at": datetime.fromisoformat(
+                        r["game_session"]["created_at"]
+                    ),
+                    "started_at": datetime.fromisoformat(
+                        r["game_session"]["started_at"]
+                    ),
+                }
+                for r in rows
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+    await db_session.execute(
+        insert(Player)
+        .values([p for r in rows for p in r["players"]])
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+    await db_session.execute(
+        insert(GamePlayer)
+        .values([gp for r in rows for gp in r["game_players"]])
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+
+
+async def get_existing_session_ids(
+    *, db_session: AsyncSession, ids: set[UUID]
+) -> set[UUID]:
+    """Return the subset of *ids* that already have a ``game_sessions`` row."""
+    if not ids:
+        return set()
+    result = await db_session.scalars(
+        select(GameSession.id).where(GameSession.id.in_(ids))
+    )
+    return set(result)
+
+
+def is_missing_session_error(exc: IntegrityError) -> bool:
+    """Whether *exc* is a foreign-key violation, i.e. a row referencing a
+    session (or player) that is not in Postgres yet."""
+    orig = exc.orig
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return sqlstate == FOREIGN_KEY_VIOLATION
+
+
+async def _insert_and_commit(
+    *, db_session: AsyncSession, rows: list[dict[str, Any]]
+) -> None:
+    await insert_session_rows(db_session=db_session, rows=rows)
+    await db_session.commit()
@@ -1,14 +1,18 @@
+import asyncio
 from typing import Any
 
 from fastapi import WebSocket, WebSocketDisconnect
 from redis.asyncio import Redis
 
+from thirteen_backend.diagnostics.loop_monitor import session_task_name
 from thirteen_backend.exceptions import game_state_not_found
 from thirteen_backend.logger import LOGGER
+from thirteen_backend.models.game_event_model import GameEventType
 from thirteen_backend.repositories.session_state_repository import (
     get_session_sequencer,
     get_session_state,
 )
+from thirteen_backend.services.hints import hint_cache
 from thirteen_backend.services.websocket.websocket_handlers import (
     handle_pass,
     handle_ping,
@@ -32,10 +36,36 @@ async def serve(
     This helper centralises the session initialisation, message dispatch loop
     and cleanup logic so that the FastAPI *endpoint* remains a thin adapter.
     """
+    # Name the serving task after the session so blocked-loop reports can
+    # attribute stalls to it.
+    asyncio.current_task().set_name(session_task_name(session_id))
+
     # Register the connection and obtain the *per-connection* identifier that
     # the manager uses to address messages to a single socket within a session.
     conn_id = await websocket_manager.connect(session_id=session_id, ws=ws)
 
+    try:
+        await _serve_connection(
+            redis_client=redis_client,
+            ws=ws,
+            session_id=session_id,
+            player_id=player_id,
+            conn_id=conn_id,
+        )
+    finally:
+        # Every exit path – disconnect, invalid message, error – releases the
+        # connection's bookkeeping (and its per-session stats).
+        websocket_manager.disconnect(session_id=session_id, ws=ws)
+
+
+async def _serve_connection(
+    *,
+    redis_client: Redis,
+    ws: WebSocket,
+    session_id: str,
+    player_id: str,
+    conn_id: str,
+) -> None:
     # Fetch the current game state and per-session sequence counter so that we
     # can immediately bring the newly-connected client up-to-date.
     game_state = await get_session_state(redis_client=redis_client, game_id=session_id)
@@ -56,13 +86,18 @@ async def serve(
             session_id=session_id,
             seq=seq,
             game=game_state,
+            valid_plays=hint_cache.get_hints(
+                session_id=session_id, seq=seq, engine=game_state
+            ),
         ),
+        message_type=GameEventType.STATE_SYNC,
     )
 
     # Main receive → dispatch loop. Runs until the socket is closed.
     while True:
         try:
             incoming_message: dict[str, Any] = await ws.receive_json()
+            websocket_manager.record_received(session_id, incoming_message)
             msg_type = incoming_message.get("type")
 
             if msg_type == "PLAY":
@@ -70,6 +105,7 @@ async def serve(
                     redis_client=redis_client,
                     session_id=session_id,
                     player_id=player_id,
+                    conn_id=conn_id,
                     msg=incoming_message,
                 )
             elif msg_type == "PASS":
@@ -96,6 +132,7 @@ async def serve(
                     session_id=session_id,
                     player_id=player_id,
                     conn_id=conn_id,
+                    last_sequence=incoming_message.get("last_sequence"),
                 )
             else:
                 LOGGER.error(
@@ -106,7 +143,6 @@ async def serve(
                 await ws.close(code=1008, reason="Invalid message type")
                 break
         except WebSocketDisconnect:
-            websocket_manager.disconnect(session_id=session_id, ws=ws)
             break
         except (
             Exception
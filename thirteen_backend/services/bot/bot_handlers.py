@@ -1,11 +1,14 @@
 import asyncio
+import time
 
 from redis.asyncio import Redis
 
+from thirteen_backend import metrics
 from thirteen_backend.domain.classify import classify
 from thirteen_backend.domain.game import Game
 from thirteen_backend.logger import LOGGER
 from thirteen_backend.services.state_sync import persist_and_broadcast
+from thirteen_backend.tracing import TRACER
 from thirteen_backend.types import Play
 
 
@@ -29,35 +32,38 @@ async def play_bots_until_human(
         },
     )
     while True:
-        current_seat = engine.state.current_turn_order[
-            (engine.state.turn_number - 1)
-            % len(
-                engine.state.current_turn_order
-            )  # -1 because turn_number is 1-indexed
-        ]
+        current_seat = engine.state.get_current_seat()
         current_player = engine.players[current_seat]
 
         # --------------------------------------------------------------
         # Bot turn – either play or pass based on simple heuristic
         # --------------------------------------------------------------
         if current_player.is_bot:
-            bot_move = await _choose_bot_move(engine=engine, bot_idx=current_seat)
-            if not bot_move:
-                print("Bot decides to pass")
-                engine.apply_pass(player_idx=current_seat)
-                play = None
-            else:
-                print(f"Bot plays: {bot_move}")
-                engine.apply_play(player_idx=current_seat, play=bot_move)
-                play = bot_move
+            started_at = time.perf_counter()
+            with metrics.time_move_stage("decide", engine.id):
+                bot_move = await _choose_bot_move(engine=engine, bot_idx=current_seat)
+            hand_number = engine.state.hand_number
+            with metrics.time_move_stage("apply", engine.id):
+                if not bot_move:
+                    engine.apply_pass(player_idx=current_seat)
+                    play = None
+                else:
+                    engine.apply_play(player_idx=current_seat, play=bot_move)
+                    play = bot_move
 
             seq = await persist_and_broadcast(
                 redis_client=redis_client,
                 session_id=engine.id,
+                player_idx=current_seat,
                 play=play,
                 engine=engine,
+                hand_number=hand_number,
+            )
+            metrics.track_move_duration(
+                actor="bot",
+                session_id=engine.id,
+                duration=time.perf_counter() - started_at,
             )
-            print(f"next_seq: {seq}")
         # --------------------------------------------------------------
         # Human turn – return control only when the human **can act**
         # (i.e. they are *not* in the passed_players list). If they have
@@ -76,20 +82,22 @@ async def play_bots_until_human(
                     },
                 )
 
+                hand_number = engine.state.hand_number
                 engine.apply_pass(player_idx=human_idx)
 
                 seq = await persist_and_broadcast(
                     redis_client=redis_client,
                     session_id=engine.id,
+                    player_idx=human_idx,
                     play=None,
                     engine=engine,
+                    hand_number=hand_number,
                 )
 
                 # Continue the loop (bots may still have moves)
                 continue
 
             # Human can now act – break the loop and return
-            print("human", seq)
             return seq
 
         await asyncio.sleep(0.5)
@@ -97,18 +105,23 @@ async def play_bots_until_human(
 
 async def _choose_bot_move(*, engine: Game, bot_idx: int) -> Play:
     valid_plays = engine.rules.get_valid_plays(player_idx=bot_idx)
-    if not valid_plays:
-        return []
-
-    print(f"valid_plays: {valid_plays}")
-    weighted_plays = await _weigh_plays(valid_plays=valid_plays)
-    if not weighted_plays:
-        return []
-
-    print(f"weighted_plays: {weighted_plays}")
+    weighted_plays = await _weigh_plays(valid_plays=valid_plays) if valid_plays else []
+    best_play = weighted_plays[0] if weighted_plays else []
+
+    if TRACER.enabled:
+        TRACER.trace(
+            "bot.decision",
+            session_id=engine.id,
+            bot_idx=bot_idx,
+            valid_play_count=len(valid_plays or []),
+            weighted_plays=[
+                (p["play_type"], p["strength"], [c.image_code for c in p["cards"]])
+                for p in weighted_plays
+            ],
+            chosen=[c.image_code for c in best_play["cards"]] if best_play else None,
+        )
 
-    temp_best_play = weighted_plays[0]
-    return temp_best_play
+    return best_play
 
 
 async def _weigh_plays(
@@ -0,0 +1,101 @@
+"""Write-behind flusher: Redis event streams → ``game_events`` table.
+
+Gameplay only ever touches Redis. Every event is appended to the session's
+event stream and this background consumer group periodically drains the
+streams in batches with multi-row ``INSERT`` statements, so durable history
+never sits on the move latency path.
+
+Delivery is *at-least-once* (see
+:class:`~thirteen_backend.services.event_stream_consumer.EventStreamConsumer`);
+re-inserting an already stored event is a no-op thanks to the
+``(game_id, seq, ts)`` unique constraint. Events whose session row has not
+been written yet (``SESSION_WRITE_MODE=outbox``) are left pending and
+retried, until they are ``EVENT_DEFER_MAX_AGE_SECONDS`` old.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from redis.asyncio import Redis
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from thirteen_backend import config, metrics
+from thirteen_backend.logger import LOGGER
+from thirteen_backend.repositories import game_event_repository, sessions_repository
+from thirteen_backend.repositories.session_state_repository import (
+    count_event_streams,
+    unregister_idle_event_streams,
+)
+from thirteen_backend.services.event_stream_consumer import EventStreamConsumer
+
+
+class EventFlusher(EventStreamConsumer):
+    """Consumer group that writes buffered session events to Postgres."""
+
+    group = "db-flusher"
+
+    def __init__(
+        self,
+        *,
+        redis_client: Redis,
+        session_factory: Callable[[], AsyncSession],
+        batch_size: int = config.EVENT_FLUSH_BATCH_SIZE,
+        interval_seconds: float = config.EVENT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        super().__init__(
+            redis_client=redis_client,
+            batch_size=batch_size,
+            interval_seconds=interval_seconds,
+        )
+        self._session_factory = session_factory
+
+    async def consume_once(self) -> int:
+        # Sessions without events for EVENT_STREAM_ACTIVE_SECONDS are done
+        # (or abandoned); stop scanning their streams.
+        await unregister_idle_event_streams(
+            redis_client=self._redis,
+            before=time.time() - config.EVENT_STREAM_ACTIVE_SECONDS,
+        )
+        metrics.set_active_event_streams(
+            await count_event_streams(redis_client=self._redis)
+        )
+        return await super().consume_once()
+
+    async def handle(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        rows = [game_event_repository.game_event_row_from_dict(e) for e in events]
+        deferred: list[dict[str, Any]] = []
+        try:
+            await self._insert(rows)
+        except IntegrityError as exc:
+            if not sessions_repository.is_missing_session_error(exc):
+                raise
+            # A session row is not in Postgres yet (outbox mode, or the
+            # INIT event raced the session commit). Write the events whose
+            # session exists and retry the rest once they are reclaimed.
+            async with self._session_factory() as db_session:
+                known = await sessions_repository.get_existing_session_ids(
+                    db_session=db_session, ids={row["game_id"] for row in rows}
+                )
+            deferred = [e for e, r in zip(events, rows) if r["game_id"] not in known]
+            rows = [r for r in rows if r["game_id"] in known]
+            await self._insert(rows)
+            LOGGER.info("Deferred %s events of sessions not yet stored", len(deferred))
+            deferred = self.drop_expired(deferred)
+
+        now = datetime.now(timezone.utc)
+        metrics.track_events_flushed(
+            count=len(rows),
+            lags=[(now - row["ts"]).total_seconds() for row in rows],
+        )
+        return deferred
+
+    async def _insert(self, rows: list[dict[str, Any]]) -> None:
+        async with self._session_factory() as db_session:
+            for start in range(0, len(rows), self._batch_size):
+                await game_event_repository.bulk_insert_game_events(
+                    db_session=db_session,
+                    rows=rows[start : start + self._batch_size],
+                )
+            await db_session.commit()
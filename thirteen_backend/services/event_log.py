@@ -0,0 +1,124 @@
+"""Compact event payloads and state reconstruction from the event log.
+
+Events no longer embed a full copy of the game. Each PLAY/PASS payload holds
+only the move (``action``) and the hand it leaves the game in; a full
+``checkpoint`` snapshot is added every ``EVENT_CHECKPOINT_INTERVAL``
+sequence numbers, to the INIT event, and to any move that dealt a new hand
+(so a replay never has to span hands). The state at any ``seq`` is rebuilt by
+:func:`replay_events` from the nearest checkpoint at or before it, using the
+deterministic replay in :mod:`thirteen_backend.domain.replay`.
+
+Payload layout::
+
+    {
+        "hand_number": 1,
+        "action": {"seat": 2, "play_type": "pair", "cards": ["4D", "4S"]},
+        "checkpoint": {...},  # Game.to_full_dict(), checkpoint events only
+        "hand_summary": {...},  # GameState.to_hand_summary(), hand-ending moves only
+    }
+"""
+
+from typing import Any
+
+from redis.asyncio import Redis
+
+from thirteen_backend import config
+from thirteen_backend.domain.game import Game
+from thirteen_backend.domain.replay import replay_actions
+from thirteen_backend.repositories.session_state_repository import (
+    read_session_events_until,
+)
+from thirteen_backend.types import Play
+
+
+def make_action(*, player_idx: int, play: Play | None) -> dict[str, Any]:
+    """Describe a single move; ``cards``/``play_type`` are ``None`` for a pass."""
+    return {
+        "seat": player_idx,
+        "play_type": play["play_type"] if play else None,
+        "cards": [c.image_code for c in play["cards"]] if play else None,
+    }
+
+
+def is_checkpoint_seq(seq: int) -> bool:
+    return seq % config.EVENT_CHECKPOINT_INTERVAL == 0
+
+
+def make_event_payload(
+    *,
+    engine: Game,
+    seq: int,
+    action: dict[str, Any] | None,
+    checkpoint: bool = False,
+    hand_summary: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build the payload stored for the event at *seq* (see module docs).
+
+    *checkpoint* forces a snapshot, e.g. because the move dealt a new hand;
+    *hand_summary* is the result of the hand the move finished, if any.
+    """
+    payload: dict[str, Any] = {
+        "hand_number": engine.state.hand_number,
+        "action": action,
+    }
+    if checkpoint or is_checkpoint_seq(seq):
+        payload["checkpoint"] = engine.to_full_dict()
+    if hand_summary is not None:
+        payload["hand_summary"] = hand_summary
+    return payload
+
+
+def replay_events(events: list[dict[str, Any]], seq: int | None = None) -> Game:
+    """Rebuild the game as it was right after event *seq* (default: the last).
+
+    *events* are ``GameEvent.to_dict()`` mappings in sequence order; they
+    must include a checkpoint at or before *seq* and every event after it.
+
+    Raises
+    ------
+    ValueError
+        If there is no usable checkpoint, the log has a gap, or the replayed
+        state disagrees with the log.
+    """
+    if seq is not None:
+        events = [e for e in events if e["seq"] <= seq]
+    start = next(
+        (
+            idx
+            for idx in range(len(events) - 1, -1, -1)
+            if (events[idx]["payload"] or {}).get("checkpoint")
+        ),
+        None,
+    )
+    if start is None:
+        raise ValueError("No checkpoint found in the supplied events")
+    if seq is not None and events[-1]["seq"] != seq:
+        raise ValueError(f"Event {seq} is missing from the supplied events")
+
+    tail = events[start + 1 :]
+    for expected_seq, event in enumerate(tail, start=events[start]["seq"] + 1):
+        if event["seq"] != expected_seq:
+            raise ValueError(f"Gap in event log: expected seq {expected_seq}")
+
+    engine = replay_actions(
+        Game.from_state_dict(events[start]["payload"]["checkpoint"]),
+        (event["payload"]["action"] for event in tail),
+    )
+    if tail and engine.state.hand_number != tail[-1]["payload"]["hand_number"]:
+        raise ValueError("Replayed state diverged from the event log")
+    return engine
+
+
+async def load_game_from_events(*, redis_client: Redis, game_id: str, seq: int) -> Game:
+    """Rebuild a session's game at *seq* from its buffered event stream.
+
+    At most ``EVENT_CHECKPOINT_INTERVAL`` events are read since a checkpoint
+    is guaranteed at least that often.
+    """
+    events = await read_session_events_until(
+        redis_client=redis_client,
+        game_id=game_id,
+        seq=seq,
+        count=config.EVENT_CHECKPOINT_INTERVAL,
+    )
+    return replay_events(events, seq=seq)
@@ -0,0 +1,255 @@
+"""Base class for consumer-group readers of the per-session event streams.
+
+Every session appends its events to a Redis stream (see
+:func:`~thirteen_backend.repositories.session_state_repository.push_session_event`).
+Independent consumers – the Postgres flusher, analytics, … – each read those
+streams through their **own consumer group**, so every group sees every
+event exactly in sequence order without destructive pops, and several
+workers can share one group's load.
+
+Subclasses set :attr:`group` and implement :meth:`handle`. Entries are only
+acknowledged after ``handle`` returns (minus any it hands back for a later
+retry), and entries a crashed worker left pending are reclaimed after
+``EVENT_STREAM_RECLAIM_IDLE_SECONDS``, giving at-least-once delivery.
+Streams are discovered through the registry of recently active sessions, so
+an idle deployment costs a single range query per round, and each consumer
+creates its group on a stream only once. Consumers of a fixed stream (e.g.
+an outbox) override :meth:`iter_stream_keys`, and set :attr:`delete_acked`
+when they are its only reader so processed entries do not accumulate.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
+
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from thirteen_backend import config, metrics
+from thirteen_backend.logger import LOGGER
+from thirteen_backend.repositories.session_state_repository import (
+    ack_event_stream,
+    claim_stale_event_stream_entries,
+    ensure_event_stream_group,
+    iter_event_streams,
+    read_event_stream_group,
+)
+
+# Regular rounds re-scan streams active this long before the previous round,
+# covering events committed while it ran and clock skew between workers.
+_SCAN_OVERLAP_SECONDS = 5.0
+
+
+class EventStreamConsumer:
+    group: str = ""
+    # Create missing streams when creating the group (fixed, well-known keys)
+    create_streams: bool = False
+    # Delete entries once acknowledged (streams this group reads alone)
+    delete_acked: bool = False
+
+    def __init__(
+        self,
+        *,
+        redis_client: Redis,
+        batch_size: int = 500,
+        interval_seconds: float = 1.0,
+        reclaim_idle_seconds: float = config.EVENT_STREAM_RECLAIM_IDLE_SECONDS,
+        defer_max_age_seconds: float = config.EVENT_DEFER_MAX_AGE_SECONDS,
+    ) -> None:
+        if not self.group:
+            raise ValueError(f"{type(self).__name__} must define a consumer group")
+        self._redis = redis_client
+        self._batch_size = batch_size
+        self._interval = interval_seconds
+        self._reclaim_idle_ms = int(reclaim_idle_seconds * 1000)
+        self._defer_max_age = defer_max_age_seconds
+        self._last_reclaim = time.monotonic()
+        self._last_scan: float | None = None  # UNIX time of the last round
+        # Streams known to have this group, so it is created only once
+        self._grouped: set[str] = set()
+        # Streams that filled a whole batch – read again next round even
+        # without new events
+        self._backlog: set[str] = set()
+        # Stable per worker process; pending entries are tracked per consumer.
+        self.consumer = f"{self.group}-{os.getpid()}"
+        self._task: asyncio.Task | None = None
+
+    async def handle(self, events: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+        """Process a batch of decoded events.
+
+        Raise to leave the whole batch unacknowledged, or return the events
+        that could not be processed yet; those stay pending and are retried
+        once they are reclaimed.
+        """
+        raise NotImplementedError
+
+    def drop_expired(self, deferred: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the *deferred* events that are still worth retrying.
+
+        Events older than ``EVENT_DEFER_MAX_AGE_SECONDS`` are given up on
+        (logged, counted and acknowledged) so a session whose row never
+        arrives is not reclaimed forever.
+        """
+        now = datetime.now(timezone.utc)
+        keep: list[dict[str, Any]] = []
+        expired: list[dict[str, Any]] = []
+        for event in deferred:
+            age = (now - datetime.fromisoformat(event["ts"])).total_seconds()
+            (expired if age > self._defer_max_age else keep).append(event)
+        if expired:
+            LOGGER.error(
+                "%s dropped %s events of sessions missing from Postgres",
+                self.group,
+                len(expired),
+                extra={"game_ids": sorted({e["game_id"] for e in expired})},
+            )
+            metrics.increment_deferred_events_dropped(
+                group=self.group, count=len(expired)
+            )
+        return keep
+
+    def iter_stream_keys(self, since: float) -> AsyncIterator[list[str]]:
+        """Yield chunks of stream keys to read: by default the session event
+        streams with events at or after *since* (a UNIX timestamp)."""
+        return iter_event_streams(redis_client=self._redis, since=since)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.consumer)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        # Best-effort final drain so a clean shutdown leaves nothing behind.
+        try:
+            await self.consume_once()
+        except Exception as exc:
+            LOGGER.exception("Final %s drain failed: %s", self.group, exc)
+
+    async def _run(self) -> None:
+        while True:
+            consumed = 0
+            try:
+                consumed = await self.consume_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # keep the loop alive on transient errors
+                LOGGER.exception("%s consumer failed: %s", self.group, exc)
+            # A full batch means there is a backlog – go again immediately.
+            if consumed < self._batch_size:
+                await asyncio.sleep(self._interval)
+
+    # ------------------------------------------------------------------
+    # Consumption
+    # ------------------------------------------------------------------
+    async def consume_once(self) -> int:
+        """Read, handle and acknowledge one round of new entries.
+
+        Regular rounds only look at streams that received events since the
+        previous round; reclaim rounds scan every registered stream and
+        also take over entries left pending by crashed workers.
+        """
+        now = time.time()
+        reclaim = time.monotonic() - self._last_reclaim >= self._reclaim_idle_ms / 1000
+        since = (
+            0
+            if reclaim or self._last_scan is None
+            else self._last_scan - _SCAN_OVERLAP_SECONDS
+        )
+        seen: set[str] = set()
+        consumed = 0
+        async for stream_keys in self._iter_round(since=since):
+            seen.update(stream_keys)
+            stream_keys = await self._ensure_group(stream_keys)
+            if not stream_keys:
+                continue
+
+            try:
+                entries = await read_event_stream_group(
+                    redis_client=self._redis,
+                    group=self.group,
+                    consumer=self.consumer,
+                    stream_keys=stream_keys,
+                    count=self._batch_size,
+                )
+            except ResponseError as exc:
+                if "NOGROUP" not in str(exc):
+                    raise
+                # A stream disappeared after its group was created; check
+                # the chunk's groups (and unregister the stream) next round.
+                self._grouped.difference_update(stream_keys)
+                continue
+            self._backlog.update(
+                key for key, batch in entries.items() if len(batch) >= self._batch_size
+            )
+            if reclaim:
+                stale = await claim_stale_event_stream_entries(
+                    redis_client=self._redis,
+                    group=self.group,
+                    consumer=self.consumer,
+                    stream_keys=stream_keys,
+                    min_idle_ms=self._reclaim_idle_ms,
+                    count=self._batch_size,
+                )
+                for key, claimed in stale.items():
+                    entries.setdefault(key, [])[:0] = claimed
+
+            consumed += await self._handle_entries(entries)
+
+        self._last_scan = now
+        if reclaim:
+            self._grouped &= seen  # forget streams no longer registered
+            self._last_reclaim = time.monotonic()
+        return consumed
+
+    async def _iter_round(self, since: float) -> AsyncIterator[list[str]]:
+        backlog, self._backlog = sorted(self._backlog), set()
+        if backlog:
+            yield backlog
+        async for stream_keys in self.iter_stream_keys(since=since):
+            yield stream_keys
+
+    async def _ensure_group(self, stream_keys: list[str]) -> list[str]:
+        """Create the group on streams not seen before; returns the usable
+        keys."""
+        new = [key for key in stream_keys if key not in self._grouped]
+        if not new:
+            return stream_keys
+        usable = await ensure_event_stream_group(
+            redis_client=self._redis,
+            group=self.group,
+            stream_keys=new,
+            mkstream=self.create_streams,
+        )
+        self._grouped.update(usable)
+        missing = set(new).difference(usable)
+        return [key for key in stream_keys if key not in missing]
+
+    async def _handle_entries(
+        self, entries: dict[str, list[tuple[str, dict[str, Any]]]]
+    ) -> int:
+        events = [event for batch in entries.values() for _, event in batch]
+        if not events:
+            return 0
+        retry = {id(event) for event in await self.handle(events) or []}
+        await ack_event_stream(
+            redis_client=self._redis,
+            group=self.group,
+            entry_ids={
+                key: [entry_id for entry_id, event in batch if id(event) not in retry]
+                for key, batch in entries.items()
+            },
+            delete=self.delete_acked,
+        )
+        return len(events) - len(retry)
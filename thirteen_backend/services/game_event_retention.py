@@ -0,0 +1,89 @@
+"""Periodic maintenance of the partitioned ``game_events`` table.
+
+Every run (one worker at a time, under an advisory lock) makes sure the
+partitions for the current month and the next ``GAME_EVENT_PARTITIONS_AHEAD``
+months exist, and drops the partitions that are entirely older than
+``GAME_EVENT_RETENTION_MONTHS`` (``0`` keeps everything). Events for a month
+without a partition land in ``game_events_default``; creating the month's
+partition moves them into it, and default rows older than the retention
+window are deleted, since dropping partitions never reaches them. It runs at
+startup and then every ``GAME_EVENT_MAINTENANCE_INTERVAL_SECONDS``.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from thirteen_backend import config
+from thirteen_backend.logger import LOGGER
+from thirteen_backend.repositories import game_event_partition_repository as partitions
+
+
+class GameEventRetention:
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession],
+        retention_months: int = config.GAME_EVENT_RETENTION_MONTHS,
+        months_ahead: int = config.GAME_EVENT_PARTITIONS_AHEAD,
+        interval_seconds: float = config.GAME_EVENT_MAINTENANCE_INTERVAL_SECONDS,
+    ) -> None:
+        self._session_factory = session_factory
+        self._retention_months = retention_months
+        self._months_ahead = months_ahead
+        self._interval = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="game-event-retention")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # retry on the next tick
+                LOGGER.exception("game_events maintenance failed: %s", exc)
+            await asyncio.sleep(self._interval)
+
+    async def run_once(self, now: datetime | None = None) -> list[str]:
+        """Create upcoming partitions and drop expired ones; returns the
+        names of the dropped partitions."""
+        now = now or datetime.now(timezone.utc)
+        dropped: list[str] = []
+        async with self._session_factory() as db_session:
+            await partitions.lock_partition_maintenance(db_session=db_session)
+            await partitions.create_game_event_partitions(
+                db_session=db_session, start=now, months=self._months_ahead + 1
+            )
+            if self._retention_months > 0:
+                cutoff = partitions.add_months(
+                    partitions.month_start(now), -self._retention_months
+                )
+                dropped = await partitions.drop_game_event_partitions_before(
+                    db_session=db_session, cutoff=cutoff
+                )
+                await partitions.delete_default_partition_rows_before(
+                    db_session=db_session, cutoff=cutoff
+                )
+            await db_session.commit()
+        if dropped:
+            LOGGER.info(
+                "Dropped expired game_events partitions",
+                extra={"partitions": dropped},
+            )
+        return dropped
@@ -0,0 +1,80 @@
+"""Hand results: Redis event streams → ``game_hands`` / ``game_sessions``.
+
+The move that finishes a hand carries a compact ``hand_summary`` in its
+event payload (see :func:`~thirteen_backend.services.event_log.make_event_payload`).
+This consumer group picks those events out of the session streams and, per
+batch and in one transaction, inserts the ``game_hands`` rows and refreshes
+the placements of the affected sessions. Everything else is acknowledged
+without touching Postgres.
+
+Redelivered hands are skipped by the ``(game_id, hand_number)`` unique
+constraint and the session placements are recomputed from the stored hands,
+so at-least-once delivery is harmless.
+"""
+
+from typing import Any, Callable
+
+from redis.asyncio import Redis
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from thirteen_backend import config
+from thirteen_backend.logger import LOGGER
+from thirteen_backend.repositories import game_hand_repository, sessions_repository
+from thirteen_backend.services.event_stream_consumer import EventStreamConsumer
+
+
+class HandResultWriter(EventStreamConsumer):
+    """Consumer group that stores completed hands and session placements."""
+
+    group = "hand-writer"
+
+    def __init__(
+        self,
+        *,
+        redis_client: Redis,
+        session_factory: Callable[[], AsyncSession],
+        batch_size: int = config.EVENT_FLUSH_BATCH_SIZE,
+        interval_seconds: float = config.EVENT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        super().__init__(
+            redis_client=redis_client,
+            batch_size=batch_size,
+            interval_seconds=interval_seconds,
+        )
+        self._session_factory = session_factory
+
+    async def handle(self, events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        hands = [e for e in events if e["payload"].get("hand_summary")]
+        if not hands:
+            return []
+
+        rows = [game_hand_repository.game_hand_row_from_event(e) for e in hands]
+        deferred: list[dict[str, Any]] = []
+        try:
+            await self._write(rows)
+        except IntegrityError as exc:
+            if not sessions_repository.is_missing_session_error(exc):
+                raise
+            # The session row is not in Postgres yet (outbox mode) – store
+            # the hands of known sessions and retry the rest later.
+            async with self._session_factory() as db_session:
+                known = await sessions_repository.get_existing_session_ids(
+                    db_session=db_session, ids={row["game_id"] for row in rows}
+                )
+            deferred = [e for e, r in zip(hands, rows) if r["game_id"] not in known]
+            rows = [r for r in rows if r["game_id"] in known]
+            await self._write(rows)
+            LOGGER.info("Deferred %s hands of sessions not yet stored", len(deferred))
+            deferred = self.drop_expired(deferred)
+        return deferred
+
+    async def _write(self, rows: list[dict[str, Any]]) -> None:
+        async with self._session_factory() as db_session:
+            await game_hand_repository.bulk_insert_game_hands(
+                db_session=db_session, rows=rows
+            )
+            await game_hand_repository.refresh_session_placements(
+                db_session=db_session, game_ids={row["game_id"] for row in rows}
+            )
+            await db_session.commit()
@@ -0,0 +1,93 @@
+"""Legal-move hints for the human seat.
+
+The human's legal plays are pushed inside STATE_SYNC messages so clients
+never have to work them out (or guess and get an ERROR back). Hints are only
+computed when it is actually the human's turn, and the result is cached per
+session by sequence number so that reconnects and RESYNC requests for an
+unchanged state reuse it instead of calling ``Rules.get_valid_plays`` again.
+"""
+
+from collections import OrderedDict
+
+from thirteen_backend.domain.game import Game
+from thirteen_backend.types import Play
+
+# Compact wire format: ``[play_type, [card_code, ...]]`` where the card code is
+# the same ``card_url`` the client already receives for every card in hand.
+EncodedPlay = list[str | list[str]]
+
+
+def encode_plays(plays: list[Play]) -> list[EncodedPlay]:
+    """Encode *plays* as ``[["pair", ["4D", "4S"]], ...]``."""
+    return [
+        [play["play_type"], [c.image_code for c in play["cards"]]] for play in plays
+    ]
+
+
+def _human_seat(engine: Game) -> int | None:
+    for player in engine.players:
+        if not player.is_bot:
+            return player.player_index
+    return None
+
+
+class HintCache:
+    """Remembers the latest ``(seq, hints)`` pair for each session.
+
+    Only the most recent sequence per session is kept – older states can no
+    longer be acted upon – and the number of sessions is bounded so that
+    abandoned games are evicted in LRU order.
+    """
+
+    def __init__(self, max_sessions: int = 1024) -> None:
+        self._max_sessions = max_sessions
+        self._entries: OrderedDict[str, tuple[int, list[EncodedPlay] | None]] = (
+            OrderedDict()
+        )
+
+    def get_hints(
+        self, *, session_id: str, seq: int, engine: Game
+    ) -> list[EncodedPlay] | None:
+        """Return the human's legal plays for *seq*, or ``None`` if it is not
+        their turn (or they already passed on the current pile)."""
+        cached = self._entries.get(session_id)
+        if cached is not None and cached[0] == seq:
+            self._entries.move_to_end(session_id)
+            return cached[1]
+
+        hints = self._compute(engine=engine)
+        self._entries[session_id] = (seq, hints)
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self._max_sessions:
+            self._entries.popitem(last=False)
+        return hints
+
+    def lookup(
+        self, *, session_id: str, seq: int
+    ) -> tuple[bool, list[EncodedPlay] | None]:
+        """Return ``(hit, hints)`` for *seq* without computing anything, so
+        callers that have not loaded the engine can skip doing so on a hit."""
+        cached = self._entries.get(session_id)
+        if cached is None or cached[0] != seq:
+            return False, None
+        self._entries.move_to_end(session_id)
+        return True, cached[1]
+
+    def discard(self, session_id: str) -> None:
+        self._entries.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _compute(*, engine: Game) -> list[EncodedPlay] | None:
+        human_idx = _human_seat(engine)
+        if human_idx is None or engine.state.get_current_seat() != human_idx:
+            return None
+        if human_idx in engine.state.passed_players:
+            return None
+        return encode_plays(engine.rules.get_valid_plays(player_idx=human_idx) or [])
+
+
+# Singleton instance – importable everywhere
+hint_cache = HintCache()
@@ -0,0 +1,53 @@
+"""Background writer for the session outbox (``SESSION_WRITE_MODE=outbox``).
+
+``POST /sessions`` appends the new session's SQL rows to a Redis stream in
+the same ``MULTI`` that stores the game state, and returns without touching
+Postgres. This consumer group drains that outbox and writes the rows in
+batches; inserts skip rows that already exist, so redelivery is harmless.
+Written entries are deleted from the outbox as they are acknowledged.
+"""
+
+from typing import Any, AsyncIterator, Callable
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from thirteen_backend import config
+from thirteen_backend.repositories import sessions_repository
+from thirteen_backend.repositories.session_state_repository import (
+    iter_session_outbox,
+)
+from thirteen_backend.services.event_stream_consumer import EventStreamConsumer
+
+
+class SessionOutboxWriter(EventStreamConsumer):
+    """Consumer group that writes queued session rows to Postgres."""
+
+    group = "session-writer"
+    create_streams = True
+    delete_acked = True
+
+    def __init__(
+        self,
+        *,
+        redis_client: Redis,
+        session_factory: Callable[[], AsyncSession],
+        batch_size: int = config.EVENT_FLUSH_BATCH_SIZE,
+        interval_seconds: float = config.EVENT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        super().__init__(
+            redis_client=redis_client,
+            batch_size=batch_size,
+            interval_seconds=interval_seconds,
+        )
+        self._session_factory = session_factory
+
+    def iter_stream_keys(self, since: float) -> AsyncIterator[list[str]]:
+        return iter_session_outbox(redis_client=self._redis, since=since)
+
+    async def handle(self, events: list[dict[str, Any]]) -> None:
+        async with self._session_factory() as db_session:
+            await sessions_repository.insert_session_rows(
+                db_session=db_session, rows=events
+            )
+            await db_session.commit()
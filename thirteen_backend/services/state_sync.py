@@ -13,6 +13,8 @@ from thirteen_backend.repositories.session_state_repository import (
     push_session_event,
     set_session_state,
 )
+from thirteen_backend.services.event_log import make_action, make_event_payload
+from thirteen_backend.services.hints import hint_cache
 from thirteen_backend.services.websocket.websocket_manager import websocket_manager
 from thirteen_backend.services.websocket.websocket_utils import make_state_sync
 from thirteen_backend.types import Play
@@ -22,36 +24,51 @@ async def persist_and_broadcast(
     *,
     redis_client: Redis,
     session_id: str,
+    player_idx: int,
     play: Play | None,
     engine: Game,
+    hand_number: int,
 ) -> int:
-    # Bump the sequencer first so we know the *new* sequence
-    new_seq = await increment_session_sequencer(
-        redis_client=redis_client, game_id=session_id
-    )
+    """Record the move just applied to *engine* and broadcast the new state.
 
-    # Create the GameEvent using *new_seq*
-    event = await game_event_repository.create_game_event(
-        game_id=session_id,
-        sequence=new_seq,
-        turn=engine.state.turn_number,
-        event_type=GameEventType.PLAY if play else GameEventType.PASS,
-        payload=engine.state.to_full_dict(),
-    )
+    *hand_number* is the hand the move was made in; if the move finished it
+    (and a new hand was dealt) the event carries a checkpoint snapshot and
+    the finished hand's summary.
+    """
+    with metrics.time_move_stage("persist", session_id):
+        # Bump the sequencer first so we know the *new* sequence
+        new_seq = await increment_session_sequencer(
+            redis_client=redis_client, game_id=session_id
+        )
 
-    # Persist state + push event in parallel
-    set_ok, _ = await asyncio.gather(
-        set_session_state(
-            redis_client=redis_client,
+        # Create the GameEvent using *new_seq*
+        event = await game_event_repository.create_game_event(
             game_id=session_id,
-            game_state=engine,
-        ),
-        push_session_event(
-            redis_client=redis_client,
-            game_id=session_id,
-            event=event,
-        ),
-    )
+            sequence=new_seq,
+            turn=engine.state.turn_number,
+            event_type=GameEventType.PLAY if play else GameEventType.PASS,
+            payload=make_event_payload(
+                engine=engine,
+                seq=new_seq,
+                action=make_action(player_idx=player_idx, play=play),
+                checkpoint=engine.state.hand_number != hand_number,
+                hand_summary=engine.last_hand_summary,
+            ),
+        )
+
+        # Persist state + push event in parallel
+        set_ok, _ = await asyncio.gather(
+            set_session_state(
+                redis_client=redis_client,
+                game_id=session_id,
+                game_state=engine,
+            ),
+            push_session_event(
+                redis_client=redis_client,
+                game_id=session_id,
+                event=event,
+            ),
+        )
 
     if not set_ok:
         raise RuntimeError("Failed to save game state")
@@ -59,14 +76,22 @@ async def persist_and_broadcast(
     # Metrics
     metrics.increment_game_event(event_type=event.type)
 
+    with metrics.time_move_stage("hints", session_id):
+        valid_plays = hint_cache.get_hints(
+            session_id=session_id, seq=new_seq, engine=engine
+        )
+
     # Broadcast
-    await websocket_manager.broadcast(
-        session_id=session_id,
-        message=make_state_sync(
+    with metrics.time_move_stage("broadcast", session_id):
+        await websocket_manager.broadcast(
             session_id=session_id,
-            seq=new_seq,
-            game=engine,
-        ),
-    )
+            message=make_state_sync(
+                session_id=session_id,
+                seq=new_seq,
+                game=engine,
+                valid_plays=valid_plays,
+            ),
+            message_type=GameEventType.STATE_SYNC,
+        )
 
     return new_seq
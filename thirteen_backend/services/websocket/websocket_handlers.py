@@ -1,18 +1,30 @@
 import asyncio
+import time
 from typing import Any
 
 from redis.asyncio import Redis
 
+from thirteen_backend import config, metrics
+from thirteen_backend.domain.card import Card
 from thirteen_backend.domain.game import Game
+from thirteen_backend.domain.rules import InvalidPlayError
 from thirteen_backend.logger import LOGGER
+from thirteen_backend.models.game_event_model import GameEventType
 from thirteen_backend.repositories.session_state_repository import (
     get_session_sequencer,
     get_session_state,
+    read_session_events_since,
 )
 from thirteen_backend.services.bot.bot_handlers import play_bots_until_human
+from thirteen_backend.services.hints import hint_cache
 from thirteen_backend.services.state_sync import persist_and_broadcast
 from thirteen_backend.services.websocket.websocket_manager import websocket_manager
-from thirteen_backend.services.websocket.websocket_utils import make_state_sync
+from thirteen_backend.services.websocket.websocket_utils import (
+    make_error,
+    make_state_delta,
+    make_state_sync,
+    select_delta_events,
+)
 
 
 async def handle_play(
@@ -20,8 +32,10 @@ async def handle_play(
     redis_client: Redis,
     session_id: str,
     player_id: str,
+    conn_id: str,
     msg: dict[str, Any],
 ) -> None:
+    started_at = time.perf_counter()
     choices = msg["payload"]
     LOGGER.info(
         "Handling play for player %s",
@@ -34,16 +48,52 @@ async def handle_play(
     )
 
     engine, seq = await _load_engine(redis_client=redis_client, session_id=session_id)
+    player_idx = engine.state.get_player_idx_by_id(player_id=player_id)
 
-    # TODO: Add validation/removal logic for choices here
+    try:
+        with metrics.time_move_stage("decide", session_id):
+            if engine.state.get_current_seat() != player_idx:
+                raise InvalidPlayError("It is not this player's turn")
+            play = engine.rules.validate_play(
+                player_idx=player_idx, cards=_parse_cards(choices)
+            )
+    except InvalidPlayError as exc:
+        LOGGER.info(
+            "Rejected play for player %s: %s",
+            player_id,
+            exc,
+            extra={"session_id": session_id, "seq": seq},
+        )
+        await websocket_manager.send_to(
+            session_id=session_id,
+            conn_id=conn_id,
+            message=make_error(session_id=session_id, seq=seq, message=str(exc)),
+            message_type=GameEventType.ERROR,
+        )
+        return
 
-    engine.state.increment_turn_number()
+    hand_number = engine.state.hand_number
+    with metrics.time_move_stage("apply", session_id):
+        engine.apply_play(player_idx=player_idx, play=play)
 
-    await persist_and_broadcast(
+    seq = await persist_and_broadcast(
         redis_client=redis_client,
         session_id=session_id,
-        play=choices,
+        player_idx=player_idx,
+        play=play,
+        engine=engine,
+        hand_number=hand_number,
+    )
+    metrics.track_move_duration(
+        actor="human",
+        session_id=session_id,
+        duration=time.perf_counter() - started_at,
+    )
+
+    await play_bots_until_human(
+        redis_client=redis_client,
         engine=engine,
+        seq=seq,
     )
 
 
@@ -53,15 +103,26 @@ async def handle_pass(
     session_id: str,
     player_id: str,
 ) -> None:
+    started_at = time.perf_counter()
     engine, seq = await _load_engine(redis_client=redis_client, session_id=session_id)
+    player_idx = engine.state.get_player_idx_by_id(player_id=player_id)
 
-    engine.apply_pass(player_idx=engine.state.get_player_idx_by_id(player_id=player_id))
+    hand_number = engine.state.hand_number
+    with metrics.time_move_stage("apply", session_id):
+        engine.apply_pass(player_idx=player_idx)
 
     await persist_and_broadcast(
         redis_client=redis_client,
         session_id=session_id,
+        player_idx=player_idx,
         play=None,
         engine=engine,
+        hand_number=hand_number,
+    )
+    metrics.track_move_duration(
+        actor="human",
+        session_id=session_id,
+        duration=time.perf_counter() - started_at,
     )
 
     await play_bots_until_human(
@@ -97,28 +158,114 @@ async def handle_resync_request(
     session_id: str,
     player_id: str,
     conn_id: str,
+    last_sequence: int | None = None,
 ) -> None:
+    """Bring a client back up to date.
+
+    When the client reports the ``last_sequence`` it has applied and the
+    events it missed are still buffered in Redis, only those events are sent
+    (STATE_DELTA). Otherwise – unknown position, gap larger than
+    ``RESYNC_MAX_DELTA_EVENTS``, trimmed buffer or a new deal in between – a
+    full STATE_SYNC snapshot is sent.
+    """
     LOGGER.info(
         "Handling resync request",
-        extra={"session_id": session_id, "player_id": player_id, "conn_id": conn_id},
+        extra={
+            "session_id": session_id,
+            "player_id": player_id,
+            "conn_id": conn_id,
+            "last_sequence": last_sequence,
+        },
     )
 
-    game_state, seq = await asyncio.gather(
-        get_session_state(redis_client=redis_client, game_id=session_id),
-        get_session_sequencer(redis_client=redis_client, game_id=session_id),
-    )
-    if game_state is None or seq is None:
+    seq = await get_session_sequencer(redis_client=redis_client, game_id=session_id)
+    if seq is None:
         raise ValueError("Game state or sequencer not found")
 
-    await websocket_manager.send_to(
+    message = await _make_resync_delta(
+        redis_client=redis_client,
         session_id=session_id,
-        conn_id=conn_id,
-        message=make_state_sync(
+        seq=seq,
+        last_sequence=last_sequence,
+    )
+    message_type = GameEventType.STATE_DELTA
+    if message is None:
+        game_state = await get_session_state(
+            redis_client=redis_client, game_id=session_id
+        )
+        if game_state is None:
+            raise ValueError("Game state or sequencer not found")
+        message = make_state_sync(
             session_id=session_id,
             seq=seq,
             game=game_state,
+            valid_plays=hint_cache.get_hints(
+                session_id=session_id, seq=seq, engine=game_state
+            ),
+        )
+        message_type = GameEventType.STATE_SYNC
+
+    await websocket_manager.send_to(
+        session_id=session_id,
+        conn_id=conn_id,
+        message=message,
+        message_type=message_type,
+    )
+
+
+async def _make_resync_delta(
+    *,
+    redis_client: Redis,
+    session_id: str,
+    seq: int,
+    last_sequence: int | None,
+) -> str | None:
+    """Build the STATE_DELTA reply for a RESYNC, or ``None`` to fall back."""
+    if not isinstance(last_sequence, int) or isinstance(last_sequence, bool):
+        return None
+    if not 0 <= seq - last_sequence <= config.RESYNC_MAX_DELTA_EVENTS:
+        return None
+
+    events = select_delta_events(
+        events=await read_session_events_since(
+            redis_client=redis_client,
+            game_id=session_id,
+            last_seq=last_sequence,
+            count=seq - last_sequence + 1,
         ),
+        last_seq=last_sequence,
+        seq=seq,
     )
+    if events is None:
+        return None
+
+    hit, valid_plays = hint_cache.lookup(session_id=session_id, seq=seq)
+    if not hit:
+        game_state = await get_session_state(
+            redis_client=redis_client, game_id=session_id
+        )
+        if game_state is None:
+            return None
+        valid_plays = hint_cache.get_hints(
+            session_id=session_id, seq=seq, engine=game_state
+        )
+
+    return make_state_delta(
+        session_id=session_id,
+        seq=seq,
+        events=events,
+        valid_plays=valid_plays,
+    )
+
+
+def _parse_cards(raw_cards: Any) -> list[Card]:
+    """Decode the ``[{"suit": .., "rank": ..}, ...]`` PLAY payload."""
+    if not isinstance(raw_cards, list):
+        raise InvalidPlayError("PLAY payload must be a list of cards")
+    try:
+        return [Card(suit=c["suit"], rank=c["rank"]) for c in raw_cards]
+    except (KeyError, TypeError, ValueError) as exc:
+        raise InvalidPlayError(f"Malformed card in PLAY payload: {exc}") from exc
 
 
 async def _load_engine(
@@ -126,10 +273,11 @@ async def _load_engine(
     redis_client: Redis,
     session_id: str,
 ) -> tuple[Game, int]:
-    game_state, seq = await asyncio.gather(
-        get_session_state(redis_client=redis_client, game_id=session_id),
-        get_session_sequencer(redis_client=redis_client, game_id=session_id),
-    )
+    with metrics.time_move_stage("load", session_id):
+        game_state, seq = await asyncio.gather(
+            get_session_state(redis_client=redis_client, game_id=session_id),
+            get_session_sequencer(redis_client=redis_client, game_id=session_id),
+        )
     if game_state is None or seq is None:
         raise ValueError("Game state or sequencer not found")
     return game_state, seq
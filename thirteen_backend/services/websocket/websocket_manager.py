@@ -5,7 +5,9 @@ of the backend can simply call `websocket_manager.broadcast(session_id, msg)`.
 """
 
 import logging
+import time
 import uuid
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, Set
 
 from fastapi import WebSocket, WebSocketDisconnect
@@ -16,11 +18,23 @@ from thirteen_backend import metrics
 logger = logging.getLogger("websocket-manager")
 
 
+@dataclass(slots=True)
+class SessionStats:
+    """Per-session WebSocket counters, dropped with the last connection."""
+
+    connected_at: float
+    last_activity_at: float
+    connections: int = 0
+    messages_sent: int = 0
+    messages_received: int = 0
+
+
 class WebSocketManager:  # pylint: disable=too-few-public-methods
     """Keeps track of active sockets per session and provides broadcast."""
 
     def __init__(self) -> None:
         self._active: Dict[str, Dict[str, WebSocket]] = {}
+        self._stats: Dict[str, SessionStats] = {}
 
     # ------------------------------------------------------------------
     # Connection lifecycle
@@ -29,28 +43,66 @@ class WebSocketManager:  # pylint: disable=too-few-public-methods
         """Accept the WebSocket and register it under *session_id*."""
         await ws.accept()
         conn_id = self._connection_key(ws)
-        self._active.setdefault(session_id, {})[conn_id] = ws
-        # Metrics: increment active connections gauge
-        metrics.increment_ws_connections(session_id=session_id)
+        sockets = self._active.setdefault(session_id, {})
+        replaced = sockets.get(conn_id) is not None
+        sockets[conn_id] = ws
+        now = time.time()
+        stats = self._stats.setdefault(
+            session_id, SessionStats(connected_at=now, last_activity_at=now)
+        )
+        if not replaced:
+            stats.connections += 1
+            # Metrics: increment active connections gauge
+            metrics.increment_ws_connections()
         logger.info("WS connected: session=%s conn=%s", session_id, conn_id)
         return conn_id
 
     def disconnect(self, session_id: str, ws: WebSocket) -> None:
-        """Remove the socket from bookkeeping (does *not* close it)."""
+        """Remove the socket from bookkeeping (does *not* close it).
+
+        Safe to call more than once for the same socket.
+        """
         conn_id = self._connection_key(ws)
-        if session_id in self._active and conn_id in self._active[session_id]:
-            self._active[session_id].pop(conn_id, None)
-            if not self._active[session_id]:
-                del self._active[session_id]
+        if self._remove(session_id, conn_id):
+            logger.info("WS disconnected: session=%s conn=%s", session_id, conn_id)
+
+    def _remove(self, session_id: str, conn_id: str) -> bool:
+        sockets = self._active.get(session_id, {})
+        if sockets.pop(conn_id, None) is None:
+            return False
+        if not sockets:
+            del self._active[session_id]
+            self._stats.pop(session_id, None)
+        else:
+            self._stats[session_id].connections -= 1
         # Metrics: decrement active connections gauge
-        metrics.decrement_ws_connections(session_id=session_id)
-        logger.info("WS disconnected: session=%s conn=%s", session_id, conn_id)
+        metrics.decrement_ws_connections()
+        return True
+
+    def record_received(self, session_id: str, message: Any) -> None:
+        """Count a message received from a client of *session_id*."""
+        message_type = message.get("type") if isinstance(message, dict) else None
+        metrics.increment_ws_messages(direction="inbound", message_type=message_type)
+        stats = self._stats.get(session_id)
+        if stats is not None:
+            stats.messages_received += 1
+            stats.last_activity_at = time.time()
 
     # ------------------------------------------------------------------
     # Broadcast helpers
     # ------------------------------------------------------------------
-    async def broadcast(self, session_id: str, message: Any) -> None:
-        """Broadcast JSON-serialisable *message* to all sockets in a session."""
+    async def broadcast(
+        self,
+        session_id: str,
+        message: Any,
+        *,
+        message_type: str | None = None,
+    ) -> None:
+        """Broadcast JSON-serialisable *message* to all sockets in a session.
+
+        Pre-serialised messages should pass *message_type* so the metrics
+        can label them; dict messages fall back to their ``type`` key.
+        """
         if session_id not in self._active:
             return
         dead: Set[str] = set()
@@ -62,13 +114,11 @@ class WebSocketManager:  # pylint: disable=too-few-public-methods
                 else:
                     await ws.send_json(message)
                 # Metrics: count successfully delivered websocket messages
-                metrics.increment_ws_messages(
-                    session_id=session_id, direction="broadcast"
-                )
+                self._record_sent(session_id, "broadcast", message, message_type)
             except WebSocketDisconnect:
                 dead.add(conn_id)
         for conn_id in dead:
-            self._active[session_id].pop(conn_id, None)
+            self._remove(session_id, conn_id)
         if dead:
             logger.info(
                 "Cleaned %d dead sockets from session %s", len(dead), session_id
@@ -79,8 +129,13 @@ class WebSocketManager:  # pylint: disable=too-few-public-methods
         session_id: str,
         conn_id: str,
         message: Any,
+        *,
+        message_type: str | None = None,
     ) -> bool:
-        """Send *message* to one connection. Returns True if delivered."""
+        """Send *message* to one connection. Returns True if delivered.
+
+        *message_type* labels the metrics as in :meth:`broadcast`.
+        """
         ws = self._active.get(session_id, {}).get(conn_id)
         if ws is None:  # not found / already gone
             return False
@@ -90,7 +145,7 @@ class WebSocketManager:  # pylint: disable=too-few-public-methods
             else:
                 await ws.send_json(message)
             # Metrics: count successfully delivered websocket messages (direct)
-            metrics.increment_ws_messages(session_id=session_id, direction="direct")
+            self._record_sent(session_id, "direct", message, message_type)
             return True
         except WebSocketDisconnect:
             # cleanup & report failure
@@ -106,9 +161,29 @@ class WebSocketManager:  # pylint: disable=too-few-public-methods
     def connection_count(self, session_id: str) -> int:
         return len(self._active.get(session_id, {}))
 
+    def session_stats(self, session_id: str) -> dict[str, Any] | None:
+        """Return the counters of a connected session, or ``None``."""
+        stats = self._stats.get(session_id)
+        return asdict(stats) if stats is not None else None
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _record_sent(
+        self,
+        session_id: str,
+        direction: str,
+        message: Any,
+        message_type: str | None,
+    ) -> None:
+        if message_type is None and isinstance(message, dict):
+            message_type = message.get("type")
+        metrics.increment_ws_messages(direction=direction, message_type=message_type)
+        stats = self._stats.get(session_id)
+        if stats is not None:
+            stats.messages_sent += 1
+            stats.last_activity_at = time.time()
+
     @staticmethod
     def _connection_key(ws: WebSocket) -> str:
         if ws.client:
@@ -1,12 +1,24 @@
 import json
 from datetime import datetime, timezone
+from typing import Any
 
 from thirteen_backend.domain.game import Game
 from thirteen_backend.models.game_event_model import GameEventType
 
 
-def make_state_sync(*, session_id: str, seq: int, game: Game) -> str:
-    """Serialise STATE_SYNC message as JSON string."""
+def make_state_sync(
+    *,
+    session_id: str,
+    seq: int,
+    game: Game,
+    valid_plays: list[Any] | None = None,
+) -> str:
+    """Serialise STATE_SYNC message as JSON string.
+
+    *valid_plays* carries the human's encoded legal plays (see
+    :mod:`thirteen_backend.services.hints`) and is ``null`` when it is not
+    their turn.
+    """
     return json.dumps(
         {
             "type": GameEventType.STATE_SYNC,
@@ -15,5 +27,76 @@ def make_state_sync(*, session_id: str, seq: int, game: Game) -> str:
             "ts": datetime.now(timezone.utc).isoformat(),
             "session_id": session_id,
             "game_state": game.state.to_public_dict(),
+            "valid_plays": valid_plays,
+        }
+    )
+
+
+def select_delta_events(
+    *, events: list[dict[str, Any]], last_seq: int, seq: int
+) -> list[dict[str, Any]] | None:
+    """Pick the public part of the events a client at *last_seq* missed.
+
+    *events* are buffered events starting at ``last_seq`` (see
+    :func:`~thirteen_backend.repositories.session_state_repository.read_session_events_since`).
+    Returns ``None`` – meaning "send a full snapshot instead" – when the
+    buffer no longer covers the whole range, an event carries no action, or
+    a new hand was dealt in between (the client cannot derive the new deal).
+    """
+    if not events or events[0]["seq"] != last_seq:
+        return None
+    if events[-1]["seq"] != seq or len(events) != seq - last_seq + 1:
+        return None
+
+    hand_number = (events[0]["payload"] or {}).get("hand_number")
+    delta: list[dict[str, Any]] = []
+    for event in events[1:]:
+        payload = event["payload"] or {}
+        if "action" not in payload or payload.get("hand_number") != hand_number:
+            return None
+        delta.append(
+            {
+                "seq": event["seq"],
+                "turn": event["turn"],
+                "type": event["type"],
+                "action": payload["action"],
+            }
+        )
+    return delta
+
+
+def make_state_delta(
+    *,
+    session_id: str,
+    seq: int,
+    events: list[dict[str, Any]],
+    valid_plays: list[Any] | None = None,
+) -> str:
+    """Serialise a STATE_DELTA message – the moves a client missed – as JSON.
+
+    Clients apply *events* (see :func:`select_delta_events`) in order on top
+    of the state they already hold; ``seq`` is the sequence they end up at.
+    """
+    return json.dumps(
+        {
+            "type": GameEventType.STATE_DELTA,
+            "seq": seq,
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "session_id": session_id,
+            "events": events,
+            "valid_plays": valid_plays,
+        }
+    )
+
+
+def make_error(*, session_id: str, seq: int, message: str) -> str:
+    """Serialise an ERROR message (e.g. a rejected PLAY) as JSON string."""
+    return json.dumps(
+        {
+            "type": GameEventType.ERROR,
+            "seq": seq,
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "session_id": session_id,
+            "message": message,
         }
     )
@@ -0,0 +1,60 @@
+"""Opt-in tracing of engine and bot decisions.
+
+Call sites guard every trace with ``if TRACER.enabled:`` so that, while
+tracing is switched off (the default), the cost on the hot path is a single
+attribute check and no trace fields are ever built.
+
+Tracing can be enabled for a random sample of decisions
+(``TRACE_SAMPLE_RATE``, 0.0-1.0) and/or for specific sessions
+(``TRACE_SESSIONS`` – comma separated ids, or :meth:`Tracer.enable_session`
+at runtime). Records go through the regular application logger.
+"""
+
+import random
+from typing import Any, Iterable
+
+from thirteen_backend import config
+from thirteen_backend.logger import LOGGER
+
+
+class Tracer:
+    def __init__(self, sample_rate: float = 0.0, sessions: Iterable[str] = ()) -> None:
+        self.sample_rate = 0.0
+        self.sessions: set[str] = set()
+        self.enabled = False
+        self.configure(sample_rate=sample_rate, sessions=sessions)
+
+    def configure(self, *, sample_rate: float, sessions: Iterable[str]) -> None:
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.sessions = set(sessions)
+        self._refresh()
+
+    def enable_session(self, session_id: str) -> None:
+        self.sessions.add(session_id)
+        self._refresh()
+
+    def disable_session(self, session_id: str) -> None:
+        self.sessions.discard(session_id)
+        self._refresh()
+
+    def should_trace(self, session_id: str | None) -> bool:
+        if session_id is not None and session_id in self.sessions:
+            return True
+        return self.sample_rate > 0.0 and random.random() < self.sample_rate
+
+    def trace(self, event: str, *, session_id: str | None, **fields: Any) -> None:
+        """Emit *event* with *fields* if this session/decision is sampled."""
+        if not self.should_trace(session_id):
+            return
+        LOGGER.info(
+            "trace: %s",
+            event,
+            extra={"trace_event": event, "session_id": session_id, **fields},
+        )
+
+    def _refresh(self) -> None:
+        self.enabled = self.sample_rate > 0.0 or bool(self.sessions)
+
+
+# Singleton instance – importable everywhere
+TRACER = Tracer(sample_rate=config.TRACE_SAMPLE_RATE, sessions=config.TRACE_SESSIONS)
@@ -0,0 +1,20 @@
+"""
+JSON log formatter used by ``logging.conf``
+"""
+
+from typing import Any
+
+from pythonjsonlogger.json import JsonFormatter
+
+from thirteen_backend.utils.log_utils import LazyLogField
+
+
+class LazyJsonFormatter(JsonFormatter):
+    """``JsonFormatter`` that expands :class:`LazyLogField` values in place so
+    they are serialised as nested JSON rather than their ``str()``."""
+
+    def process_log_record(self, log_record: dict[str, Any]) -> dict[str, Any]:
+        for key, value in log_record.items():
+            if isinstance(value, LazyLogField):
+                log_record[key] = value.resolve()
+        return super().process_log_record(log_record)
@@ -0,0 +1,37 @@
+"""
+Helpers for cheap structured logging
+"""
+
+from typing import Any, Callable
+
+
+class LazyLogField:
+    """Defer building an expensive log value until a handler formats it.
+
+    Wrap the *factory* rather than its result when passing large values via
+    ``extra=`` (or as a ``%s`` argument): if the record is dropped by a level
+    check or filter the factory is never called, and if it is emitted the
+    value is built exactly once.
+    """
+
+    __slots__ = ("_factory", "_value", "_resolved")
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self._factory = factory
+        self._value: Any = None
+        self._resolved = False
+
+    def resolve(self) -> Any:
+        if not self._resolved:
+            self._value = self._factory()
+            self._resolved = True
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.resolve())
+
+    __repr__ = __str__
+
+
+def lazy(factory: Callable[[], Any]) -> LazyLogField:
+    return LazyLogField(factory)